@@ -1,45 +1,237 @@
+import time
+
+# --profile-startup: içe aktarmalar dahil açılış süresi buradan ölçülür
+IMPORT_STARTED = time.perf_counter()
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
+import tkinter.font as tkfont
 import sqlite3
-import random
-from datetime import datetime
+
+import deck
+import mistakes
+import search
+import srs
+import stats
+import word_store
+from answer_log import AnswerLog
+from db_worker import DBWorker, Cancelled
+from instrumentation import Instruments, format_table
+from quiz_engine import FlashcardSession, WritingSession, MultipleChoiceSession, MatchingSession
+from repository import WordRepository
+from similarity import SimilarityIndex
+from widgets import VirtualList
+
+# Cevap tamponunun diske yazılma aralığı
+FLUSH_INTERVAL_MS = 2000
+# Arama kutusunda yazma durduktan sonra sorguya kadar beklenen süre
+SEARCH_DELAY_MS = 150
+# Açılıştan etkileşime hazır ana menüye kadar izin verilen süre (--profile-startup)
+STARTUP_BUDGET_MS = 800
+# Zor modda birden çok setten en fazla bu kadar kelime örneklenir
+# (benzerlik indeksi kelimeleri bellekte ister)
+HARD_MODE_MAX_WORDS = 2000
+# İstatistik ekranındaki etkinlik grafiğinin gün sayısı
+CHART_DAYS = 30
+# İçe aktarmada silme onayı sorulurken listelenen en fazla set adı
+MAX_LISTED_SETS = 10
+
+# answer_events.mode -> ekranda gösterilen ad
+MODE_NAMES = {
+    "flashcard": "🎴 Flashcard",
+    "writing": "✍️ Yazma",
+    "multiple_choice": "📋 Çoktan Seçmeli",
+    "matching": "🔗 Eşleştirme",
+}
+
+# Flashcard yönü -> (ön yüz, arka yüz) dil etiketleri
+FLASHCARD_LANGS = {
+    "tr_to_en": ("🇹🇷 Türkçe", "🇬🇧 İngilizce"),
+    "en_to_tr": ("🇬🇧 İngilizce", "🇹🇷 Türkçe"),
+}
+
+# İsim -> (punto, stil)
+FONT_SPECS = {
+    "small": (10, None),
+    "small_italic": (10, "italic"),
+    "body": (11, None),
+    "body_italic": (11, "italic"),
+    "text": (12, None),
+    "text_bold": (12, "bold"),
+    "large": (14, None),
+    "large_bold": (14, "bold"),
+    "entry": (16, None),
+    "entry_bold": (16, "bold"),
+    "result": (18, "bold"),
+    "heading": (20, "bold"),
+    "title": (24, "bold"),
+    "word": (28, "bold"),
+    "card": (32, "bold"),
+}
+# Hizalı metinler (tanılama ekranı) için eş aralıklı font
+MONO_FONT = ("mono", "Courier", 10)
+
+
+class StartupProfile:
+    """Açılış aşamalarının süreleri; mark(ad) bir önceki işaretten bu yana geçen süreyi kaydeder"""
+    
+    def __init__(self, started=None):
+        self.started = started if started is not None else time.perf_counter()
+        self.last = self.started
+        self.phases = []
+    
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.last) * 1000))
+        self.last = now
+    
+    @property
+    def total_ms(self):
+        return (self.last - self.started) * 1000
+    
+    def format(self, budget_ms):
+        lines = [f"{name:<22}{ms:8.1f} ms" for name, ms in self.phases]
+        verdict = "✓" if self.total_ms <= budget_ms else "✗ bütçe aşıldı"
+        lines.append(f"{'toplam':<22}{self.total_ms:8.1f} ms (bütçe {budget_ms:.0f} ms) {verdict}")
+        return "\n".join(lines)
+
 
 class VocabApp:
-    def __init__(self, root):
+    def __init__(self, root, startup=None, instruments=None):
         self.root = root
+        self.startup = startup or StartupProfile()
+        # Ölçüm katmanı (--instrument); kapalıyken hiçbir şey sarılmaz
+        self.instruments = instruments or Instruments()
+        self.instruments.wrap_screens(self)
         self.root.title("Vocabulary APP")
         self.root.geometry("930x930")
         self.root.configure(bg="#f0f0f0")
-        
-        # Veritabanı bağlantısı
-        self.conn = sqlite3.connect('dictionary.db')
-        self.cursor = self.conn.cursor()
-        self.init_database()
+        self.init_fonts()
+        self.startup.mark("fontlar")
+        
+        # Veritabanı işleri arka plandaki worker'da, kendi bağlantısıyla çalışır.
+        # Bağlantı ilk sorguda açılır; ana menü veritabanını beklemez.
+        self.db = DBWorker(self.root, 'dictionary.db', instruments=self.instruments,
+                           on_notice=self.show_migration_notices)
+        # Set kelimeleri ve listesi worker'da önbellekten okunur; yazmalar da
+        # bu katmandan geçer ki önbellek geçersiz kılınsın
+        self.repo = WordRepository()
+        # İlerleme penceresi açık olan (iptal edilebilir) iş
+        self.active_job = None
+        
+        # Cevaplar tamponda birikir, toplu halde worker'da yazılır
+        self.answer_log = AnswerLog(hooks=[srs.apply_reviews, mistakes.apply_answers, stats.apply_answers],
+                                    on_full=self.flush_answers)
+        # Son flush başarısız oldu (hata zaten gösterildi)
+        self.flush_failing = False
+        self.root.after(FLUSH_INTERVAL_MS, self.schedule_flush)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Gizli tanılama ekranı
+        self.root.bind("<Control-Shift-D>", lambda event: self.show_diagnostics())
         
         self.current_set_id = None
+        # clear_window her çağrıldığında artar; eski ekrana ait sonuçlar atılır
+        self.screen = 0
+        self.startup.mark("uygulama durumu")
         self.show_main_menu()
+        self.startup.mark("ana menü")
     
-    def init_database(self):
-        # Kelime setleri tablosu
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS word_sets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                created_date TEXT
-            )
-        ''')
-        
-        # Kelimeler tablosu
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS words (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                set_id INTEGER,
-                turkish TEXT NOT NULL,
-                english TEXT NOT NULL,
-                FOREIGN KEY (set_id) REFERENCES word_sets (id) ON DELETE CASCADE
-            )
-        ''')
-        self.conn.commit()
+    def init_fonts(self):
+        """Tüm ekranların paylaştığı isimli fontlar"""
+        self.fonts = {}
+        for name, (size, style) in FONT_SPECS.items():
+            self.fonts[name] = tkfont.Font(self.root, name=name, family="Arial", size=size,
+                                           weight="bold" if style == "bold" else "normal",
+                                           slant="italic" if style == "italic" else "roman")
+        name, family, size = MONO_FONT
+        self.fonts[name] = tkfont.Font(self.root, name=name, family=family, size=size)
+    
+    def run_query(self, func, *args, on_done):
+        """func'ı worker'da çalıştırır; sonuç geldiğinde ekran değişmemişse on_done çağrılır"""
+        screen = self.screen
+        
+        def done(result):
+            if self.screen == screen:
+                on_done(result)
+        
+        return self.db.submit(func, *args, on_done=done, on_error=self.show_db_error)
+    
+    def attach_words(self, words):
+        """Sayfalı destenin önden okumalarını worker'a bağlar; liste olduğu gibi döner"""
+        if getattr(words, "shuffled", False):
+            words.attach(self.db, on_error=self.show_db_error)
+        return words
+    
+    def load_screen(self, text, func, *args, on_done):
+        """Sorgu sürerken pencere donmak yerine bekleme ekranı gösterir"""
+        self.clear_window()
+        tk.Label(self.root, text=f"⏳ {text}", font=self.fonts["large"],
+                bg="#f0f0f0", fg="#7f8c8d").pack(expand=True)
+        tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=20)
+        return self.run_query(func, *args, on_done=on_done)
+    
+    def run_with_progress(self, title, func, *args, describe, on_done, on_error=None):
+        """Uzun yazma işlemleri için ilerleme ve iptal penceresi.
+        describe(değer) -> (metin, 0-1 arası oran ya da None)"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("420x170")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: cancel())
+        
+        status_label = tk.Label(dialog, text="Başlatılıyor...", font=self.fonts["body"])
+        status_label.pack(pady=15)
+        bar = ttk.Progressbar(dialog, length=340, mode="indeterminate")
+        bar.pack(pady=5)
+        bar.start(15)
+        
+        def progress(value):
+            text, fraction = describe(value)
+            status_label.config(text=text)
+            if fraction is not None:
+                bar.stop()
+                bar.config(mode="determinate", value=fraction * 100)
+        
+        def finish(callback, value):
+            self.active_job = None
+            dialog.destroy()
+            callback(value)
+        
+        job = self.db.submit(func, *args,
+                             on_done=lambda result: finish(on_done, result),
+                             on_error=lambda exc: finish(on_error or self.show_db_error, exc),
+                             on_progress=progress)
+        self.active_job = job
+        
+        def cancel():
+            job.cancel()
+            cancel_btn.config(text="İptal ediliyor...", state="disabled")
+        
+        cancel_btn = tk.Button(dialog, text="İptal", command=cancel,
+                              font=self.fonts["body"], bg="#e74c3c", fg="white", width=15)
+        cancel_btn.pack(pady=15)
+        return job
+    
+    def show_db_error(self, exc):
+        if isinstance(exc, Cancelled):
+            return
+        messagebox.showerror("Veritabanı Hatası", str(exc))
+    
+    def show_migration_notices(self, notices):
+        """Veritabanı güncellenirken kullanıcının verisine dokunan değişiklikler (bir kez)"""
+        messagebox.showinfo("Veritabanı Güncellendi", "\n\n".join(notices))
+    
+    def show_save_error(self, exc):
+        if isinstance(exc, sqlite3.IntegrityError):
+            messagebox.showerror("Hata", "Bu isimde bir set zaten var ya da aynı İngilizce kelime iki kez girildi!")
+        else:
+            self.show_db_error(exc)
     
     def clear_window(self):
         # Remove any global key bindings set by specific screens (e.g., flashcard)
@@ -51,6 +243,7 @@ class VocabApp:
             # If unbind isn't available for some reason, ignore and continue
             pass
 
+        self.screen += 1
         for widget in self.root.winfo_children():
             widget.destroy()
     
@@ -63,7 +256,7 @@ class VocabApp:
         title_frame.pack_propagate(False)
         
         tk.Label(title_frame, text="Vocabulary APP", 
-                font=("Arial", 24, "bold"), bg="#2c3e50", fg="white").pack(expand=True)
+                font=self.fonts["title"], bg="#2c3e50", fg="white").pack(expand=True)
         
         # Ana menü frame
         menu_frame = tk.Frame(self.root, bg="#f0f0f0")
@@ -73,14 +266,17 @@ class VocabApp:
             ("📝 Yeni Kelime Seti Ekleme", self.show_add_set_screen),
             ("🎴 Flashcard ile Öğren", self.show_flashcard_menu),
             ("✍️ Yazarak Pratik Yapma", self.show_writing_practice),
-            ("📋 Çoktan Seçmeli Test", self.show_multiple_choice),
+            ("📋 Çoktan Seçmeli Test", self.show_multiple_choice_menu),
             ("🔗 Eşleştirme Testi", self.show_matching_test),
-            ("📚 Kelime Setleri", self.show_word_sets)
+            ("❗ En Çok Yanlış Yapılanlar", self.start_most_missed),
+            ("📚 Kelime Setleri", self.show_word_sets),
+            ("📊 İstatistikler", self.show_statistics),
+            ("🔍 Kelime Ara", self.show_search)
         ]
         
         for text, command in buttons:
             btn = tk.Button(menu_frame, text=text, command=command,
-                          font=("Arial", 14), width=30, height=2,
+                          font=self.fonts["large"], width=30, height=2,
                           bg="#3498db", fg="white", cursor="hand2",
                           relief=tk.RAISED, bd=3)
             btn.pack(pady=10)
@@ -92,10 +288,10 @@ class VocabApp:
         self.clear_window()
 
         tk.Label(self.root, text="Flashcard ile Öğren", 
-                font=("Arial", 20, "bold"), bg="#f0f0f0").pack(pady=20)
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
         
         tk.Label(self.root, text="Hangi yönde çalışmak istersiniz?", 
-                font=("Arial", 12), bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
+                font=self.fonts["text"], bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
         
         menu_frame = tk.Frame(self.root, bg="#f0f0f0")
         menu_frame.pack(expand=True, pady=30)
@@ -103,12 +299,13 @@ class VocabApp:
         buttons = [
             ("🇹🇷 → 🇬🇧 Türkçe'den İngilizce'ye", lambda: self.start_flashcard("tr_to_en")),
             ("🇬🇧 → 🇹🇷 İngilizce'den Türkçe'ye", lambda: self.start_flashcard("en_to_tr")),
-            ("🔀 Karışık Mod", lambda: self.start_flashcard("mixed"))
+            ("🔀 Karışık Mod", lambda: self.start_flashcard("mixed")),
+            ("🔁 Tekrar Zamanı Gelenler", self.start_review)
         ]
         
         for text, command in buttons:
             btn = tk.Button(menu_frame, text=text, command=command,
-                          font=("Arial", 14), width=35, height=2,
+                          font=self.fonts["large"], width=35, height=2,
                           bg="#9b59b6", fg="white", cursor="hand2",
                           relief=tk.RAISED, bd=3)
             btn.pack(pady=10)
@@ -117,23 +314,42 @@ class VocabApp:
        
 
         tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
-                 font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(pady=20)
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=20)
     
     def start_flashcard(self, mode):
         """Flashcard çalışmasını başlat"""
-        set_id = self.select_set_for_practice("flashcard")
-        if not set_id:
-            return
+        def start(set_ids, limit):
+            self.load_screen("Kartlar yükleniyor...", self.repo.practice_sets, set_ids, False, limit,
+                             on_done=lambda words: self.show_flashcard(
+                                 FlashcardSession(self.attach_words(words), mode,
+                                                  listener=self.answer_log.record)))
         
-        self.cursor.execute('SELECT id, turkish, english FROM words WHERE set_id = ?', (set_id,))
-        words = self.cursor.fetchall()
-        random.shuffle(words)
+        self.select_set_for_practice("flashcard", start)
+    
+    def start_review(self):
+        """Aralıklı tekrar: yalnızca zamanı gelen kartlarla flashcard"""
+        def loaded(words):
+            if not words:
+                messagebox.showinfo("Tekrar", "Seçilen setlerde şu an tekrar zamanı gelen kart yok! 🎉")
+                self.show_flashcard_menu()
+                return
+            self.show_flashcard(FlashcardSession(words, "mixed", listener=self.answer_log.record))
+        
+        def due_words(conn, set_ids, limit):
+            if limit:
+                return srs.due_words_for_sets(conn, set_ids, limit=limit)
+            return srs.due_words_for_sets(conn, set_ids)
+        
+        def selected(set_ids, limit):
+            # Bekleyen cevaplar zamanlamaya işlensin (worker işleri sırayla çalışır)
+            self.flush_answers()
+            self.load_screen("Kartlar yükleniyor...", due_words, set_ids, limit, on_done=loaded)
         
-        self.show_flashcard(words, mode)
+        self.select_set_for_practice("flashcard", selected)
     
-    def show_flashcard(self, words, mode):
+    def show_flashcard(self, session):
         """Flashcard ekranı"""
-        if not words:
+        if not len(session):
             messagebox.showinfo("Tamamlandı", "Tüm kartları gözden geçirdiniz!")
             # No cards to show — return to main menu. No need to touch any
             # local counters here because they are created per-session.
@@ -142,131 +358,124 @@ class VocabApp:
         
         self.clear_window()
         
-        current_index = [0]
         is_flipped = [False]
         
+        # Ekran oturum başında bir kez kurulur; kartlar arasında yalnızca
+        # metinler, renkler ve buton durumları değişir.
+        
+        # Başlık ve ilerleme
+        header_frame = tk.Frame(self.root, bg="#f0f0f0")
+        header_frame.pack(pady=20)
+        
+        tk.Label(header_frame, text="🎴 Flashcard Çalışması", 
+                font=self.fonts["heading"], bg="#f0f0f0", fg="#9b59b6").pack()
+        
+        progress_label = tk.Label(header_frame, font=self.fonts["text"], bg="#f0f0f0", fg="#7f8c8d")
+        progress_label.pack(pady=5)
+        
+        # Kart frame
+        card_frame = tk.Frame(self.root, bg="white", relief=tk.RAISED, bd=5,
+                             width=500, height=300)
+        card_frame.pack(pady=30, padx=50)
+        card_frame.pack_propagate(False)
+        
+        # Dil etiketi
+        lang_label = tk.Label(card_frame, font=self.fonts["body_italic"], bg="white", fg="#7f8c8d")
+        lang_label.pack(pady=15)
+        
+        # Kelime metni
+        word_label = tk.Label(card_frame, font=self.fonts["card"], bg="white", fg="#2c3e50",
+                             wraplength=450)
+        word_label.pack(expand=True)
+        
+        # Çevir ipucu
+        hint_label = tk.Label(card_frame, font=self.fonts["small_italic"], bg="white", fg="#95a5a6")
+        hint_label.pack(pady=10)
+        
+        # Alt butonlar
+        button_frame = tk.Frame(self.root, bg="#f0f0f0")
+        button_frame.pack(pady=20)
         
         def display_card():
-            
-            if current_index[0] >= len(words):
+            card = session.next_item()
+            if card is None:
+                self.flush_answers()
                 messagebox.showinfo("Tebrikler!", 
-                    f"Tüm {len(words)} kelimeyi gözden geçirdiniz!\n\n"
+                    f"Tüm {len(session)} kelimeyi gözden geçirdiniz!\n\n"
                     "Öğrenmeye devam edin! 💪")
                 
                 self.show_main_menu()
                 return 
             
-            word_id, turkish, english = words[current_index[0]]
             is_flipped[0] = False
-            
-            # Modu belirle (karışık modda rastgele seç)
-            if mode == "mixed":
-                current_mode = random.choice(["tr_to_en", "en_to_tr"])
-            else:
-                current_mode = mode
-            
-            # Gösterilecek kelimeleri belirle
-            if current_mode == "tr_to_en":
-                front_text = turkish
-                back_text = english
-                front_lang = "🇹🇷 Türkçe"
-                back_lang = "🇬🇧 İngilizce"
-            else:
-                front_text = english
-                back_text = turkish
-                front_lang = "🇬🇧 İngilizce"
-                back_lang = "🇹🇷 Türkçe"
-            
-            # Başlık ve ilerleme
-            header_frame = tk.Frame(self.root, bg="#f0f0f0")
-            header_frame.pack(pady=20)
-            
-            tk.Label(header_frame, text="🎴 Flashcard Çalışması", 
-                    font=("Arial", 20, "bold"), bg="#f0f0f0", fg="#9b59b6").pack()
-            
-            tk.Label(header_frame, text=f"Kart {current_index[0] + 1} / {len(words)}", 
-                    font=("Arial", 12), bg="#f0f0f0", fg="#7f8c8d").pack(pady=5)
-            
-            # Kart frame
-            card_frame = tk.Frame(self.root, bg="white", relief=tk.RAISED, bd=5,
-                                 width=500, height=300)
-            card_frame.pack(pady=30, padx=50)
-            card_frame.pack_propagate(False)
-            
-            # Dil etiketi
-            lang_label = tk.Label(card_frame, text=front_lang, 
-                                 font=("Arial", 11, "italic"), bg="white", fg="#7f8c8d")
-            lang_label.pack(pady=15)
-            
-            # Kelime metni
-            word_label = tk.Label(card_frame, text=front_text, 
-                                 font=("Arial", 32, "bold"), bg="white", fg="#2c3e50",
-                                 wraplength=450)
-            word_label.pack(expand=True)
-            
-            # Çevir ipucu
-            hint_label = tk.Label(card_frame, text="↓ Kartı çevirmek için tıklayın ↓", 
-                                 font=("Arial", 10, "italic"), bg="white", fg="#95a5a6")
-            hint_label.pack(pady=10)
-            
-            def flip_card(event=None):
-                if not is_flipped[0]:
-                    # Kartı çevir
-                    lang_label.config(text=back_lang)
-                    word_label.config(text=back_text, fg="#27ae60")
-                    hint_label.config(text="")
-                    is_flipped[0] = True
-                    
-                    # Butonları aktif et
-                    for btn in button_frame.winfo_children():
-                        btn.config(state="normal")
-            
-            # Karta tıklama
-            card_frame.bind("<Button-1>", flip_card)
-            for widget in card_frame.winfo_children():
-                widget.bind("<Button-1>", flip_card)
-            
-            # Alt butonlar
-            button_frame = tk.Frame(self.root, bg="#f0f0f0")
-            button_frame.pack(pady=20)
-            
-            def next_card():
-                current_index[0] += 1
-                self.clear_window()
-                display_card()
-            
-            def know_it():
-                messagebox.showinfo("Harika! 🎉", "Kelimenizi biliyorsunuz, mükemmel!")
-                next_card()
-            
-            def dont_know():
-                messagebox.showinfo("Sorun Değil 💪", 
-                    f"Kelimenizi öğrendiniz:\n\n{turkish} = {english}\n\nTekrar ederek öğreneceksiniz!")
-                next_card()
-            
-            # Butonlar (başlangıçta devre dışı)
-            btn_know = tk.Button(button_frame, text="✅ Biliyorum", command=know_it,
-                               font=("Arial", 12, "bold"), bg="#27ae60", fg="white", 
-                               width=15, height=2, state="disabled")
-            btn_know.pack(side=tk.LEFT, padx=10)
-            
-            btn_dont_know = tk.Button(button_frame, text="❌ Bilmiyorum", command=dont_know,
-                                     font=("Arial", 12, "bold"), bg="#e74c3c", fg="white", 
-                                     width=15, height=2, state="disabled")
-            btn_dont_know.pack(side=tk.LEFT, padx=10)
-            
-            btn_skip = tk.Button(button_frame, text="⏭️ Atla", command=next_card,
-                               font=("Arial", 12), bg="#95a5a6", fg="white", 
-                               width=12, height=2)
-            btn_skip.pack(side=tk.LEFT, padx=10)
-            
-            # Çıkış butonu
-            tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
-                     font=("Arial", 11), bg="#34495e", fg="white", width=15).pack(pady=10)
-            
-            # Klavye kısayolları
-            self.root.bind("<space>", flip_card)
-            self.root.bind("<Return>", lambda e: next_card() if is_flipped[0] else flip_card())
+            front_lang, _ = FLASHCARD_LANGS[card.direction]
+            
+            progress_label.config(text=f"Kart {session.position} / {len(session)}")
+            lang_label.config(text=front_lang)
+            word_label.config(text=card.front_text, fg="#2c3e50")
+            hint_label.config(text="↓ Kartı çevirmek için tıklayın ↓")
+            btn_know.config(state="disabled")
+            btn_dont_know.config(state="disabled")
+        
+        display_card = self.instruments.transition("flashcard", display_card)
+        
+        def flip_card(event=None):
+            if not is_flipped[0]:
+                card = session.current
+                _, back_lang = FLASHCARD_LANGS[card.direction]
+                # Kartı çevir
+                lang_label.config(text=back_lang)
+                word_label.config(text=card.back_text, fg="#27ae60")
+                hint_label.config(text="")
+                is_flipped[0] = True
+                
+                # Butonları aktif et
+                btn_know.config(state="normal")
+                btn_dont_know.config(state="normal")
+        
+        # Karta tıklama
+        card_frame.bind("<Button-1>", flip_card)
+        for widget in card_frame.winfo_children():
+            widget.bind("<Button-1>", flip_card)
+        
+        def next_card():
+            display_card()
+        
+        def know_it():
+            session.submit(True)
+            messagebox.showinfo("Harika! 🎉", "Kelimenizi biliyorsunuz, mükemmel!")
+            next_card()
+        
+        def dont_know():
+            card = session.current
+            session.submit(False)
+            messagebox.showinfo("Sorun Değil 💪", 
+                f"Kelimenizi öğrendiniz:\n\n{card.turkish} = {card.english}\n\nTekrar ederek öğreneceksiniz!")
+            next_card()
+        
+        # Butonlar (başlangıçta devre dışı)
+        btn_know = tk.Button(button_frame, text="✅ Biliyorum", command=know_it,
+                           font=self.fonts["text_bold"], bg="#27ae60", fg="white", 
+                           width=15, height=2, state="disabled")
+        btn_know.pack(side=tk.LEFT, padx=10)
+        
+        btn_dont_know = tk.Button(button_frame, text="❌ Bilmiyorum", command=dont_know,
+                                 font=self.fonts["text_bold"], bg="#e74c3c", fg="white", 
+                                 width=15, height=2, state="disabled")
+        btn_dont_know.pack(side=tk.LEFT, padx=10)
+        
+        btn_skip = tk.Button(button_frame, text="⏭️ Atla", command=next_card,
+                           font=self.fonts["text"], bg="#95a5a6", fg="white", 
+                           width=12, height=2)
+        btn_skip.pack(side=tk.LEFT, padx=10)
+        
+        # Çıkış butonu
+        tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
+                 font=self.fonts["body"], bg="#34495e", fg="white", width=15).pack(pady=10)
+        
+        # Klavye kısayolları
+        self.root.bind("<space>", flip_card)
+        self.root.bind("<Return>", lambda e: next_card() if is_flipped[0] else flip_card())
         
         display_card()
     
@@ -275,13 +484,13 @@ class VocabApp:
         
         # Başlık
         tk.Label(self.root, text="Yeni Kelime Seti Oluştur", 
-                font=("Arial", 20, "bold"), bg="#f0f0f0").pack(pady=20)
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
         
         # Set adı
         name_frame = tk.Frame(self.root, bg="#f0f0f0")
         name_frame.pack(pady=10)
-        tk.Label(name_frame, text="Set Adı:", font=("Arial", 12), bg="#f0f0f0").pack(side=tk.LEFT, padx=5)
-        set_name_entry = tk.Entry(name_frame, font=("Arial", 12), width=30)
+        tk.Label(name_frame, text="Set Adı:", font=self.fonts["text"], bg="#f0f0f0").pack(side=tk.LEFT, padx=5)
+        set_name_entry = tk.Entry(name_frame, font=self.fonts["text"], width=30)
         set_name_entry.pack(side=tk.LEFT)
         
         # Kelime listesi frame
@@ -291,55 +500,26 @@ class VocabApp:
         # Başlıklar
         header_frame = tk.Frame(list_frame, bg="#ecf0f1")
         header_frame.pack(fill=tk.X)
-        tk.Label(header_frame, text="Türkçe", font=("Arial", 12, "bold"), 
+        tk.Label(header_frame, text="Türkçe", font=self.fonts["text_bold"], 
                 bg="#ecf0f1", width=25).pack(side=tk.LEFT, padx=5, pady=5)
-        tk.Label(header_frame, text="İngilizce", font=("Arial", 12, "bold"), 
+        tk.Label(header_frame, text="İngilizce", font=self.fonts["text_bold"], 
                 bg="#ecf0f1", width=25).pack(side=tk.LEFT, padx=5, pady=5)
         
-        # Kaydırılabilir alan
-        canvas = tk.Canvas(list_frame, bg="white")
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="white")
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        word_entries = []
+        # Satırlar modelde tutulur: [word_id, türkçe, ingilizce]
+        word_rows = [[None, "", ""] for _ in range(5)]
+        word_list = self.create_word_list(list_frame, word_rows)
+        word_list.pack(fill=tk.BOTH, expand=True)
         
         def add_word_row():
-            row_frame = tk.Frame(scrollable_frame, bg="white")
-            row_frame.pack(fill=tk.X, pady=2)
-            
-            turkish_entry = tk.Entry(row_frame, font=("Arial", 11), width=28)
-            turkish_entry.pack(side=tk.LEFT, padx=5)
-            
-            english_entry = tk.Entry(row_frame, font=("Arial", 11), width=28)
-            english_entry.pack(side=tk.LEFT, padx=5)
-            
-            delete_btn = tk.Button(row_frame, text="❌", command=lambda: row_frame.destroy(),
-                                  bg="#e74c3c", fg="white", width=3)
-            delete_btn.pack(side=tk.LEFT, padx=5)
-
-            word_entries.append((turkish_entry, english_entry))
-
-        # İlk satırları ekle
-        for _ in range(5):
-            add_word_row()
+            word_list.append([None, "", ""])
+            word_list.scroll_to(len(word_rows) - 1)
         
         # Butonlar
         button_frame = tk.Frame(self.root, bg="#f0f0f0")
         button_frame.pack(pady=10)
         
         tk.Button(button_frame, text="➕ Satır Ekle", command=add_word_row,
-                 font=("Arial", 11), bg="#27ae60", fg="white", width=15).pack(side=tk.LEFT, padx=5)
+                 font=self.fonts["body"], bg="#27ae60", fg="white", width=15).pack(side=tk.LEFT, padx=5)
         
         def save_set():
             set_name = set_name_entry.get().strip()
@@ -347,109 +527,266 @@ class VocabApp:
                 messagebox.showerror("Hata", "Lütfen set adı girin!")
                 return
             
-            words = [(tr.get().strip(), en.get().strip()) 
-                    for tr, en in word_entries 
-                    if tr.get().strip() and en.get().strip()]
+            word_list.sync()
+            words = [(tr.strip(), en.strip()) 
+                    for _, tr, en in word_rows 
+                    if tr.strip() and en.strip()]
             
             if not words:
                 messagebox.showerror("Hata", "Lütfen en az bir kelime ekleyin!")
                 return
             
-            # Veritabanına kaydet
-            self.cursor.execute('INSERT INTO word_sets (name, created_date) VALUES (?, ?)',
-                              (set_name, datetime.now().strftime("%Y-%m-%d %H:%M")))
-            set_id = self.cursor.lastrowid
-            
-            for turkish, english in words:
-                self.cursor.execute('INSERT INTO words (set_id, turkish, english) VALUES (?, ?, ?)',
-                                  (set_id, turkish, english))
+            def saved(set_id):
+                messagebox.showinfo("Başarılı", f"{len(words)} kelime ile '{set_name}' seti oluşturuldu!")
+                self.show_main_menu()
             
-            self.conn.commit()
-            messagebox.showinfo("Başarılı", f"{len(words)} kelime ile '{set_name}' seti oluşturuldu!")
-            self.show_main_menu()
+            # Veritabanına kaydet
+            self.run_with_progress("Kaydediliyor", self.repo.create_set, set_name, words,
+                                   describe=describe_rows, on_done=saved,
+                                   on_error=self.show_save_error)
         
         tk.Button(button_frame, text="💾 Kaydet", command=save_set,
-                 font=("Arial", 11), bg="#2ecc71", fg="white", width=15).pack(side=tk.LEFT, padx=5)
+                 font=self.fonts["body"], bg="#2ecc71", fg="white", width=15).pack(side=tk.LEFT, padx=5)
         
         tk.Button(button_frame, text="🔙 Geri", command=self.show_main_menu,
-                 font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(side=tk.LEFT, padx=5)
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(side=tk.LEFT, padx=5)
+    
+    def create_word_list(self, parent, word_rows):
+        """Türkçe/İngilizce düzenleme satırları için sanal liste"""
+        def create_row(canvas):
+            row_frame = tk.Frame(canvas, bg="white")
+            
+            row_frame.turkish_entry = tk.Entry(row_frame, font=self.fonts["body"], width=28)
+            row_frame.turkish_entry.pack(side=tk.LEFT, padx=5)
+            
+            row_frame.english_entry = tk.Entry(row_frame, font=self.fonts["body"], width=28)
+            row_frame.english_entry.pack(side=tk.LEFT, padx=5)
+            
+            delete_btn = tk.Button(row_frame, text="❌", command=lambda: word_list.delete(row_frame.index),
+                                  bg="#e74c3c", fg="white", width=3)
+            delete_btn.pack(side=tk.LEFT, padx=5)
+            return row_frame
+        
+        def bind_row(row_frame, index, item):
+            row_frame.index = index
+            for entry, text in ((row_frame.turkish_entry, item[1]), (row_frame.english_entry, item[2])):
+                entry.delete(0, tk.END)
+                entry.insert(0, text)
+        
+        def unbind_row(row_frame, index, item):
+            # Kaydırma sırasında Entry içindeki değişiklikleri modele yaz
+            item[1] = row_frame.turkish_entry.get()
+            item[2] = row_frame.english_entry.get()
+        
+        word_list = VirtualList(parent, word_rows, create_row, bind_row, unbind_row, row_height=30)
+        return word_list
+    
+    def show_search(self):
+        """Tüm setlerde yazarken arama"""
+        self.clear_window()
+        
+        tk.Label(self.root, text="Kelime Ara", 
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
+        
+        query_entry = tk.Entry(self.root, font=self.fonts["entry"], width=35)
+        query_entry.pack(pady=10)
+        query_entry.focus()
+        
+        status_label = tk.Label(self.root, text=f"En az {search.MIN_TERM} harf yazın", 
+                               font=self.fonts["small"], bg="#f0f0f0", fg="#7f8c8d")
+        status_label.pack()
+        
+        list_frame = tk.Frame(self.root, bg="white", relief=tk.RIDGE, bd=2)
+        list_frame.pack(pady=20, padx=50, fill=tk.BOTH, expand=True)
+        
+        # Sonuçlar: (word_id, set_id, set adı, türkçe, ingilizce)
+        results = []
+        
+        def create_row(parent):
+            row = tk.Frame(parent, bg="white", cursor="hand2")
+            row.word_label = tk.Label(row, font=self.fonts["text"], bg="white", anchor="w")
+            row.word_label.pack(fill=tk.X, padx=10)
+            row.set_label = tk.Label(row, font=self.fonts["small"], bg="white", fg="#7f8c8d", anchor="w")
+            row.set_label.pack(fill=tk.X, padx=10)
+            for widget in (row, row.word_label, row.set_label):
+                widget.bind("<Button-1>", lambda e: self.edit_set(row.set_id))
+            return row
+        
+        def bind_row(row, index, item):
+            _, set_id, set_name, turkish, english = item
+            row.set_id = set_id
+            row.word_label.config(text=f"{turkish} — {english}")
+            row.set_label.config(text=f"📚 {set_name}")
+        
+        result_list = VirtualList(list_frame, results, create_row, bind_row, row_height=48)
+        result_list.pack(fill=tk.BOTH, expand=True)
+        
+        # Her tuşta önceki bekleyen sorgu iptal edilir; yalnızca son sorgunun sonucu gösterilir
+        pending = [None]
+        latest = [0]
+        screen = self.screen
+        
+        def show_results(seq, result):
+            if seq != latest[0]:
+                return
+            rows, elapsed_ms = result
+            results[:] = rows
+            result_list.refresh()
+            result_list.scroll_to(0)
+            status_label.config(text=f"{len(rows)} sonuç • {elapsed_ms:.1f} ms")
+        
+        def run_search():
+            pending[0] = None
+            if self.screen != screen:
+                return
+            text = query_entry.get()
+            latest[0] += 1
+            if search.match_query(text) is None:
+                results.clear()
+                result_list.refresh()
+                status_label.config(text=f"En az {search.MIN_TERM} harf yazın")
+                return
+            seq = latest[0]
+            self.run_query(search.search, text, on_done=lambda result: show_results(seq, result))
+        
+        def on_key(event=None):
+            if pending[0]:
+                self.root.after_cancel(pending[0])
+            pending[0] = self.root.after(SEARCH_DELAY_MS, run_search)
+        
+        query_entry.bind("<KeyRelease>", on_key)
+        
+        tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=10)
     
     def show_word_sets(self):
+        self.load_screen("Setler yükleniyor...", self.repo.set_summaries,
+                         on_done=self.show_word_sets_list)
+    
+    def show_word_sets_list(self, sets):
         self.clear_window()
         
         tk.Label(self.root, text="Kelime Setleri", 
-                font=("Arial", 20, "bold"), bg="#f0f0f0").pack(pady=20)
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
         
         # Set listesi
         list_frame = tk.Frame(self.root, bg="white", relief=tk.RIDGE, bd=2)
         list_frame.pack(pady=20, padx=50, fill=tk.BOTH, expand=True)
-
-        canvas = tk.Canvas(list_frame, bg="white")
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="white")
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        list_frame = scrollable_frame
-
-        
-        self.cursor.execute('SELECT id, name, created_date FROM word_sets ORDER BY created_date DESC')
-        sets = self.cursor.fetchall()
         
         if not sets:
             tk.Label(list_frame, text="Henüz kelime seti eklenmemiş", 
-                    font=("Arial", 14), bg="white").pack(expand=True)
+                    font=self.fonts["large"], bg="white").pack(expand=True)
         else:
-            for set_id, name, date in sets:
-                self.cursor.execute('SELECT COUNT(*) FROM words WHERE set_id = ?', (set_id,))
-                word_count = self.cursor.fetchone()[0]
-                
-                set_frame = tk.Frame(list_frame, bg="#ecf0f1", relief=tk.RAISED, bd=2)
-                set_frame.pack(fill=tk.X, padx=10, pady=5)
+            def create_row(parent):
+                row = tk.Frame(parent, bg="white")
+                set_frame = tk.Frame(row, bg="#ecf0f1", relief=tk.RAISED, bd=2)
+                set_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
                 
                 info_frame = tk.Frame(set_frame, bg="#ecf0f1")
-                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+                info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=5)
                 
-                tk.Label(info_frame, text=name, font=("Arial", 14, "bold"), 
-                        bg="#ecf0f1", anchor="w").pack(fill=tk.X)
-                tk.Label(info_frame, text=f"{word_count} kelime • {date}", 
-                        font=("Arial", 10), bg="#ecf0f1", fg="#7f8c8d", anchor="w").pack(fill=tk.X)
+                row.name_label = tk.Label(info_frame, font=self.fonts["large_bold"], 
+                        bg="#ecf0f1", anchor="w")
+                row.name_label.pack(fill=tk.X)
+                row.info_label = tk.Label(info_frame, 
+                        font=self.fonts["small"], bg="#ecf0f1", fg="#7f8c8d", anchor="w")
+                row.info_label.pack(fill=tk.X)
                 
                 btn_frame = tk.Frame(set_frame, bg="#ecf0f1")
                 btn_frame.pack(side=tk.RIGHT, padx=5)
                 
                 tk.Button(btn_frame, text="✏️ Düzenle", 
-                         command=lambda sid=set_id: self.edit_set(sid),
+                         command=lambda: self.edit_set(row.set_id),
                          bg="#3498db", fg="white", width=10).pack(side=tk.LEFT, padx=2)
                 
                 tk.Button(btn_frame, text="🗑️ Sil", 
-                         command=lambda sid=set_id, n=name: self.delete_set(sid, n),
+                         command=lambda: self.delete_set(row.set_id, row.set_name),
                          bg="#e74c3c", fg="white", width=10).pack(side=tk.LEFT, padx=2)
+                return row
+            
+            def bind_row(row, index, item):
+                set_id, name, date, word_count, last_practiced = item
+                row.set_id = set_id
+                row.set_name = name
+                info_text = f"{word_count} kelime • {date}"
+                if last_practiced:
+                    info_text += f" • Son pratik: {last_practiced}"
+                row.name_label.config(text=name)
+                row.info_label.config(text=info_text)
+            
+            VirtualList(list_frame, sets, create_row, bind_row,
+                        row_height=76).pack(fill=tk.BOTH, expand=True)
         
-        tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
-                 font=("Arial", 12), bg="#95a5a6", fg="white", width=20).pack(pady=10)
+        button_frame = tk.Frame(self.root, bg="#f0f0f0")
+        button_frame.pack(pady=10)
+        
+        tk.Button(button_frame, text="📥 JSON'dan Aktar", command=self.import_sets,
+                 font=self.fonts["text"], bg="#27ae60", fg="white", width=20).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(button_frame, text="🔎 Tekrarları Bul", command=self.show_duplicates,
+                 font=self.fonts["text"], bg="#8e44ad", fg="white", width=20).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(button_frame, text="🔙 Ana Menü", command=self.show_main_menu,
+                 font=self.fonts["text"], bg="#95a5a6", fg="white", width=20).pack(side=tk.LEFT, padx=5)
+    
+    def import_sets(self):
+        """sozluk.json biçimindeki bir dosyayı arka planda içe aktar"""
+        path = filedialog.askopenfilename(title="JSON Dosyası Seçin",
+                                          filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        
+        def describe(stats):
+            return f"{stats['sets']} set işlendi • {stats['inserted']} kelime eklendi", None
+        
+        def imported(stats):
+            message = (f"{stats['sets']} set işlendi ({stats['sets'] - stats['unchanged']} değişmiş)\n"
+                       f"{stats['inserted']} eklendi, {stats['updated']} güncellendi, {stats['deleted']} silindi")
+            if stats["app_sets"]:
+                message += (f"\n\nUygulamada oluşturduğunuz {len(stats['app_sets'])} set dosyadaki setle "
+                            "aynı isimde; bu setlere yalnızca yeni kelimeler eklendi.")
+            messagebox.showinfo("Başarılı", message)
+            missing = stats["missing"]
+            if missing:
+                names = "\n".join(f"• {name}" for _, name in missing[:MAX_LISTED_SETS])
+                if len(missing) > MAX_LISTED_SETS:
+                    names += f"\n… ve {len(missing) - MAX_LISTED_SETS} set daha"
+                if messagebox.askyesno(
+                        "Dosyada Olmayan Setler",
+                        f"Daha önce içe aktarılmış {len(missing)} set bu dosyada yok:\n{names}\n\n"
+                        "Bu setler, kelimeleri ve çalışma geçmişleriyle birlikte silinsin mi?",
+                        icon=messagebox.WARNING, default=messagebox.NO):
+                    self.run_query(self.repo.bulk, remove_sets, [set_id for set_id, _ in missing],
+                                   on_done=lambda _: self.show_word_sets())
+                    return
+            self.show_word_sets()
+        
+        def failed(exc):
+            # İptalde tamamlanan parçalar kalır; listeyi güncelle
+            self.show_db_error(exc)
+            self.show_word_sets()
+        
+        # İçe aktarma ve tekrar analizi modülleri ilk kullanımda yüklenir (açılışı yavaşlatmaz)
+        from dict_to_database.dict_to_database import import_json, remove_sets
+        
+        self.run_with_progress("İçe Aktarılıyor", self.repo.bulk, import_json, path,
+                               describe=describe, on_done=imported, on_error=failed)
     
     def edit_set(self, set_id):
+        self.load_screen("Set yükleniyor...", self.repo.set_contents, set_id,
+                         on_done=lambda contents: self.show_edit_set(set_id, *contents))
+    
+    def show_edit_set(self, set_id, set_name, word_rows):
         self.clear_window()
         
-        # Set bilgilerini al
-        self.cursor.execute('SELECT name FROM word_sets WHERE id = ?', (set_id,))
-        set_name = self.cursor.fetchone()[0]
-        
         tk.Label(self.root, text=f"'{set_name}' Düzenleniyor", 
-                font=("Arial", 20, "bold"), bg="#f0f0f0").pack(pady=20)
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
         
         # Set adı düzenleme
         name_frame = tk.Frame(self.root, bg="#f0f0f0")
         name_frame.pack(pady=10)
-        tk.Label(name_frame, text="Set Adı:", font=("Arial", 12), bg="#f0f0f0").pack(side=tk.LEFT, padx=5)
-        set_name_entry = tk.Entry(name_frame, font=("Arial", 12), width=30)
+        tk.Label(name_frame, text="Set Adı:", font=self.fonts["text"], bg="#f0f0f0").pack(side=tk.LEFT, padx=5)
+        set_name_entry = tk.Entry(name_frame, font=self.fonts["text"], width=30)
         set_name_entry.insert(0, set_name)
         set_name_entry.pack(side=tk.LEFT)
         
@@ -459,55 +796,25 @@ class VocabApp:
         
         header_frame = tk.Frame(list_frame, bg="#ecf0f1")
         header_frame.pack(fill=tk.X)
-        tk.Label(header_frame, text="Türkçe", font=("Arial", 12, "bold"), 
+        tk.Label(header_frame, text="Türkçe", font=self.fonts["text_bold"], 
                 bg="#ecf0f1", width=25).pack(side=tk.LEFT, padx=5, pady=5)
-        tk.Label(header_frame, text="İngilizce", font=("Arial", 12, "bold"), 
+        tk.Label(header_frame, text="İngilizce", font=self.fonts["text_bold"], 
                 bg="#ecf0f1", width=25).pack(side=tk.LEFT, padx=5, pady=5)
         
-        canvas = tk.Canvas(list_frame, bg="white")
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="white")
-        
-        scrollable_frame.bind("<Configure>", 
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        word_entries = []
+        # Kaydederken yalnızca farklar yazılır: word_id -> (türkçe, ingilizce)
+        original = {word_id: (tr, en) for word_id, tr, en in word_rows}
+        word_list = self.create_word_list(list_frame, word_rows)
+        word_list.pack(fill=tk.BOTH, expand=True)
         
-        def add_word_row(turkish="", english="", word_id=None):
-            row_frame = tk.Frame(scrollable_frame, bg="white")
-            row_frame.pack(fill=tk.X, pady=2)
-            
-            turkish_entry = tk.Entry(row_frame, font=("Arial", 11), width=28)
-            turkish_entry.insert(0, turkish)
-            turkish_entry.pack(side=tk.LEFT, padx=5)
-            
-            english_entry = tk.Entry(row_frame, font=("Arial", 11), width=28)
-            english_entry.insert(0, english)
-            english_entry.pack(side=tk.LEFT, padx=5)
-            
-            delete_btn = tk.Button(row_frame, text="❌", command=lambda: row_frame.destroy(),
-                                  bg="#e74c3c", fg="white", width=3)
-            delete_btn.pack(side=tk.LEFT, padx=5)
-            
-            word_entries.append((turkish_entry, english_entry, word_id))
-        
-        # Mevcut kelimeleri yükle
-        self.cursor.execute('SELECT id, turkish, english FROM words WHERE set_id = ?', (set_id,))
-        existing_words = self.cursor.fetchall()
-        for word_id, turkish, english in existing_words:
-            add_word_row(turkish, english, word_id)
+        def add_word_row():
+            word_list.append([None, "", ""])
+            word_list.scroll_to(len(word_rows) - 1)
         
         button_frame = tk.Frame(self.root, bg="#f0f0f0")
         button_frame.pack(pady=10)
         
         tk.Button(button_frame, text="➕ Satır Ekle", command=lambda: add_word_row(),
-                 font=("Arial", 11), bg="#27ae60", fg="white", width=15).pack(side=tk.LEFT, padx=5)
+                 font=self.fonts["body"], bg="#27ae60", fg="white", width=15).pack(side=tk.LEFT, padx=5)
         
         def save_changes():
             new_name = set_name_entry.get().strip()
@@ -515,48 +822,183 @@ class VocabApp:
                 messagebox.showerror("Hata", "Lütfen set adı girin!")
                 return
             
-            # Set adını güncelle
-            self.cursor.execute('UPDATE word_sets SET name = ? WHERE id = ?', (new_name, set_id))
-            
-            # Tüm eski kelimeleri sil
-            self.cursor.execute('DELETE FROM words WHERE set_id = ?', (set_id,))
-            
-            # Yeni kelimeleri ekle
-            words = [(tr.get().strip(), en.get().strip()) 
-                    for tr, en, _ in word_entries 
-                    if tr.get().strip() and en.get().strip()]
-            
-            if not words:
+            word_list.sync()
+            inserts = []
+            updates = []
+            kept = set()
+            for word_id, tr, en in word_rows:
+                tr, en = tr.strip(), en.strip()
+                if not (tr and en):
+                    continue
+                if word_id is None:
+                    inserts.append((set_id, tr, en))
+                    continue
+                kept.add(word_id)
+                if original[word_id] != (tr, en):
+                    updates.append((tr, en, word_id))
+            deletes = [word_id for word_id in original if word_id not in kept]
+            
+            if not kept and not inserts:
                 messagebox.showerror("Hata", "Lütfen en az bir kelime ekleyin!")
                 return
             
-            for turkish, english in words:
-                self.cursor.execute('INSERT INTO words (set_id, turkish, english) VALUES (?, ?, ?)',
-                                  (set_id, turkish, english))
+            # İngilizcesi değişen her satır önce geçici bir değer alır; böylece yer
+            # değiştirmeler ve zincirleme değişiklikler (A->B, B->D) sırasında
+            # (set_id, english) tekliği bozulmaz
+            swapped = [(f"\x01{word_id}", word_id) for _, en, word_id in updates
+                       if en != original[word_id][1]]
             
-            self.conn.commit()
-            messagebox.showinfo("Başarılı", "Değişiklikler kaydedildi!")
-            self.show_word_sets()
+            def saved(_):
+                messagebox.showinfo("Başarılı", "Değişiklikler kaydedildi!")
+                self.show_word_sets()
+            
+            self.run_with_progress("Kaydediliyor", self.repo.save_set_changes, set_id,
+                                   new_name if new_name != set_name else None,
+                                   deletes, swapped, updates, inserts,
+                                   describe=describe_rows, on_done=saved,
+                                   on_error=self.show_save_error)
         
         tk.Button(button_frame, text="💾 Kaydet", command=save_changes,
-                 font=("Arial", 11), bg="#2ecc71", fg="white", width=15).pack(side=tk.LEFT, padx=5)
+                 font=self.fonts["body"], bg="#2ecc71", fg="white", width=15).pack(side=tk.LEFT, padx=5)
         
         tk.Button(button_frame, text="🔙 Geri", command=self.show_word_sets,
-                 font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(side=tk.LEFT, padx=5)
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(side=tk.LEFT, padx=5)
     
     def delete_set(self, set_id, set_name):
         if messagebox.askyesno("Silme Onayı", f"'{set_name}' setini silmek istediğinize emin misiniz?"):
-            self.cursor.execute('DELETE FROM words WHERE set_id = ?', (set_id,))
-            self.cursor.execute('DELETE FROM word_sets WHERE id = ?', (set_id,))
-            self.conn.commit()
-            messagebox.showinfo("Başarılı", "Set silindi!")
-            self.show_word_sets()
+            def deleted(_):
+                messagebox.showinfo("Başarılı", "Set silindi!")
+                self.show_word_sets()
+            
+            self.run_query(self.repo.delete_set, set_id, on_done=deleted)
+    
+    def show_duplicates(self):
+        import duplicates
+        
+        self.load_screen("Sözlük taranıyor...", duplicates.analyze,
+                         on_done=self.show_duplicate_report)
+    
+    def show_duplicate_report(self, report):
+        """Tekrar eden, çelişen ve benzer kelimeler; tekrarlar tek tıkla birleştirilir"""
+        import duplicates
+        
+        self.clear_window()
+        
+        tk.Label(self.root, text="Tekrar ve Çelişki Analizi", 
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
+        tk.Label(self.root, text=f"{report.scanned} kelime • {report.seconds:.2f} sn", 
+                font=self.fonts["small"], bg="#f0f0f0", fg="#7f8c8d").pack()
+        
+        # Her sekmede yalnızca ayrıntısı okunmuş ilk bulgular listelenir
+        tabs = [("Tekrarlar", report.duplicates), ("Çelişen Çeviriler", report.conflicts),
+                ("Benzer Kayıtlar", report.near)]
+        tab_frame = tk.Frame(self.root, bg="#f0f0f0")
+        tab_frame.pack(pady=10)
+        
+        list_frame = tk.Frame(self.root, bg="white", relief=tk.RIDGE, bd=2)
+        list_frame.pack(pady=10, padx=50, fill=tk.BOTH, expand=True)
+        
+        # Seçili sekmenin listelenen bulguları
+        findings = []
+        
+        def create_row(parent):
+            row = tk.Frame(parent, bg="white")
+            info_frame = tk.Frame(row, bg="white")
+            info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
+            row.title_label = tk.Label(info_frame, font=self.fonts["text"], bg="white", anchor="w")
+            row.title_label.pack(fill=tk.X)
+            row.sets_label = tk.Label(info_frame, font=self.fonts["small"], bg="white", 
+                                     fg="#7f8c8d", anchor="w")
+            row.sets_label.pack(fill=tk.X)
+            row.merge_btn = tk.Button(row, text="🔗 Birleştir", command=lambda: merge(row.finding),
+                                     bg="#27ae60", fg="white", width=10)
+            row.merge_btn.pack(side=tk.RIGHT, padx=10)
+            return row
+        
+        def bind_row(row, index, item):
+            row.finding = item
+            title, _ = duplicates.describe(item, report.words)
+            row.title_label.config(text=title)
+            row.sets_label.config(text="📚 " + ", ".join(report.words[word_id].set_name
+                                                        for word_id in item.ids))
+            # Çelişen çeviriler çoğunlukla eş anlamlıdır; birleştirme önerilmez
+            if item.kind == "conflict":
+                row.merge_btn.pack_forget()
+            else:
+                row.merge_btn.pack(side=tk.RIGHT, padx=10)
+        
+        finding_list = VirtualList(list_frame, findings, create_row, bind_row, row_height=56)
+        finding_list.pack(fill=tk.BOTH, expand=True)
+        
+        selected = [0]
+        
+        def show_tab(index):
+            selected[0] = index
+            findings[:] = [finding for finding in tabs[index][1][:duplicates.LISTED]
+                           if all(word_id in report.words for word_id in finding.ids)]
+            finding_list.refresh()
+            finding_list.scroll_to(0)
+            for i, button in enumerate(tab_buttons):
+                button.config(bg="#2980b9" if i == index else "#95a5a6",
+                              text=f"{tabs[i][0]} ({len(tabs[i][1])})")
+        
+        tab_buttons = []
+        for index in range(len(tabs)):
+            button = tk.Button(tab_frame, command=lambda i=index: show_tab(i),
+                               font=self.fonts["body"], fg="white", width=20)
+            button.pack(side=tk.LEFT, padx=5)
+            tab_buttons.append(button)
+        
+        def merged(merged_findings):
+            # Silinen kelimeleri içeren bulgular tüm sekmelerden kalkar
+            dropped = {word_id for finding in merged_findings for word_id in finding.ids[1:]}
+            for _, tab_findings in tabs:
+                tab_findings[:] = [finding for finding in tab_findings
+                                   if not dropped.intersection(finding.ids)]
+            show_tab(selected[0])
+        
+        def merge(finding):
+            keep = report.words[finding.ids[0]]
+            if not messagebox.askyesno("Birleştirme Onayı",
+                    f"#{keep.id} {keep.turkish} — {keep.english} [{keep.set_name}] tutulacak.\n"
+                    f"Diğer {len(finding.ids) - 1} kayıt silinecek, tekrar geçmişi bu kelimeye taşınacak.\n\n"
+                    "Devam edilsin mi?"):
+                return
+            self.run_query(self.repo.bulk, duplicates.merge, keep.id, finding.ids[1:],
+                           on_done=lambda _: merged([finding]))
+        
+        def merge_all():
+            if not report.duplicates:
+                return
+            if not messagebox.askyesno("Birleştirme Onayı",
+                    f"{len(report.duplicates)} tekrar grubunda en eski kayıtlar tutulacak, "
+                    "diğerleri silinecek.\n\nDevam edilsin mi?"):
+                return
+            all_duplicates = list(report.duplicates)
+            
+            def describe(value):
+                done, total = value
+                return f"{done} / {total} kelime birleştirildi", done / total
+            
+            self.run_with_progress("Birleştiriliyor", self.repo.bulk, duplicates.merge_duplicates, all_duplicates,
+                                   describe=describe, on_done=lambda _: merged(all_duplicates))
+        
+        show_tab(0)
+        
+        button_frame = tk.Frame(self.root, bg="#f0f0f0")
+        button_frame.pack(pady=10)
+        
+        tk.Button(button_frame, text="🔗 Tüm Tekrarları Birleştir", command=merge_all,
+                 font=self.fonts["text"], bg="#27ae60", fg="white", width=24).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(button_frame, text="🔙 Geri", command=self.show_word_sets,
+                 font=self.fonts["text"], bg="#95a5a6", fg="white", width=20).pack(side=tk.LEFT, padx=5)
     
     def show_writing_practice(self):
         self.clear_window()
 
         tk.Label(self.root, text="Yazarak Pratik Yapma", 
-                font=("Arial", 20, "bold"), bg="#f0f0f0").pack(pady=20)
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
         menu_frame = tk.Frame(self.root, bg="#f0f0f0")
         menu_frame.pack(expand=True, pady=50)
         
@@ -567,178 +1009,131 @@ class VocabApp:
         
         for text, command in buttons:
             btn = tk.Button(menu_frame, text=text, command=command,
-                          font=("Arial", 14), width=30, height=2,
+                          font=self.fonts["large"], width=30, height=2,
                           bg="#3498db", fg="white", cursor="hand2",
                           relief=tk.RAISED, bd=3)
             btn.pack(pady=10)
             btn.bind("<Enter>", lambda e, b=btn: b.config(bg="#2980b9"))
             btn.bind("<Leave>", lambda e, b=btn: b.config(bg="#3498db"))
         tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
-                     font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(pady=10)
+                     font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=10)
 
     def show_writing_practice_english(self):
-        set_id = self.select_set_for_practice("writing")
-        if not set_id:
-            return
-        
-        self.cursor.execute('SELECT id, turkish, english FROM words WHERE set_id = ?', (set_id,))
-        words = self.cursor.fetchall()
-        random.shuffle(words)
+        self.start_writing("en", "İngilizce karşılığını yazın:")
+
+    def show_writing_practice_turkish(self):
+        self.start_writing("tr", "Türkçe karşılığını yazın:")
+
+    def start_writing(self, answer_language, prompt_text):
+        def start(set_ids, limit):
+            self.load_screen("Kelimeler yükleniyor...", self.repo.practice_sets, set_ids, True, limit,
+                             on_done=lambda words: self.show_writing_session(
+                                 WritingSession(self.attach_words(words), answer_language,
+                                                listener=self.answer_log.record),
+                                 prompt_text))
+        
+        self.select_set_for_practice("writing", start)
+
+    def start_most_missed(self):
+        """Tüm setlerde en çok yanlış yapılan kelimelerle İngilizce yazma pratiği"""
+        def loaded(words):
+            if not words:
+                messagebox.showinfo("Hatalı Kelimeler", "Henüz yanlış cevaplanan kelime yok! 🎉")
+                self.show_main_menu()
+                return
+            self.show_writing_session(WritingSession(words, "en", listener=self.answer_log.record),
+                                      "İngilizce karşılığını yazın:")
         
+        # Bekleyen cevaplar sayaçlara işlensin (worker işleri sırayla çalışır)
+        self.flush_answers()
+        self.load_screen("Kelimeler yükleniyor...", mistakes.most_missed, mistakes.MOST_MISSED, True,
+                         on_done=loaded)
+
+    def show_writing_session(self, session, prompt_text):
+        """Yazma pratiği ekranı"""
         self.clear_window()
         
-        current_index = [0]
-        correct_count = [0]
+        # Başlık
+        progress_label = tk.Label(self.root, font=self.fonts["large"], bg="#f0f0f0", fg="#7f8c8d")
+        progress_label.pack(pady=10)
         
-        def show_word():
-            if current_index[0] >= len(words):
-                self.show_results(correct_count[0], len(words), "Yazma Pratiği")
-                return
-            
-            self.clear_window()
-            
-            word_id, turkish, english = words[current_index[0]]
-            
-            # Başlık
-            tk.Label(self.root, text=f"Soru {current_index[0] + 1} / {len(words)}", 
-                    font=("Arial", 14), bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
-            
-            # Türkçe kelime
-            tk.Label(self.root, text=turkish, 
-                    font=("Arial", 28, "bold"), bg="#f0f0f0", fg="#2c3e50").pack(pady=40)
-            
-            # Cevap girişi
-            tk.Label(self.root, text="İngilizce karşılığını yazın:", 
-                    font=("Arial", 12), bg="#f0f0f0").pack()
-            
-            answer_entry = tk.Entry(self.root, font=("Arial", 16), width=30, justify="center")
-            answer_entry.pack(pady=10)
-            answer_entry.focus()
-            
-            result_label = tk.Label(self.root, text="", font=("Arial", 12, "bold"), bg="#f0f0f0")
-            result_label.pack(pady=10)
-            
-            def check_answer():
-                user_answer = answer_entry.get().strip().lower()
-                correct_answer = english.lower()
-                
-                if user_answer == correct_answer:
-                    result_label.config(text="✅ Doğru!", fg="#27ae60")
-                    correct_count[0] += 1
-                else:
-                    result_label.config(text=f"❌ Yanlış! Doğru cevap: {english}", fg="#e74c3c")
-                
-                answer_entry.config(state="disabled")
-                check_btn.config(state="disabled")
-                next_btn.config(state="normal")
-            
-            def next_word():
-                current_index[0] += 1
-                show_word()
-            
-            button_frame = tk.Frame(self.root, bg="#f0f0f0")
-            button_frame.pack(pady=20)
-            
-            check_btn = tk.Button(button_frame, text="Kontrol Et", command=check_answer,
-                                 font=("Arial", 12), bg="#3498db", fg="white", width=15)
-            check_btn.pack(side=tk.LEFT, padx=5)
-            
-            next_btn = tk.Button(button_frame, text="Sonraki ➡️", command=next_word,
-                                font=("Arial", 12), bg="#2ecc71", fg="white", width=15, state="disabled")
-            next_btn.pack(side=tk.LEFT, padx=5)
-            
-            answer_entry.bind("<Return>", lambda e: check_answer() if check_btn["state"] == "normal" else next_word())
-            
-            tk.Button(self.root, text="🔙 Çıkış", command=self.show_main_menu,
-                     font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(pady=10)
+        # Sorulan kelime
+        question_label = tk.Label(self.root, font=self.fonts["word"], bg="#f0f0f0", fg="#2c3e50")
+        question_label.pack(pady=40)
         
-        show_word()
-
-    def show_writing_practice_turkish(self):
-        set_id = self.select_set_for_practice("writing")
-        if not set_id:
-            return
+        # Cevap girişi
+        tk.Label(self.root, text=prompt_text, 
+                font=self.fonts["text"], bg="#f0f0f0").pack()
         
-        self.cursor.execute('SELECT id, english, turkish FROM words WHERE set_id = ?', (set_id,))
-        words = self.cursor.fetchall()
-        random.shuffle(words)
-
-        self.clear_window()
+        answer_entry = tk.Entry(self.root, font=self.fonts["entry"], width=30, justify="center")
+        answer_entry.pack(pady=10)
         
-        current_index = [0]
-        correct_count = [0]
+        result_label = tk.Label(self.root, text="", font=self.fonts["text_bold"], bg="#f0f0f0")
+        result_label.pack(pady=10)
         
         def show_word():
-            if current_index[0] >= len(words):
-                self.show_results(correct_count[0], len(words), "Yazma Pratiği")
+            item = session.next_item()
+            if item is None:
+                self.show_results(session.summary(), "Yazma Pratiği")
                 return
             
-            self.clear_window()
-            
-            word_id, turkish, english = words[current_index[0]]
-            
-            # Başlık
-            tk.Label(self.root, text=f"Soru {current_index[0] + 1} / {len(words)}", 
-                    font=("Arial", 14), bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
-            
-            # İngilizce kelime
-            tk.Label(self.root, text=turkish, 
-                    font=("Arial", 28, "bold"), bg="#f0f0f0", fg="#2c3e50").pack(pady=40)
-            
-            # Cevap girişi
-            tk.Label(self.root, text="Türkçe karşılığını yazın:", 
-                    font=("Arial", 12), bg="#f0f0f0").pack()
-            
-            answer_entry = tk.Entry(self.root, font=("Arial", 16), width=30, justify="center")
-            answer_entry.pack(pady=10)
+            progress_label.config(text=f"Soru {session.position} / {len(session)}")
+            question_label.config(text=item.question)
+            answer_entry.config(state="normal")
+            answer_entry.delete(0, tk.END)
             answer_entry.focus()
+            result_label.config(text="")
+            check_btn.config(state="normal")
+            next_btn.config(state="disabled")
+        
+        show_word = self.instruments.transition("writing", show_word)
+        
+        def check_answer():
+            result = session.submit(answer_entry.get())
             
-            result_label = tk.Label(self.root, text="", font=("Arial", 12, "bold"), bg="#f0f0f0")
-            result_label.pack(pady=10)
-            
-            def check_answer():
-                user_answer = answer_entry.get().strip().lower()
-                correct_answer = english.lower()
-                
-                if user_answer == correct_answer:
-                    result_label.config(text="✅ Doğru!", fg="#27ae60")
-                    correct_count[0] += 1
-                else:
-                    result_label.config(text=f"❌ Yanlış! Doğru cevap: {english}", fg="#e74c3c")
-                
-                answer_entry.config(state="disabled")
-                check_btn.config(state="disabled")
-                next_btn.config(state="normal")
-            
-            def next_word():
-                current_index[0] += 1
-                show_word()
-            
-            button_frame = tk.Frame(self.root, bg="#f0f0f0")
-            button_frame.pack(pady=20)
-            
-            check_btn = tk.Button(button_frame, text="Kontrol Et", command=check_answer,
-                                 font=("Arial", 12), bg="#3498db", fg="white", width=15)
-            check_btn.pack(side=tk.LEFT, padx=5)
-            
-            next_btn = tk.Button(button_frame, text="Sonraki ➡️", command=next_word,
-                                font=("Arial", 12), bg="#2ecc71", fg="white", width=15, state="disabled")
-            next_btn.pack(side=tk.LEFT, padx=5)
-            
-            answer_entry.bind("<Return>", lambda e: check_answer() if check_btn["state"] == "normal" else next_word())
+            if result.typo:
+                result_label.config(text=f"✅ Doğru! (küçük yazım hatası: {result.expected})", fg="#e67e22")
+            elif result.correct:
+                result_label.config(text="✅ Doğru!", fg="#27ae60")
+            else:
+                result_label.config(text=f"❌ Yanlış! Doğru cevap: {result.expected}", fg="#e74c3c")
             
-            tk.Button(self.root, text="🔙 Çıkış", command=self.show_main_menu,
-                     font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(pady=10)
+            answer_entry.config(state="disabled")
+            check_btn.config(state="disabled")
+            next_btn.config(state="normal")
+        
+        def next_word():
+            show_word()
+        
+        button_frame = tk.Frame(self.root, bg="#f0f0f0")
+        button_frame.pack(pady=20)
+        
+        check_btn = tk.Button(button_frame, text="Kontrol Et", command=check_answer,
+                             font=self.fonts["text"], bg="#3498db", fg="white", width=15)
+        check_btn.pack(side=tk.LEFT, padx=5)
+        
+        next_btn = tk.Button(button_frame, text="Sonraki ➡️", command=next_word,
+                            font=self.fonts["text"], bg="#2ecc71", fg="white", width=15, state="disabled")
+        next_btn.pack(side=tk.LEFT, padx=5)
+        
+        answer_entry.bind("<Return>", lambda e: check_answer() if check_btn["state"] == "normal" else next_word())
+        
+        tk.Button(self.root, text="🔙 Çıkış", command=self.show_main_menu,
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=10)
         
         show_word()
 
-    def select_set_for_practice(self, practice_type):
-        self.cursor.execute('SELECT id, name FROM word_sets')
-        sets = self.cursor.fetchall()
-        
+    def select_set_for_practice(self, practice_type, on_selected):
+        """Set seçim penceresi; on_selected(set_ids, limit) çağrılır.
+        set_ids: seçilen setlerin id'leri (tuple), tüm setler seçildiyse None
+        limit: setlerden rastgele seçilecek kelime sayısı (None = tümü)"""
+        self.run_query(self.repo.set_summaries,
+                       on_done=lambda sets: self.show_set_dialog(sets, on_selected))
+
+    def show_set_dialog(self, sets, on_selected):
         if not sets:
             messagebox.showwarning("Uyarı", "Henüz kelime seti yok! Önce bir set oluşturun.")
-            return None
+            return
         
         dialog = tk.Toplevel(self.root)
         dialog.title("Set Seçin")
@@ -759,288 +1154,362 @@ class VocabApp:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scollbar.set)
 
-        selected_set = tk.IntVar()
+        selected = {set_id: tk.BooleanVar() for set_id, *_ in sets}
+        all_sets = tk.BooleanVar()
         
-        for set_id, name in sets:
-            self.cursor.execute('SELECT COUNT(*) FROM words WHERE set_id = ?', (set_id,))
-            word_count = self.cursor.fetchone()[0]
-            tk.Radiobutton(scrollable_frame, text=f"{name} ({word_count} kelime)", 
-                          variable=selected_set, value=set_id,
-                          font=("Arial", 11)).pack(anchor=tk.W, padx=40, pady=5)
+        def toggle_all():
+            for var in selected.values():
+                var.set(all_sets.get())
+        
+        total = sum(word_count for _, _, _, word_count, _ in sets)
+        tk.Checkbutton(scrollable_frame, text=f"📚 Tüm setler ({total} kelime)",
+                      variable=all_sets, command=toggle_all,
+                      font=self.fonts["body"]).pack(anchor=tk.W, padx=40, pady=(10, 5))
+        
+        for set_id, name, _, word_count, _ in sets:
+            tk.Checkbutton(scrollable_frame, text=f"{name} ({word_count} kelime)", 
+                          variable=selected[set_id], command=lambda: all_sets.set(False),
+                          font=self.fonts["body"]).pack(anchor=tk.W, padx=40, pady=5)
         
         canvas.pack(side="left", fill="both", expand=True)
         scollbar.pack(side="right", fill="y")
         #####################
-        result = [None]
         
         def confirm():
-            if selected_set.get():
-                result[0] = selected_set.get()
-                dialog.destroy()
-            else:
-                messagebox.showwarning("Uyarı", "Lütfen bir set seçin!")
+            set_ids = tuple(set_id for set_id, var in selected.items() if var.get())
+            if not set_ids:
+                messagebox.showwarning("Uyarı", "Lütfen en az bir set seçin!")
+                return
+            limit = limit_entry.get().strip()
+            if limit and not (limit.isdigit() and int(limit) > 0):
+                messagebox.showwarning("Uyarı", "Kelime sayısı pozitif bir tam sayı olmalı!")
+                return
+            dialog.destroy()
+            self.db.submit(self.repo.mark_practiced, *set_ids, on_error=self.show_db_error)
+            on_selected(None if len(set_ids) == len(selected) else set_ids, int(limit) if limit else None)
         
-        tk.Button(scrollable_frame, text="Başla", command=confirm, 
-                 font=("Arial", 11), bg="#2ecc71", fg="white", width=15).pack(pady=20)
+        limit_frame = tk.Frame(scrollable_frame)
+        limit_frame.pack(pady=(15, 0))
+        tk.Label(limit_frame, text="Rastgele kelime sayısı (boş = tümü):",
+                font=self.fonts["body"]).pack(side=tk.LEFT, padx=5)
+        limit_entry = tk.Entry(limit_frame, font=self.fonts["body"], width=6)
+        limit_entry.pack(side=tk.LEFT)
         
-        self.root.wait_window(scrollable_frame)
-        return result[0]
+        tk.Button(scrollable_frame, text="Başla", command=confirm, 
+                 font=self.fonts["body"], bg="#2ecc71", fg="white", width=15).pack(pady=20)
 
-    def show_multiple_choice(self):
-        set_id = self.select_set_for_practice("multiple_choice")
-        if not set_id:
-            return
+    def show_multiple_choice_menu(self):
+        """Çoktan seçmeli test alt menüsü"""
+        self.clear_window()
+
+        tk.Label(self.root, text="Çoktan Seçmeli Test", 
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=20)
+        
+        tk.Label(self.root, text="Yanlış seçenekler nasıl seçilsin?", 
+                font=self.fonts["text"], bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
         
-        self.cursor.execute('SELECT id, turkish, english FROM words WHERE set_id = ?', (set_id,))
-        words = self.cursor.fetchall()
+        menu_frame = tk.Frame(self.root, bg="#f0f0f0")
+        menu_frame.pack(expand=True, pady=30)
         
-        if len(words) < 4:
+        buttons = [
+            ("🎲 Normal Mod (rastgele seçenekler)", lambda: self.show_multiple_choice(hard=False)),
+            ("🧠 Zor Mod (birbirine benzeyen seçenekler)", lambda: self.show_multiple_choice(hard=True))
+        ]
+        
+        for text, command in buttons:
+            btn = tk.Button(menu_frame, text=text, command=command,
+                          font=self.fonts["large"], width=35, height=2,
+                          bg="#3498db", fg="white", cursor="hand2",
+                          relief=tk.RAISED, bd=3)
+            btn.pack(pady=10)
+            btn.bind("<Enter>", lambda e, b=btn: b.config(bg="#2980b9"))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(bg="#3498db"))
+
+        tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=20)
+
+    def show_multiple_choice(self, hard=False):
+        def load(conn, set_ids, limit):
+            if not hard:
+                return self.repo.practice_sets(conn, set_ids, limit=limit), None
+            # Zor mod benzerlik indeksi için kelimeleri bellekte ister; indeks de
+            # worker'da kurulur (tüm set için set değişene kadar önbellekte)
+            choice_count = MultipleChoiceSession.choice_count
+            if set_ids is not None and len(set_ids) == 1:
+                words = self.repo.set_words(conn, set_ids[0])
+                if len(words) >= choice_count and not (limit and limit < len(words)):
+                    return words, self.repo.similarity_index(conn, set_ids[0])
+                if limit and limit < len(words):
+                    words = word_store.sample(words, max(limit, choice_count), random.Random())
+            else:
+                count = max(min(limit or HARD_MODE_MAX_WORDS, HARD_MODE_MAX_WORDS), choice_count)
+                words = deck.sample_sets(conn, self.repo.word_counts(conn, set_ids), count)
+            if len(words) < choice_count:
+                return words, None
+            return words, SimilarityIndex(words)
+        
+        self.select_set_for_practice(
+            "multiple_choice",
+            lambda set_ids, limit: self.load_screen("Sorular hazırlanıyor...", load, set_ids, limit,
+                                                    on_done=lambda result: self.show_multiple_choice_test(*result)))
+
+    def show_multiple_choice_test(self, words, similarity):
+        if len(words) < MultipleChoiceSession.choice_count:
             messagebox.showwarning("Uyarı", "Bu test için en az 4 kelime gerekli!")
+            self.show_multiple_choice_menu()
             return
         
-        random.shuffle(words)
+        session = MultipleChoiceSession(self.attach_words(words), similarity=similarity,
+                                        listener=self.answer_log.record)
         
         self.clear_window()
         
-        current_index = [0]
-        correct_count = [0]
-        user_answers = []  # Kullanıcının cevaplarını sakla
+        # Başlık
+        progress_label = tk.Label(self.root, font=self.fonts["large"], bg="#f0f0f0", fg="#7f8c8d")
+        progress_label.pack(pady=10)
+        
+        # Türkçe kelime
+        question_label = tk.Label(self.root, font=self.fonts["word"], bg="#f0f0f0", fg="#2c3e50")
+        question_label.pack(pady=40)
+        
+        tk.Label(self.root, text="Doğru İngilizce karşılığını seçin ve Enter'a basın:", 
+                font=self.fonts["text"], bg="#f0f0f0").pack(pady=10)
+        
+        selected = tk.StringVar()
+        
+        choice_frame = tk.Frame(self.root, bg="#f0f0f0")
+        choice_frame.pack(pady=20)
+        
+        choice_buttons = []
+        for _ in range(session.choice_count):
+            rb = tk.Radiobutton(choice_frame, variable=selected,
+                               font=self.fonts["large"], bg="#f0f0f0", cursor="hand2")
+            rb.pack(anchor=tk.W, padx=100, pady=8)
+            choice_buttons.append(rb)
         
         def show_question():
-            if current_index[0] >= len(words):
-                self.show_results(correct_count[0], len(words), "Çoktan Seçmeli Test")
+            question = session.next_item()
+            if question is None:
+                self.show_results(session.summary(), "Çoktan Seçmeli Test")
                 return
             
-            self.clear_window()
-            
-            word_id, turkish, english = words[current_index[0]]
-            
-            # Yanlış seçenekler oluştur
-            other_words = [w for w in words if w[0] != word_id]
-            wrong_choices = random.sample(other_words, min(3, len(other_words)))
-            
-            choices = [english] + [w[2] for w in wrong_choices]
-            random.shuffle(choices)
-            
-            # Başlık
-            tk.Label(self.root, text=f"Soru {current_index[0] + 1} / {len(words)}", 
-                    font=("Arial", 14), bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
-            
-            # Türkçe kelime
-            tk.Label(self.root, text=turkish, 
-                    font=("Arial", 28, "bold"), bg="#f0f0f0", fg="#2c3e50").pack(pady=40)
-            
-            tk.Label(self.root, text="Doğru İngilizce karşılığını seçin ve Enter'a basın:", 
-                    font=("Arial", 12), bg="#f0f0f0").pack(pady=10)
-            
-            selected = tk.StringVar()
-            
-            def next_question(event=None):
-                if not selected.get():
-                    messagebox.showwarning("Uyarı", "Lütfen bir seçenek seçin!")
-                    return
-                
-                # Cevabı kontrol et ve kaydet
-                if selected.get() == english:
-                    correct_count[0] += 1
-                
-                user_answers.append((turkish, english, selected.get()))
-                
-                current_index[0] += 1
-                show_question()
-            
-            choice_frame = tk.Frame(self.root, bg="#f0f0f0")
-            choice_frame.pack(pady=20)
-            
-            for choice in choices:
-                rb = tk.Radiobutton(choice_frame, text=choice, variable=selected, value=choice,
-                                   font=("Arial", 14), bg="#f0f0f0", cursor="hand2")
-                rb.pack(anchor=tk.W, padx=100, pady=8)
-            
-            # Enter tuşu ile sonraki soruya geç
-            self.root.bind("<Return>", next_question)
-            
-            button_frame = tk.Frame(self.root, bg="#f0f0f0")
-            button_frame.pack(pady=20)
-            
-            next_btn = tk.Button(button_frame, text="Sonraki ➡️", command=next_question,
-                                font=("Arial", 12), bg="#2ecc71", fg="white", width=15)
-            next_btn.pack(side=tk.LEFT, padx=5)
+            progress_label.config(text=f"Soru {session.position} / {len(session)}")
+            question_label.config(text=question.question)
+            selected.set("")
+            for rb, choice in zip(choice_buttons, question.choices):
+                rb.config(text=choice, value=choice)
+        
+        show_question = self.instruments.transition("multiple_choice", show_question)
+        
+        def next_question(event=None):
+            if not selected.get():
+                messagebox.showwarning("Uyarı", "Lütfen bir seçenek seçin!")
+                return
             
-            tk.Button(self.root, text="🔙 Çıkış", command=self.show_main_menu,
-                     font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(pady=10)
+            # Cevabı kontrol et ve kaydet
+            session.submit(selected.get())
+            show_question()
+        
+        # Enter tuşu ile sonraki soruya geç
+        self.root.bind("<Return>", next_question)
+        
+        button_frame = tk.Frame(self.root, bg="#f0f0f0")
+        button_frame.pack(pady=20)
+        
+        next_btn = tk.Button(button_frame, text="Sonraki ➡️", command=next_question,
+                            font=self.fonts["text"], bg="#2ecc71", fg="white", width=15)
+        next_btn.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(self.root, text="🔙 Çıkış", command=self.show_main_menu,
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=10)
         
         show_question()
     
     def show_matching_test(self):
-        set_id = self.select_set_for_practice("matching")
-        if not set_id:
-            return
-        
         # TÜM kelimeleri al
-        self.cursor.execute('SELECT id, turkish, english FROM words WHERE set_id = ?', (set_id,))
-        all_words = self.cursor.fetchall()
-        
+        self.select_set_for_practice(
+            "matching",
+            lambda set_ids, limit: self.load_screen("Kelimeler yükleniyor...", self.repo.practice_sets,
+                                                    set_ids, False, limit, on_done=self.show_matching_session))
+
+    def show_matching_session(self, all_words):
         if len(all_words) < 3:
             messagebox.showwarning("Uyarı", "Bu test için en az 3 kelime gerekli!")
+            self.show_main_menu()
             return
         
-        # Kelimeleri karıştır
-        random.shuffle(all_words)
+        # 10'ar kelimelik gruplar halinde eşleştir
+        session = MatchingSession(self.attach_words(all_words), group_size=10,
+                                  listener=self.answer_log.record)
         
-        # 10'ar kelimelik gruplara böl
-        word_groups = [all_words[i:i+10] for i in range(0, len(all_words), 10)]
+        self.clear_window()
         
-        current_group_index = [0]
-        total_correct = [0]
-    
-        def show_group():
-            if current_group_index[0] >= len(word_groups):
-                # Tüm gruplar tamamlandı
-                self.show_results(total_correct[0], len(all_words), "Eşleştirme Testi")
+        # Başlık ve ilerleme bilgisi
+        tk.Label(self.root, text="Eşleştirme Testi", 
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=10)
+        
+        progress_label = tk.Label(self.root, font=self.fonts["text_bold"], bg="#f0f0f0", fg="#3498db")
+        progress_label.pack(pady=5)
+        
+        tk.Label(self.root, text="Sol taraftaki Türkçe kelimelere tıklayın, ardından eşleşen İngilizce kelimeye tıklayın", 
+                font=self.fonts["body"], bg="#f0f0f0", fg="#7f8c8d").pack(pady=5)
+        
+        # Eşleştirme frame'i
+        matching_frame = tk.Frame(self.root, bg="#f0f0f0")
+        matching_frame.pack(expand=True, pady=20)
+        
+        left_frame = tk.Frame(matching_frame, bg="#f0f0f0")
+        left_frame.pack(side=tk.LEFT, padx=50)
+        
+        tk.Label(left_frame, text="Türkçe", font=self.fonts["large_bold"], bg="#f0f0f0").grid(row=0, pady=10)
+        
+        right_frame = tk.Frame(matching_frame, bg="#f0f0f0")
+        right_frame.pack(side=tk.RIGHT, padx=50)
+        
+        tk.Label(right_frame, text="İngilizce", font=self.fonts["large_bold"], bg="#f0f0f0").grid(row=0, pady=10)
+        
+        # Buton yuvaları bir kez oluşturulur, her grupta yeniden etiketlenir.
+        # Yuva -> o gruptaki kelime id'si
+        turkish_slots = {}
+        english_slots = {}
+        selected_turkish = [None]
+        
+        def on_turkish_click(btn):
+            word_id = turkish_slots[btn]
+            if session.is_matched(word_id):
                 return
             
-            words = word_groups[current_group_index[0]]
-            
-            self.clear_window()
-            
-            # Başlık ve ilerleme bilgisi
-            tk.Label(self.root, text="Eşleştirme Testi", 
-                    font=("Arial", 20, "bold"), bg="#f0f0f0").pack(pady=10)
-            
-            progress_text = f"Grup {current_group_index[0] + 1} / {len(word_groups)} ({len(words)} kelime)"
-            tk.Label(self.root, text=progress_text, 
-                    font=("Arial", 12, "bold"), bg="#f0f0f0", fg="#3498db").pack(pady=5)
-            
-            tk.Label(self.root, text="Sol taraftaki Türkçe kelimelere tıklayın, ardından eşleşen İngilizce kelimeye tıklayın", 
-                    font=("Arial", 11), bg="#f0f0f0", fg="#7f8c8d").pack(pady=5)
+            # Önceki seçimi temizle
+            if selected_turkish[0]:
+                prev_btn = selected_turkish[0]
+                if not session.is_matched(turkish_slots[prev_btn]):
+                    prev_btn.config(bg="#3498db")
             
-            # Kelimeleri karıştır
-            turkish_words = [(w[0], w[1]) for w in words]
-            english_words = [(w[0], w[2]) for w in words]
-            random.shuffle(english_words)
-            
-            # Eşleştirme frame'i
-            matching_frame = tk.Frame(self.root, bg="#f0f0f0")
-            matching_frame.pack(expand=True, pady=20)
-            
-            left_frame = tk.Frame(matching_frame, bg="#f0f0f0")
-            left_frame.pack(side=tk.LEFT, padx=50)
-            
-            tk.Label(left_frame, text="Türkçe", font=("Arial", 14, "bold"), bg="#f0f0f0").pack(pady=10)
-            
-            right_frame = tk.Frame(matching_frame, bg="#f0f0f0")
-            right_frame.pack(side=tk.RIGHT, padx=50)
-            
-            tk.Label(right_frame, text="İngilizce", font=("Arial", 14, "bold"), bg="#f0f0f0").pack(pady=10)
+            selected_turkish[0] = btn
+            btn.config(bg="#f39c12")
+        
+        def on_english_click(btn):
+            word_id = english_slots[btn]
+            if session.is_matched(word_id):
+                return
             
-            selected_turkish = [None]
-            matched_pairs = []
-            turkish_buttons = {}
-            english_buttons = {}
+            if not selected_turkish[0]:
+                messagebox.showinfo("Bilgi", "Önce sol taraftan bir Türkçe kelime seçin!")
+                return
             
-            def on_turkish_click(word_id, btn):
-                if word_id in [m[0] for m in matched_pairs]:
-                    return
-                
-                # Önceki seçimi temizle
-                if selected_turkish[0]:
-                    prev_id, prev_btn = selected_turkish[0]
-                    if prev_id not in [m[0] for m in matched_pairs]:
-                        prev_btn.config(bg="#3498db")
-                
-                selected_turkish[0] = (word_id, btn)
-                btn.config(bg="#f39c12")
+            turkish_btn = selected_turkish[0]
+            selected_turkish[0] = None
             
-            def on_english_click(word_id, btn):
-                if word_id in [m[1] for m in matched_pairs]:
-                    return
+            if session.submit((turkish_slots[turkish_btn], word_id)).correct:
+                # Doğru eşleştirme
+                turkish_btn.config(bg="#27ae60", state="disabled")
+                btn.config(bg="#27ae60", state="disabled")
                 
-                if not selected_turkish[0]:
-                    messagebox.showinfo("Bilgi", "Önce sol taraftan bir Türkçe kelime seçin!")
-                    return
-                
-                turkish_id, turkish_btn = selected_turkish[0]
-                
-                if turkish_id == word_id:
-                    # Doğru eşleştirme
-                    turkish_btn.config(bg="#27ae60", state="disabled")
-                    btn.config(bg="#27ae60", state="disabled")
-                    matched_pairs.append((turkish_id, word_id))
-                    total_correct[0] += 1
-                    selected_turkish[0] = None
-                    
-                    # Bu grup tamamlandı mı kontrol et
-                    if len(matched_pairs) == len(words):
-                        current_group_index[0] += 1
-                        
-                        if current_group_index[0] < len(word_groups):
-                            # Sonraki gruba geç
-                            messagebox.showinfo("Tebrikler!", 
-                                            f"Bu grubu tamamladınız! ({len(words)}/{len(words)} doğru)\n\n"
-                                            f"Şimdi sonraki {min(10, len(all_words) - current_group_index[0] * 10)} kelimeye geçiyoruz...")
-                            show_group()
-                        else:
-                            # Tüm test tamamlandı
-                            messagebox.showinfo("Tebrikler!", 
-                                            f"Tüm kelimeleri tamamladınız! ({total_correct[0]}/{len(all_words)} doğru)")
-                            show_group()  # Sonuç ekranını göster
-                else:
-                    # Yanlış eşleştirme
-                    turkish_btn.config(bg="#e74c3c")
-                    btn.config(bg="#e74c3c")
-                    self.root.after(500, lambda: [
-                        turkish_btn.config(bg="#3498db"),
-                        btn.config(bg="#3498db")
-                    ])
-                    selected_turkish[0] = None
+                # Bu grup tamamlandı mı kontrol et
+                if session.group_complete():
+                    group_length = len(session.current.turkish)
+                    if session.has_next():
+                        # Sonraki gruba geç
+                        messagebox.showinfo("Tebrikler!", 
+                                        f"Bu grubu tamamladınız! ({group_length}/{group_length} doğru)\n\n"
+                                        f"Şimdi sonraki {session.group_length(session.index + 1)} kelimeye geçiyoruz...")
+                    else:
+                        # Tüm test tamamlandı
+                        summary = session.summary()
+                        messagebox.showinfo("Tebrikler!", 
+                                        f"Tüm kelimeleri tamamladınız! ({summary.correct}/{summary.total} doğru)")
+                    show_group()
+            else:
+                # Yanlış eşleştirme
+                turkish_btn.config(bg="#e74c3c")
+                btn.config(bg="#e74c3c")
+                self.root.after(500, lambda: [
+                    b.config(bg="#3498db") for b in (turkish_btn, btn)
+                    if b.winfo_exists() and b["state"] == "normal"
+                ])
+        
+        for row in range(1, min(session.group_size, len(all_words)) + 1):
+            for frame, slots, handler in ((left_frame, turkish_slots, on_turkish_click),
+                                          (right_frame, english_slots, on_english_click)):
+                btn = tk.Button(frame, font=self.fonts["text"],
+                            bg="#3498db", fg="white", width=20, height=2)
+                btn.config(command=lambda b=btn, h=handler: h(b))
+                btn.grid(row=row, pady=5)
+                slots[btn] = None
+        
+        def show_group():
+            group = session.next_item()
+            if group is None:
+                # Tüm gruplar tamamlandı
+                self.show_results(session.summary(), "Eşleştirme Testi")
+                return
             
-            for word_id, turkish in turkish_words:
-                btn = tk.Button(left_frame, text=turkish, font=("Arial", 12),
-                            bg="#3498db", fg="white", width=20, height=2,
-                            command=lambda wid=word_id, b=None: on_turkish_click(wid, turkish_buttons[wid]))
-                btn.pack(pady=5)
-                turkish_buttons[word_id] = btn
-                btn.config(command=lambda wid=word_id, b=btn: on_turkish_click(wid, b))
+            progress_label.config(
+                text=f"Grup {group.number} / {len(session)} ({len(group.turkish)} kelime)")
             
-            for word_id, english in english_words:
-                btn = tk.Button(right_frame, text=english, font=("Arial", 12),
-                            bg="#3498db", fg="white", width=20, height=2,
-                            command=lambda wid=word_id, b=None: on_english_click(wid, english_buttons[wid]))
-                btn.pack(pady=5)
-                english_buttons[word_id] = btn
-                btn.config(command=lambda wid=word_id, b=btn: on_english_click(wid, b))
+            selected_turkish[0] = None
             
-            tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
-                    font=("Arial", 11), bg="#95a5a6", fg="white", width=15).pack(pady=20)
+            for slots, items in ((turkish_slots, group.turkish), (english_slots, group.english)):
+                for i, btn in enumerate(slots):
+                    if i < len(items):
+                        word_id, text = items[i]
+                        slots[btn] = word_id
+                        btn.config(text=text, bg="#3498db", state="normal")
+                        btn.grid()
+                    else:
+                        # Son grup daha kısa olabilir
+                        slots[btn] = None
+                        btn.grid_remove()
+        
+        show_group = self.instruments.transition("matching", show_group)
+        
+        tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
+                font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=20)
         
         # İlk grubu göster
         show_group()
 
-    def show_results(self, correct, total, test_name):
+    def show_results(self, summary, test_name):
+        # Oturum bitti: bekleyen cevapları hemen yaz
+        self.flush_answers()
         self.clear_window()
         
-        percentage = (correct / total) * 100
+        correct, total = summary.correct, summary.total
+        # Boş oturumda (kelimesiz set ya da deste) oran gösterilmez
+        percentage = (correct / total) * 100 if total else 0
         
         tk.Label(self.root, text="Test Tamamlandı!", 
-                font=("Arial", 24, "bold"), bg="#f0f0f0", fg="#2c3e50").pack(pady=30)
+                font=self.fonts["title"], bg="#f0f0f0", fg="#2c3e50").pack(pady=30)
         
         tk.Label(self.root, text=test_name, 
-                font=("Arial", 16), bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
+                font=self.fonts["entry"], bg="#f0f0f0", fg="#7f8c8d").pack(pady=10)
         
         result_frame = tk.Frame(self.root, bg="white", relief=tk.RIDGE, bd=3)
         result_frame.pack(pady=30, padx=100)
         
         tk.Label(result_frame, text=f"Doğru: {correct} / {total}", 
-                font=("Arial", 18, "bold"), bg="white", fg="#27ae60").pack(pady=15, padx=50)
+                font=self.fonts["result"], bg="white", fg="#27ae60").pack(pady=15, padx=50)
         
-        tk.Label(result_frame, text=f"Başarı Oranı: %{percentage:.1f}", 
-                font=("Arial", 18, "bold"), bg="white", fg="#3498db").pack(pady=15, padx=50)
+        tk.Label(result_frame, text=f"Başarı Oranı: %{percentage:.1f}" if total else "Başarı Oranı: -", 
+                font=self.fonts["result"], bg="white", fg="#3498db").pack(pady=15, padx=50)
         ## hatalıları gösterme ##
         tk.Label(result_frame, text="Hatalı Kelimeler:", 
-                font=("Arial", 16, "bold"), bg="white", fg="#e74c3c").pack(pady=10, padx=50)
-        # Hatalı kelimeleri listele
-        # Bu kısmı kullanıcı cevaplarını sakladığınız yere göre uyarlayın -- eklenecek
+                font=self.fonts["entry_bold"], bg="white", fg="#e74c3c").pack(pady=10, padx=50)
+        if summary.mistakes:
+            mistakes_frame = tk.Frame(result_frame, bg="white")
+            mistakes_frame.pack(pady=(0, 15), padx=50)
+            mistake_list = tk.Listbox(mistakes_frame, font=self.fonts["body"], width=45,
+                                      height=min(len(summary.mistakes), 8), bd=0)
+            scrollbar = tk.Scrollbar(mistakes_frame, orient="vertical", command=mistake_list.yview)
+            mistake_list.configure(yscrollcommand=scrollbar.set)
+            for _, turkish, english, *_ in summary.mistakes:
+                mistake_list.insert(tk.END, f"{turkish} → {english}")
+            mistake_list.pack(side=tk.LEFT)
+            if len(summary.mistakes) > 8:
+                scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        else:
+            tk.Label(result_frame, text="Yok 🎉", font=self.fonts["body"],
+                    bg="white", fg="#27ae60").pack(pady=(0, 15), padx=50)
 
         if percentage >= 80:
             emoji = "🎉"
@@ -1053,21 +1522,228 @@ class VocabApp:
             message = "Pratik yapmaya devam edin!"
         
         tk.Label(self.root, text=f"{emoji} {message}", 
-                font=("Arial", 14), bg="#f0f0f0", fg="#2c3e50").pack(pady=20)
+                font=self.fonts["large"], bg="#f0f0f0", fg="#2c3e50").pack(pady=20)
         
         button_frame = tk.Frame(self.root, bg="#f0f0f0")
         button_frame.pack(pady=20)
         
         tk.Button(button_frame, text="🔄 Tekrar Dene", command=lambda: self.show_main_menu(),
-                 font=("Arial", 12), bg="#3498db", fg="white", width=20).pack(side=tk.LEFT, padx=10)
+                 font=self.fonts["text"], bg="#3498db", fg="white", width=20).pack(side=tk.LEFT, padx=10)
         
         tk.Button(button_frame, text="🏠 Ana Menü", command=self.show_main_menu,
-                 font=("Arial", 12), bg="#2ecc71", fg="white", width=20).pack(side=tk.LEFT, padx=10)
+                 font=self.fonts["text"], bg="#2ecc71", fg="white", width=20).pack(side=tk.LEFT, padx=10)
+    
+    def show_statistics(self):
+        # Bekleyen cevaplar önce özetlere işlensin (worker işleri sırayla çalışır)
+        self.flush_answers()
+        self.load_screen("İstatistikler yükleniyor...", stats.dashboard,
+                         on_done=self.show_statistics_screen)
     
-    def __del__(self):
-        self.conn.close()
+    def show_statistics_screen(self, dashboard):
+        """Doğruluk, seri, öğrenilen kelimeler, günlük etkinlik ve set bazında ilerleme"""
+        self.clear_window()
+        
+        tk.Label(self.root, text="📊 İstatistikler", 
+                font=self.fonts["heading"], bg="#f0f0f0").pack(pady=15)
+        
+        answers = sum(mode.answers for mode in dashboard.modes)
+        correct = sum(mode.correct for mode in dashboard.modes)
+        timed = sum(mode.timed for mode in dashboard.modes)
+        response_ms = sum(mode.response_ms for mode in dashboard.modes)
+        word_count = sum(row.word_count for row in dashboard.sets)
+        seen = sum(row.seen for row in dashboard.sets)
+        learned = sum(row.learned for row in dashboard.sets)
+        
+        summary_frame = tk.Frame(self.root, bg="#f0f0f0")
+        summary_frame.pack(pady=5)
+        cards = [
+            ("Doğruluk", f"%{correct / answers * 100:.1f}" if answers else "—", f"{answers} cevap"),
+            ("Ort. cevap süresi", f"{response_ms / timed / 1000:.1f} sn" if timed else "—", ""),
+            ("🔥 Seri", f"{dashboard.streak} gün", f"en uzun {dashboard.best_streak} gün"),
+            ("Kelimeler", f"{learned} öğrenildi", f"{seen - learned} çalışılıyor • {word_count - seen} yeni"),
+        ]
+        for title, value, detail in cards:
+            card = tk.Frame(summary_frame, bg="white", relief=tk.RIDGE, bd=2)
+            card.pack(side=tk.LEFT, padx=8)
+            tk.Label(card, text=title, font=self.fonts["small"], bg="white", fg="#7f8c8d").pack(padx=15, pady=(8, 0))
+            tk.Label(card, text=value, font=self.fonts["large_bold"], bg="white", fg="#2c3e50").pack(padx=15)
+            tk.Label(card, text=detail, font=self.fonts["small"], bg="white", fg="#7f8c8d").pack(padx=15, pady=(0, 8))
+        
+        # Mod bazında doğruluk
+        mode_frame = tk.Frame(self.root, bg="#f0f0f0")
+        mode_frame.pack(pady=10)
+        for mode in dashboard.modes:
+            tk.Label(mode_frame, text=f"{MODE_NAMES.get(mode.mode, mode.mode)}: "
+                                      f"%{mode.correct / mode.answers * 100:.0f} ({mode.answers})",
+                    font=self.fonts["body"], bg="#f0f0f0", fg="#2c3e50").pack(side=tk.LEFT, padx=10)
+        
+        chart = tk.Canvas(self.root, width=820, height=190, bg="white", highlightthickness=0)
+        chart.pack(pady=5)
+        self.draw_activity_chart(chart, dashboard.days, 820, 190)
+        
+        # Set bazında ilerleme
+        list_frame = tk.Frame(self.root, bg="white", relief=tk.RIDGE, bd=2)
+        list_frame.pack(pady=10, padx=50, fill=tk.BOTH, expand=True)
+        
+        def create_row(parent):
+            row = tk.Frame(parent, bg="white")
+            row.name_label = tk.Label(row, font=self.fonts["text_bold"], bg="white", anchor="w")
+            row.name_label.pack(side=tk.LEFT, padx=10)
+            row.info_label = tk.Label(row, font=self.fonts["body"], bg="white", fg="#7f8c8d", anchor="e")
+            row.info_label.pack(side=tk.RIGHT, padx=10)
+            return row
+        
+        def bind_row(row, index, item):
+            accuracy = f"%{item.correct / item.answers * 100:.0f} doğru" if item.answers else "henüz çalışılmadı"
+            row.name_label.config(text=item.name)
+            row.info_label.config(text=f"{accuracy} • {item.learned}/{item.word_count} öğrenildi • "
+                                       f"{item.word_count - item.seen} yeni")
+        
+        VirtualList(list_frame, dashboard.sets, create_row, bind_row,
+                    row_height=32).pack(fill=tk.BOTH, expand=True)
+        
+        tk.Button(self.root, text="🔙 Ana Menü", command=self.show_main_menu,
+                 font=self.fonts["body"], bg="#95a5a6", fg="white", width=15).pack(pady=10)
+    
+    def draw_activity_chart(self, canvas, days, width, height, count=CHART_DAYS):
+        """Son count günün cevap sayıları (gri) ve doğruları (yeşil) çubuk grafik olarak"""
+        by_day = {day.day: day for day in days}
+        today = date.today()
+        shown = [today - timedelta(days=offset) for offset in range(count - 1, -1, -1)]
+        values = [by_day.get(day.strftime(stats.DAY_FORMAT)) for day in shown]
+        top = max([value.answers for value in values if value] + [1])
+        
+        left, bottom, plot_top = 40, height - 25, 20
+        slot = (width - left - 10) / count
+        canvas.create_text(left - 5, plot_top, text=str(top), anchor="e", font=self.fonts["small"])
+        canvas.create_text(left - 5, bottom, text="0", anchor="e", font=self.fonts["small"])
+        canvas.create_line(left, bottom, width - 10, bottom, fill="#bdc3c7")
+        canvas.create_text(width / 2, 8, text=f"Son {count} gün", font=self.fonts["small"], fill="#7f8c8d")
+        for index, (day, value) in enumerate(zip(shown, values)):
+            x0 = left + index * slot + 2
+            x1 = x0 + slot - 4
+            if value:
+                scale = (bottom - plot_top) / top
+                canvas.create_rectangle(x0, bottom - value.answers * scale, x1, bottom,
+                                        fill="#bdc3c7", outline="")
+                canvas.create_rectangle(x0, bottom - value.correct * scale, x1, bottom,
+                                        fill="#2ecc71", outline="")
+            if index % 5 == 0 or index == count - 1:
+                canvas.create_text((x0 + x1) / 2, bottom + 12, text=day.strftime("%d.%m"),
+                                   font=self.fonts["small"], fill="#7f8c8d")
+    
+    def show_diagnostics(self):
+        """Gizli ekran (Ctrl+Shift+D): açılış aşamaları ve --instrument ölçümleri"""
+        self.clear_window()
+        
+        tk.Label(self.root, text="🛠 Tanılama", font=self.fonts["heading"],
+                bg="#f0f0f0").pack(pady=15)
+        
+        text = tk.Text(self.root, font=self.fonts["mono"], wrap=tk.NONE, bg="white")
+        text.pack(fill=tk.BOTH, expand=True, padx=20)
+        
+        lines = ["Açılış"]
+        lines += [f"  {name:<22}{ms:8.1f} ms" for name, ms in self.startup.phases]
+        cache = self.repo.stats()
+        lines += ["", "Set önbelleği",
+                  f"  {cache['hits']} isabet, {cache['misses']} ıska • {cache['entries']} kayıt "
+                  f"({cache['rows']} satır) • {cache['evictions']} çıkarma, "
+                  f"{cache['invalidations']} geçersiz kılma"]
+        if not self.instruments.enabled:
+            lines += ["", "Ölçüm kapalı: python VocabularyAPP.py --instrument"]
+        else:
+            snapshot = self.instruments.snapshot()
+            for title, table in (("SQL ifadeleri", "statements"), ("Worker işleri", "jobs"),
+                                 ("Ekranlar", "screens"), ("Geçişler", "transitions")):
+                lines += ["", title] + ["  " + line for line in format_table(snapshot[table])]
+        text.insert("1.0", "\n".join(lines))
+        text.config(state="disabled")
+        
+        def save_json():
+            path = filedialog.asksaveasfilename(defaultextension=".json",
+                                                filetypes=[("JSON", "*.json")])
+            if path:
+                self.instruments.dump(path, startup=dict(self.startup.phases), cache=self.repo.stats())
+        
+        def reset():
+            self.instruments.reset()
+            self.show_diagnostics()
+        
+        button_frame = tk.Frame(self.root, bg="#f0f0f0")
+        button_frame.pack(pady=15)
+        buttons = [("🔄 Yenile", self.show_diagnostics, "#3498db")]
+        if self.instruments.enabled:
+            buttons += [("💾 JSON Kaydet", save_json, "#27ae60"), ("🧹 Sıfırla", reset, "#e67e22")]
+        buttons.append(("🔙 Ana Menü", self.show_main_menu, "#95a5a6"))
+        for label, command, color in buttons:
+            tk.Button(button_frame, text=label, command=command, font=self.fonts["body"],
+                     bg=color, fg="white", width=14).pack(side=tk.LEFT, padx=5)
+    
+    def flush_answers(self):
+        """Cevap tamponunu worker'da diske yaz"""
+        if len(self.answer_log):
+            self.db.submit(self.answer_log.flush, on_done=self.answers_flushed,
+                           on_error=self.flush_failed)
+    
+    def answers_flushed(self, _):
+        self.flush_failing = False
+    
+    def flush_failed(self, exc):
+        """Kayıtlar tamponda kalıp tekrar denenir; hata her denemede değil, bir kez gösterilir"""
+        if not self.flush_failing:
+            self.flush_failing = True
+            self.show_db_error(exc)
+    
+    def schedule_flush(self):
+        """Cevap tamponunu FLUSH_INTERVAL_MS aralıklarla diske yaz"""
+        self.flush_answers()
+        self.root.after(FLUSH_INTERVAL_MS, self.schedule_flush)
+    
+    def on_close(self):
+        if self.active_job:
+            self.active_job.cancel()
+        # Normal çıkışta tampondaki cevaplar kaybolmasın; worker kuyruğu bitirip kapanır
+        self.flush_answers()
+        self.db.close()
+        self.root.destroy()
 
-if __name__ == "__main__":
+
+def describe_rows(value):
+    """run_with_progress için (yazılan, toplam) -> (metin, oran)"""
+    done, total = value
+    return f"{done} / {total} satır yazıldı", done / total if total else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vocabulary APP")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="Açılış aşamalarının sürelerini yazdır ve çık; bütçe aşılırsa çıkış kodu 1")
+    parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument('--instrument', action='store_true',
+                        help="SQL, ekran ve geçiş sürelerini ölç (Ctrl+Shift+D ile görüntülenir)")
+    parser.add_argument('--instrument-out', metavar='JSON',
+                        help="Ölçümleri çıkışta bu dosyaya yaz (--instrument'ı da açar)")
+    args = parser.parse_args(argv)
+    
+    startup = StartupProfile(IMPORT_STARTED)
+    startup.mark("içe aktarma")
+    instruments = Instruments(enabled=args.instrument or bool(args.instrument_out))
     root = tk.Tk()
-    app = VocabApp(root)
-    root.mainloop() 
\ No newline at end of file
+    startup.mark("Tk penceresi")
+    app = VocabApp(root, startup, instruments)
+    if not args.profile_startup:
+        root.mainloop()
+        if args.instrument_out:
+            instruments.dump(args.instrument_out, startup=dict(startup.phases), cache=app.repo.stats())
+        return 0
+    
+    # Bekleyen çizim olayları işlendiğinde ana menü etkileşime hazırdır
+    root.update()
+    startup.mark("ilk çizim")
+    print(startup.format(args.budget_ms))
+    app.on_close()
+    return 0 if startup.total_ms <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Cevap kayıtları için arkadan yazma (write-behind) katmanı.
+
+Ekranlar her cevapta yalnızca bellekteki tampona ekleme yapar. Tampon
+belirli aralıklarla, oturum sonunda ve pencere kapanırken tek bir
+transaction ile answer_events tablosuna yazılır; böylece tıklama başına
+INSERT + commit (ve fsync) yapılmaz.
+
+Kanca (hook) fonksiyonları aynı transaction içinde çalışır ve türetilmiş
+tabloları (ör. review_state) güncel tutar: hook(cursor, events).
+
+record() Tk iş parçacığından, flush() ise veritabanı worker'ından
+çağrılabilir; tampon bir kilitle korunur.
+"""
+import threading
+from collections import deque, namedtuple
+from datetime import datetime
+
+Event = namedtuple("Event", "word_id mode correct response_ms answered_at")
+
+# Tampon bu kadar dolunca zamanlayıcı beklenmeden yazılır
+DEFAULT_CAPACITY = 4096
+
+
+class AnswerLog:
+    def __init__(self, conn=None, capacity=DEFAULT_CAPACITY, hooks=(), on_full=None):
+        self.conn = conn
+        self.capacity = capacity
+        self.hooks = list(hooks)
+        # Tampon dolunca flush yerine çağrılır (ör. yazmayı worker'a göndermek için)
+        self.on_full = on_full
+        self.buffer = deque()
+        self.lock = threading.Lock()
+        # Tampon dolduğu için flush istendi ama henüz başlamadı; flush
+        # başlayana kadar gelen cevaplar yeni bir flush işi istemez
+        self.flush_pending = False
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def record(self, word_id, mode, correct, response_ms=None, answered_at=None):
+        answered_at = answered_at or datetime.now()
+        with self.lock:
+            self.buffer.append(Event(word_id, mode, bool(correct), response_ms, answered_at))
+            full = len(self.buffer) >= self.capacity and not self.flush_pending
+            if full:
+                self.flush_pending = True
+        if full:
+            if self.on_full:
+                self.on_full()
+            else:
+                self.flush()
+
+    def flush(self, conn=None):
+        """Tampondaki kayıtları tek transaction'da yazar, yazılan sayıyı döndürür."""
+        conn = conn or self.conn
+        with self.lock:
+            self.flush_pending = False
+            events = list(self.buffer)
+        if not events:
+            return 0
+
+        cursor = conn.cursor()
+        try:
+            cursor.executemany('''
+                INSERT INTO answer_events (word_id, set_id, mode, correct, response_ms, answered_at)
+                VALUES (?, (SELECT set_id FROM words WHERE id = ?), ?, ?, ?, ?)
+            ''', [(e.word_id, e.word_id, e.mode, int(e.correct), e.response_ms,
+                   e.answered_at.strftime("%Y-%m-%d %H:%M:%S")) for e in events])
+            for hook in self.hooks:
+                hook(cursor, events)
+        except Exception:
+            # Kayıtlar tamponda kalır, bir sonraki flush'ta tekrar denenir
+            conn.rollback()
+            raise
+        conn.commit()
+
+        # flush sırasında eklenenler korunur
+        with self.lock:
+            for _ in events:
+                self.buffer.popleft()
+        return len(events)
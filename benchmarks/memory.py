@@ -0,0 +1,89 @@
+"""Kelime başına bellek: fetchall() demet listesi ile WordStore karşılaştırması.
+
+Ölçeğin (varsayılan 1m) tüm kelimeleri iki şekilde yüklenir ve her birinin
+üzerine bir oturum sırası kurulur:
+
+    tuples   fetchall() + oturumun karıştırılmış liste kopyası (eski yol)
+    store    WordStore.from_cursor + word_store.shuffled görünümü
+
+tracemalloc ile yüklemeden sonra kalan ve yükleme sırasındaki en yüksek
+bellek ölçülür; sonuçlar kelime başına bayt olarak JSON yazılır.
+
+Kullanım: python memory.py [--scale 1m] [--out bellek.json]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import schema
+import synthetic
+import word_store
+from word_store import WordStore
+
+QUERY = 'SELECT id, turkish, english FROM words'
+
+
+def load_tuples(conn):
+    words = conn.execute(QUERY).fetchall()
+    session = list(words)
+    random.Random(1).shuffle(session)
+    return words, session
+
+
+def load_store(conn):
+    words = WordStore.from_cursor(conn.execute(QUERY))
+    return words, word_store.shuffled(words, random.Random(1))
+
+
+def measure(conn, load):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    loaded = load(conn)
+    elapsed = (time.perf_counter() - started) * 1000
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(loaded[0])
+    del loaded
+    return {"words": count, "bytes_per_word": round(current / count, 1),
+            "peak_bytes_per_word": round(peak / count, 1), "load_ms": round(elapsed, 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kelime başına bellek ölçümü")
+    parser.add_argument('--scale', default="1m", choices=list(synthetic.SCALES))
+    parser.add_argument('--workdir', default=synthetic.DEFAULT_WORKDIR)
+    parser.add_argument('--seed', type=int, default=synthetic.SEED)
+    parser.add_argument('--out', help="Sonuç dosyası (verilmezse stdout)")
+    args = parser.parse_args(argv)
+
+    db_path, _ = synthetic.build(args.scale, args.workdir, args.seed)
+    conn = schema.connect(db_path)
+    try:
+        results = {"tuples": measure(conn, load_tuples), "store": measure(conn, load_store)}
+    finally:
+        conn.close()
+    results["factor"] = round(results["tuples"]["bytes_per_word"] / results["store"]["bytes_per_word"], 2)
+
+    for name in ("tuples", "store"):
+        result = results[name]
+        print(f"  {name:<7}{result['bytes_per_word']:>8.1f} B/kelime (en yüksek "
+              f"{result['peak_bytes_per_word']:.1f}), {result['load_ms']:.0f} ms", file=sys.stderr)
+    print(f"  {results['factor']:.2f} kat daha az bellek", file=sys.stderr)
+
+    text = json.dumps({"scale": args.scale, "seed": args.seed, **results}, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
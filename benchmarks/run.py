@@ -0,0 +1,267 @@
+"""Sıcak yolların benchmark'ı; sonuçlar commit'ler arasında karşılaştırılabilir JSON.
+
+Her ölçek için synthetic.py'nin ürettiği veritabanında (yoksa üretilir)
+aşağıdaki işler --repeat kez ölçülür. Kurulum (set seçimi, dosya
+kopyalama vb.) süreye dahil değildir; sonuçta en küçük, ortanca ve
+ortalama süre milisaniye olarak yazılır.
+
+    set_summaries       show_word_sets / select_set_for_practice listesi
+    flashcard_load      start_flashcard: set kelimeleri + FlashcardSession
+    flashcard_cached    aynı set ikinci kez (WordRepository önbelleğinden)
+    flashcard_deck      aynı iş sayfalı desteyle (büyük setlerin yolu; ilk sayfa)
+    all_sets_sample     tüm setlerden orantılı 200 kelimelik oturum listesi
+    choice_distractors  show_multiple_choice: tüm soruların seçenekleri
+    choice_hard         zor mod: SimilarityIndex + tüm soruların seçenekleri
+    edit_set_save       edit_set kaydı (%10 güncelleme, %5 silme, 5 ekleme)
+    import_json         dict_to_database.py ile boş veritabanına aktarım
+    import_unchanged    değişmemiş JSON'un yeniden aktarımı (özet karşılaştırma)
+
+Ağır işler (aktarımlar) --heavy-repeat kez ölçülür. --compare ile önceki
+bir sonuç dosyasına göre ortanca süresi --threshold oranından fazla artan
+işler listelenir ve çıkış kodu 1 olur.
+
+Kullanım: python run.py [--scales 1k,10k,100k] [--repeat 5] [--out sonuc.json]
+                        [--compare onceki.json] [--threshold 0.25]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import deck
+import queries
+import schema
+import synthetic
+from dict_to_database.dict_to_database import import_json
+from quiz_engine import FlashcardSession, MultipleChoiceSession
+from repository import WordRepository
+from similarity import SimilarityIndex
+
+# Ölçülen işler: (ad, kurulum fonksiyonu, ağır mı). Kurulum fonksiyonu
+# süreye dahil olmayan hazırlığı yapar ve ölçülecek fonksiyonu döndürür.
+BENCHMARKS = []
+# Karşılaştırmada bu kadarlık (ms) farklar gürültü sayılır
+NOISE_MS = 1.0
+
+
+def benchmark(name, heavy=False):
+    def register(setup):
+        BENCHMARKS.append((name, setup, heavy))
+        return setup
+    return register
+
+
+class Context:
+    """Bir ölçeğin dosyaları, bağlantıları ve sırayla seçilen set id'leri"""
+
+    def __init__(self, db_path, json_path, workdir):
+        self.db_path = db_path
+        self.json_path = json_path
+        self.workdir = workdir
+        self.conn = schema.connect(db_path)
+        self.repo = WordRepository()
+        # Yazan işler asıl veritabanını değiştirmesin
+        self.scratch_path = os.path.join(workdir, "scratch.db")
+        shutil.copyfile(db_path, self.scratch_path)
+        self.scratch = schema.connect(self.scratch_path)
+        # Set boyutları eşit; her tekrarda farklı bir set kullanılır
+        self.set_ids = [row[0] for row in self.conn.execute('SELECT id FROM word_sets ORDER BY id')]
+        self.turn = 0
+
+    def next_set(self):
+        self.turn += 1
+        return self.set_ids[(self.turn * 7919) % len(self.set_ids)]
+
+    def close(self):
+        self.conn.close()
+        self.scratch.close()
+        os.remove(self.scratch_path)
+
+
+@benchmark("set_summaries")
+def set_summaries(ctx):
+    return lambda: queries.set_summaries(ctx.conn)
+
+
+@benchmark("flashcard_load")
+def flashcard_load(ctx):
+    set_id = ctx.next_set()
+    return lambda: FlashcardSession(queries.set_words(ctx.conn, set_id), "mixed", seed=1)
+
+
+@benchmark("flashcard_deck")
+def flashcard_deck(ctx):
+    set_id = ctx.next_set()
+    return lambda: FlashcardSession(deck.open_deck(ctx.conn, set_id, seed=1), "mixed", seed=1)
+
+
+@benchmark("flashcard_cached")
+def flashcard_cached(ctx):
+    set_id = ctx.next_set()
+    ctx.repo.set_words(ctx.conn, set_id)
+    return lambda: FlashcardSession(ctx.repo.set_words(ctx.conn, set_id), "mixed", seed=1)
+
+
+@benchmark("all_sets_sample")
+def all_sets_sample(ctx):
+    counts = ctx.repo.word_counts(ctx.conn)
+    ctx.turn += 1
+    return lambda: FlashcardSession(deck.sample_sets(ctx.conn, counts, 200, seed=ctx.turn), "mixed", seed=1)
+
+
+def _answer_all(session):
+    while session.next_item() is not None:
+        pass
+
+
+@benchmark("choice_distractors")
+def choice_distractors(ctx):
+    words = queries.set_words(ctx.conn, ctx.next_set())
+    return lambda: _answer_all(MultipleChoiceSession(words, seed=1))
+
+
+@benchmark("choice_hard")
+def choice_hard(ctx):
+    words = queries.set_words(ctx.conn, ctx.next_set())
+    return lambda: _answer_all(MultipleChoiceSession(words, seed=1, similarity=SimilarityIndex(words)))
+
+
+@benchmark("edit_set_save")
+def edit_set_save(ctx):
+    set_id = ctx.next_set()
+    _, rows = queries.set_contents(ctx.scratch, set_id)
+    updates = [(turkish + " x", english, word_id) for word_id, turkish, english in rows[::10]]
+    deletes = [word_id for word_id, _, _ in rows[5::20]]
+    inserts = [(set_id, f"yeni {ctx.turn} {i}", f"new-{ctx.turn}-{i}") for i in range(5)]
+    return lambda: queries.save_set_changes(ctx.scratch, set_id, None, deletes, [], updates, inserts)
+
+
+@benchmark("import_json", heavy=True)
+def import_into_empty(ctx):
+    path = os.path.join(ctx.workdir, "import.db")
+    if os.path.exists(path):
+        os.remove(path)
+
+    def run():
+        conn = schema.connect(path)
+        import_json(conn, ctx.json_path)
+        conn.close()
+    return run
+
+
+@benchmark("import_unchanged", heavy=True)
+def import_unchanged(ctx):
+    return lambda: import_json(ctx.conn, ctx.json_path)
+
+
+def measure(ctx, setup, repeat):
+    times = []
+    for _ in range(repeat):
+        func = setup(ctx)
+        started = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - started) * 1000)
+    return {"min_ms": round(min(times), 3), "median_ms": round(statistics.median(times), 3),
+            "mean_ms": round(statistics.fmean(times), 3), "runs": len(times)}
+
+
+def run_scale(scale, args, only):
+    db_path, json_path = synthetic.build(scale, args.workdir, args.seed)
+    ctx = Context(db_path, json_path, args.workdir)
+    results = {}
+    try:
+        for name, setup, heavy in BENCHMARKS:
+            if only and name not in only:
+                continue
+            results[name] = measure(ctx, setup, args.heavy_repeat if heavy else args.repeat)
+            print(f"  {scale:>5} {name:<20}{results[name]['median_ms']:>12.2f} ms", file=sys.stderr)
+    finally:
+        ctx.close()
+        import_db = os.path.join(args.workdir, "import.db")
+        if os.path.exists(import_db):
+            os.remove(import_db)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold):
+    """Ortanca süresi threshold oranından (ve NOISE_MS'den) fazla artan işler"""
+    regressions = []
+    for scale, results in current["results"].items():
+        for name, result in results.items():
+            old = baseline.get("results", {}).get(scale, {}).get(name)
+            if old is None:
+                continue
+            before, after = old["median_ms"], result["median_ms"]
+            if after > before * (1 + threshold) and after - before > NOISE_MS:
+                regressions.append((scale, name, before, after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vocabulary APP benchmark'ları")
+    parser.add_argument('--scales', default="1k,10k,100k",
+                        help=f"Virgülle ayrılmış ölçekler ({', '.join(synthetic.SCALES)})")
+    parser.add_argument('--only', help="Yalnızca bu işler (virgülle ayrılmış)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--heavy-repeat', type=int, default=1)
+    parser.add_argument('--workdir', default=synthetic.DEFAULT_WORKDIR)
+    parser.add_argument('--seed', type=int, default=synthetic.SEED)
+    parser.add_argument('--out', help="Sonuç dosyası (verilmezse stdout)")
+    parser.add_argument('--compare', help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument('--threshold', type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    scales = args.scales.split(",")
+    unknown = [scale for scale in scales if scale not in synthetic.SCALES]
+    if unknown:
+        parser.error(f"bilinmeyen ölçek: {', '.join(unknown)}")
+    only = set(args.only.split(",")) if args.only else None
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "results": {scale: run_scale(scale, args, only) for scale in scales},
+    }
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for scale, name, before, after in regressions:
+            print(f"✗ {scale} {name}: {before:.2f} ms -> {after:.2f} ms", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"✓ {baseline.get('commit')} sonucuna göre gerileme yok", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Açılış bütçesi kontrolü: --profile-startup'ı sentetik veritabanıyla ekransız çalıştırır.
+
+VocabularyAPP.py her tekrarda ayrı bir süreçte (içe aktarmalar dahil)
+`--profile-startup` ile başlatılır; çalışma klasörüne synthetic.py'nin
+ürettiği veritabanının bir kopyası dictionary.db olarak konur. Toplam
+sürelerin ortancası STARTUP_BUDGET_MS'i (ya da --budget-ms) aşarsa çıkış
+kodu 1 olur. Ekran yoksa (DISPLAY boş) Tk penceresi xvfb-run altında
+açılır; xvfb-run da yoksa ölçüm yapılamaz ve çıkış kodu 2 olur.
+
+Kullanım: python startup.py [--scale 100k] [--repeat 3] [--budget-ms 800]
+"""
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import synthetic
+
+APP = os.path.join(ROOT, "VocabularyAPP.py")
+# StartupProfile.format'ın son satırı
+TOTAL = re.compile(r"^toplam\s+([\d.]+) ms", re.MULTILINE)
+
+
+def read_budget():
+    # VocabularyAPP içe aktarılmaz: tkinter ve modüller ölçülen süreçte yüklenmeli
+    with open(APP, encoding="utf-8") as f:
+        return float(re.search(r"^STARTUP_BUDGET_MS = ([\d.]+)", f.read(), re.MULTILINE).group(1))
+
+
+def display_prefix():
+    """Tk penceresi için komut öneki; ekran yoksa xvfb-run, o da yoksa None"""
+    if sys.platform != "linux" or os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+        return []
+    if shutil.which("xvfb-run"):
+        return ["xvfb-run", "-a"]
+    return None
+
+
+def profile(prefix, workdir, budget_ms):
+    """Bir açılış; (toplam ms, aşama tablosu)"""
+    result = subprocess.run([*prefix, sys.executable, APP, "--profile-startup", "--budget-ms", str(budget_ms)],
+                            cwd=workdir, capture_output=True, text=True, encoding="utf-8")
+    match = TOTAL.search(result.stdout)
+    if match is None:
+        raise RuntimeError(f"--profile-startup çıktısı okunamadı:\n{result.stdout}{result.stderr}")
+    return float(match.group(1)), result.stdout.rstrip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Açılış süresi bütçe kontrolü")
+    parser.add_argument('--scale', default="100k", choices=list(synthetic.SCALES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--budget-ms', type=float, help="Verilmezse VocabularyAPP.STARTUP_BUDGET_MS")
+    parser.add_argument('--workdir', default=synthetic.DEFAULT_WORKDIR)
+    parser.add_argument('--seed', type=int, default=synthetic.SEED)
+    args = parser.parse_args(argv)
+    budget_ms = args.budget_ms if args.budget_ms is not None else read_budget()
+
+    prefix = display_prefix()
+    if prefix is None:
+        print("✗ ekran yok ve xvfb-run bulunamadı; açılış ölçülemedi", file=sys.stderr)
+        return 2
+
+    db_path, _ = synthetic.build(args.scale, args.workdir, args.seed)
+    # Uygulama dictionary.db'yi çalışma klasöründe açar
+    workdir = os.path.join(args.workdir, "startup")
+    os.makedirs(workdir, exist_ok=True)
+    shutil.copyfile(db_path, os.path.join(workdir, "dictionary.db"))
+
+    totals = []
+    for _ in range(args.repeat):
+        total, table = profile(prefix, workdir, budget_ms)
+        totals.append(total)
+    # Aşamalar son çalıştırmadan
+    print(table, file=sys.stderr)
+    median = statistics.median(totals)
+    runs = ", ".join(f"{total:.0f}" for total in totals)
+    if median > budget_ms:
+        print(f"✗ {args.scale}: ortanca {median:.1f} ms > bütçe {budget_ms:.0f} ms ({runs})", file=sys.stderr)
+        return 1
+    print(f"✓ {args.scale}: ortanca {median:.1f} ms <= bütçe {budget_ms:.0f} ms ({runs})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Benchmark'lar için sentetik sozluk.json ve dictionary.db üretir.
+
+Kelimeler sabit bir seed ile üretilir; aynı ölçek ve seed her seferinde
+birebir aynı dosyayı verir. Setler ortak bir kelime havuzundan seçildiği
+için gerçek sözlükteki gibi setler arası tekrarlar da bulunur. Veritabanı
+dict_to_database.import_json ile, yani uygulamanın kendi aktarım yoluyla
+kurulur.
+
+Kullanım: python synthetic.py 10k [100k ...] [--workdir data] [--seed 1] [--force]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import schema
+from dict_to_database.dict_to_database import import_json
+
+# Ölçek adı -> (set sayısı, kelime sayısı)
+SCALES = {
+    "1k": (10, 1_000),
+    "10k": (100, 10_000),
+    "100k": (1_000, 100_000),
+    "1m": (10_000, 1_000_000),
+}
+SEED = 1
+DEFAULT_WORKDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+ENGLISH_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+TURKISH_LETTERS = "abcçdefgğhıijklmnoöprsştuüvyz"
+
+
+def pseudo_word(rng, letters, low=3, high=10):
+    return "".join(rng.choices(letters, k=rng.randint(low, high)))
+
+
+def vocabulary(rng, size):
+    """Benzersiz İngilizce kelimeler ve Türkçe karşılıkları: [(english, turkish), ...].
+    Türkçelerin bir kısmı iki kelimeli ya da virgülle ayrılmış karşılık listesidir."""
+    seen = set()
+    pairs = []
+    while len(pairs) < size:
+        english = pseudo_word(rng, ENGLISH_LETTERS, 3, 11)
+        if english in seen:
+            continue
+        seen.add(english)
+        turkish = pseudo_word(rng, TURKISH_LETTERS)
+        roll = rng.random()
+        if roll < 0.25:
+            turkish += " " + pseudo_word(rng, TURKISH_LETTERS, 3, 7)
+        elif roll < 0.35:
+            turkish += ", " + pseudo_word(rng, TURKISH_LETTERS)
+        pairs.append((english, turkish))
+    return pairs
+
+
+def iter_sets(set_count, word_count, seed=SEED):
+    """(set adı, [(english, turkish), ...]); toplam kelime sayısı word_count'tur"""
+    rng = random.Random(seed)
+    # Havuz kelime sayısının yarısı: her kelime ortalama iki sette geçer
+    pool = vocabulary(rng, max(word_count // 2, word_count // set_count * 2))
+    for number in range(set_count):
+        size = word_count // set_count + (1 if number < word_count % set_count else 0)
+        yield f"set {number + 1}", [pool[i] for i in rng.sample(range(len(pool)), size)]
+
+
+def write_json(path, set_count, word_count, seed=SEED):
+    """sozluk.json biçiminde ({"set": {"english": "turkish"}}) satır satır yazar"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for number, (name, pairs) in enumerate(iter_sets(set_count, word_count, seed)):
+            if number:
+                f.write(",\n")
+            f.write(f"{json.dumps(name, ensure_ascii=False)}: {{\n")
+            f.write(",\n".join(f"  {json.dumps(english)}: {json.dumps(turkish, ensure_ascii=False)}"
+                               for english, turkish in pairs))
+            f.write("\n}")
+        f.write("\n}\n")
+
+
+def paths(workdir, scale, seed=SEED):
+    base = os.path.join(workdir, f"{scale}-seed{seed}")
+    return base + ".db", base + ".json"
+
+
+def build(scale, workdir=DEFAULT_WORKDIR, seed=SEED, force=False):
+    """Ölçeğin JSON ve veritabanı dosyalarını (yoksa) üretir; (db, json) yollarını döndürür"""
+    set_count, word_count = SCALES[scale]
+    db_path, json_path = paths(workdir, scale, seed)
+    os.makedirs(workdir, exist_ok=True)
+    if force or not os.path.exists(json_path):
+        write_json(json_path + ".tmp", set_count, word_count, seed)
+        os.replace(json_path + ".tmp", json_path)
+    if force or not os.path.exists(db_path):
+        # Yarım kalmış bir üretim bir sonraki çalıştırmada hazır sanılmasın
+        partial = db_path + ".tmp"
+        if os.path.exists(partial):
+            os.remove(partial)
+        conn = schema.connect(partial)
+        import_json(conn, json_path)
+        conn.close()
+        os.replace(partial, db_path)
+    return db_path, json_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik benchmark sözlükleri")
+    parser.add_argument('scales', nargs='+', choices=list(SCALES))
+    parser.add_argument('--workdir', default=DEFAULT_WORKDIR)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--force', action='store_true', help="Var olan dosyaları yeniden üret")
+    args = parser.parse_args(argv)
+
+    for scale in args.scales:
+        db_path, json_path = build(scale, args.workdir, args.seed, args.force)
+        print(f"✓ {scale}: {db_path} ({os.path.getsize(db_path) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
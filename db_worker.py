@@ -0,0 +1,181 @@
+"""SQLite işlerini Tk döngüsünü bloklamadan çalıştıran arka plan katmanı.
+
+Tüm sorgular, kendi bağlantısına sahip tek bir iş parçacığında sırayla
+çalışır. Sonuçlar bir kuyruğa yazılır ve Tk tarafında root.after ile
+toplanıp geri çağırma (callback) fonksiyonlarına iletilir; böylece
+callback'ler her zaman Tk iş parçacığında çalışır.
+
+    job = worker.submit(func, *args, on_done=..., on_error=..., on_progress=...)
+
+func(conn, *args) worker'da çağrılır. İş parçacığı ve bağlantı ilk submit'te
+açılır; veritabanına dokunmayan açılış ekranları bağlantıyı beklemez. on_progress verilirse func'a
+progress=... argümanı da geçilir; bu fonksiyon her çağrıldığında iptal
+isteğini kontrol eder (job.cancel() -> Cancelled).
+
+Bağlantı açılırken şema geçişlerinin kullanıcıya mesajları olursa
+(schema.migrate) bunlar on_notice(mesajlar) ile bir kez iletilir.
+
+Bir callback'in hatası Tk'nın hata raporlamasına (report_callback_exception)
+iletilir; kuyruktaki diğer sonuçlar ve sonraki kontroller etkilenmez.
+
+instruments (instrumentation.Instruments) açıksa bağlantıya SQL trace
+callback kurulur ve her işin süresi fonksiyon adıyla kaydedilir.
+"""
+import queue
+import threading
+import time
+import traceback
+
+import schema
+
+# Sonuç kuyruğunun Tk tarafında kontrol edilme aralığı
+POLL_MS = 30
+
+
+class Cancelled(Exception):
+    """İş kullanıcı tarafından iptal edildi"""
+
+
+class Job:
+    def __init__(self, worker, func, args, on_done, on_error, on_progress):
+        self.worker = worker
+        self.func = func
+        self.args = args
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def progress(self, value):
+        """Worker'dan çağrılır: ilerlemeyi UI'a iletir, iptal edildiyse durdurur"""
+        if self.cancelled:
+            raise Cancelled()
+        self.worker._post(self.on_progress, value)
+
+
+class DBWorker:
+    def __init__(self, root, path='dictionary.db', poll_ms=POLL_MS, instruments=None, on_notice=None):
+        self.root = root
+        self.path = path
+        self.instruments = instruments
+        self.on_notice = on_notice
+        self.poll_ms = poll_ms
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.closed = False
+        self.thread = None
+
+    def submit(self, func, *args, on_done=None, on_error=None, on_progress=None):
+        if self.closed:
+            raise RuntimeError("DBWorker kapatıldı")
+        if self.thread is None:
+            self._start()
+        job = Job(self, func, args, on_done, on_error, on_progress)
+        self.requests.put(job)
+        return job
+
+    def wait(self):
+        """Kuyruktaki işler bitene kadar bekler. Tk iş parçacığını bloklar;
+        yalnızca kısa işlerin sonucu hemen gerektiğinde kullanılır."""
+        if self.thread is None:
+            return
+        done = threading.Event()
+        self.submit(lambda conn: done.set())
+        done.wait()
+
+    def close(self):
+        """Kuyruktaki işleri bitirip bağlantıyı kapatır (çıkışta çağrılır)"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread is not None:
+            self.requests.put(None)
+            self.thread.join()
+
+    def _start(self):
+        self.thread = threading.Thread(target=self._run, args=(self.path,),
+                                       name="db-worker", daemon=True)
+        self.thread.start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def _run(self, path):
+        # Bağlantı (ve şema geçişleri) worker iş parçacığında açılır
+        notices = [] if self.on_notice else None
+        try:
+            conn = schema.connect(path, notices)
+        except Exception as exc:
+            # Veritabanı açılamazsa her iş aynı hatayla sonuçlanır
+            while True:
+                job = self.requests.get()
+                if job is None:
+                    return
+                self._post(job.on_error or _reraise, exc)
+        if notices:
+            self._post(self.on_notice, notices)
+        instruments = self.instruments if self.instruments and self.instruments.enabled else None
+        if instruments:
+            instruments.attach(conn)
+        try:
+            while True:
+                job = self.requests.get()
+                if job is None:
+                    return
+                if instruments:
+                    started = time.perf_counter()
+                try:
+                    if job.cancelled:
+                        raise Cancelled()
+                    if job.on_progress:
+                        result = job.func(conn, *job.args, progress=job.progress)
+                    else:
+                        result = job.func(conn, *job.args)
+                except BaseException as exc:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    self._post(job.on_error or _reraise, exc)
+                else:
+                    self._post(job.on_done, result)
+                if instruments:
+                    instruments.job_done(getattr(job.func, '__qualname__', repr(job.func)),
+                                         (time.perf_counter() - started) * 1000)
+        finally:
+            conn.close()
+
+    def _post(self, callback, value):
+        if callback:
+            self.results.put((callback, value))
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    callback, value = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    callback(value)
+                except Exception as exc:
+                    self._report(exc)
+        finally:
+            # Bir callback hata verse de sonuçlar toplanmaya devam eder
+            if not self.closed:
+                self.root.after(self.poll_ms, self._poll)
+
+    def _report(self, exc):
+        report = getattr(self.root, 'report_callback_exception', None)
+        if report is not None:
+            report(type(exc), exc, exc.__traceback__)
+        else:
+            traceback.print_exception(type(exc), exc, exc.__traceback__)
+
+
+def _reraise(exc):
+    # on_error verilmemişse hata Tk'nın hata raporlamasına düşer
+    raise exc
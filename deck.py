@@ -0,0 +1,225 @@
+"""Büyük setler için sayfalı, yalnızca id ile kurulan pratik destesi.
+
+Setin kelimeleri belleğe alınmaz. IdSampler, setin word_id'lerinden
+tekrarsız ve düzgün dağılımlı rastgele bir sıra üretir: setin id aralığı
+idx_words_set_id ile okunur, aralıktan rastgele seçilen adaylar tek sorguyla
+yoklanır ve sette olanlar alınır (reddetme örneklemesi). Setin id'leri
+aralıkta çok seyrekse ya da setin yarısı çekildiyse kalan id'ler (yalnızca
+id'ler) bir kez okunup karıştırılır.
+
+Birden çok setten çalışırken SetsSampler her çekilişi setlere kelime
+sayılarıyla orantılı, tekrarsız dağıtır (tüm seçimden düzgün örnekleme):
+çekilen sıra numaraları setlerin birikimli kelime sayılarına göre setlere
+düşer, her setin payı o setin IdSampler'ından alınır. Setlerin kelime
+sayıları word_sets.word_count'tan gelir; hiçbir setin kelimeleri topluca
+okunmaz.
+
+Deck bu sırayı PAGE_SIZE'lık sayfalar halinde, metinleriyle birlikte
+worker'da okur. İlk sayfa deste açılırken, sonraki sayfa imleç bir sayfaya
+girdiğinde arka planda okunur; bellekte en fazla iki sayfa kalır. Böylece
+ilk karta kadar geçen süre ve bellek set boyutuyla büyümez.
+"""
+import random
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+
+import queries
+
+PAGE_SIZE = 50
+# Id'lerin aralıktaki yoğunluğu bunun altındaysa yoklama yerine kalan id'ler okunur
+MIN_DENSITY = 0.05
+# Tek yoklama sorgusundaki en fazla aday
+MAX_PROBES = 20000
+# Bu kadar turda yeterli id bulunamazsa (ör. kelimeler silindiyse) kalan id'ler okunur
+MAX_ROUNDS = 16
+
+
+class IdSampler:
+    """Setin word_id'lerinden rastgele, tekrarsız sıra (worker iş parçacığında kullanılır)"""
+
+    def __init__(self, conn, set_id, rng):
+        self.set_id = set_id
+        self.rng = rng
+        self.total, self.low, self.high = queries.set_id_range(conn, set_id)
+        self.seen = set()
+        # Kalan id'ler okunduktan sonra sıra bu diziden çekilir
+        self.rest = None
+
+    def take(self, conn, count):
+        """Sıradaki en fazla count id; set tükenince daha az"""
+        if self.rest is None and self._needs_rest(count):
+            self._load_rest(conn)
+        if self.rest is not None:
+            taken = self.rest[-count:] if count else array('q')
+            del self.rest[len(self.rest) - len(taken):]
+            return list(taken)
+
+        chosen = []
+        span = self.high - self.low + 1
+        for _ in range(MAX_ROUNDS):
+            need = count - len(chosen)
+            probes = min(MAX_PROBES, int(need * span / self.total * 1.5) + 8)
+            candidates = {self.rng.randint(self.low, self.high) for _ in range(probes)} - self.seen
+            found = queries.existing_word_ids(conn, self.set_id, sorted(candidates))
+            # Bulunanlar id sırasıyla gelir; fazlası rastgele atılır ki dağılım bozulmasın
+            self.rng.shuffle(found)
+            found = found[:need]
+            self.seen.update(found)
+            chosen += found
+            if len(chosen) == count:
+                return chosen
+        self._load_rest(conn)
+        return chosen + self.take(conn, count - len(chosen))
+
+    def _needs_rest(self, count):
+        if not self.total:
+            return True
+        return (len(self.seen) + count > self.total // 2
+                or self.total / (self.high - self.low + 1) < MIN_DENSITY)
+
+    def _load_rest(self, conn):
+        ids = queries.set_word_ids(conn, self.set_id)
+        self.rest = array('q', (word_id for word_id in ids if word_id not in self.seen)) if self.seen else ids
+        self.rng.shuffle(self.rest)
+        self.seen = set()
+
+
+class SetsSampler:
+    """Birden çok setin kelimelerinden rastgele, tekrarsız sıra (IdSampler ile aynı arayüz).
+    counts: set_id -> kelime sayısı"""
+
+    def __init__(self, counts, rng):
+        self.rng = rng
+        self.set_ids = [set_id for set_id, count in counts.items() if count]
+        self.remaining = [counts[set_id] for set_id in self.set_ids]
+        self.total = sum(self.remaining)
+        # Setin IdSampler'ı ilk kez ondan kelime çekilirken kurulur
+        self.samplers = {}
+
+    def take(self, conn, count):
+        chosen = []
+        while len(chosen) < count and any(self.remaining):
+            bounds = list(accumulate(self.remaining))
+            draws = min(count - len(chosen), bounds[-1])
+            shares = Counter(bisect_right(bounds, position)
+                             for position in self.rng.sample(range(bounds[-1]), draws))
+            for index, share in shares.items():
+                ids = self._sampler(conn, index).take(conn, share)
+                # word_count eskiyse (ör. silinen kelimeler) set tükenmiş sayılır
+                self.remaining[index] = self.remaining[index] - share if len(ids) == share else 0
+                chosen += ids
+        # Setlerin payları art arda eklendi; sıra karıştırılır
+        self.rng.shuffle(chosen)
+        return chosen
+
+    def _sampler(self, conn, index):
+        sampler = self.samplers.get(index)
+        if sampler is None:
+            sampler = self.samplers[index] = IdSampler(conn, self.set_ids[index], self.rng)
+        return sampler
+
+
+class Deck:
+    """Quiz oturumlarına liste gibi verilen (len, sırayla indeks) sayfalı kelime dizisi.
+
+    Sayfalar worker'da read_page ile sırayla okunur ve pages'e yazılır;
+    Tk tarafı attach ile verilen DBWorker üzerinden önden okuma ister.
+    """
+
+    shuffled = True
+
+    def __init__(self, sampler, length, keys=False, page_size=PAGE_SIZE):
+        self.sampler = sampler
+        self.length = length
+        self.keys = keys
+        self.page_size = page_size
+        # sayfa numarası -> satırlar
+        self.pages = {}
+        self.read_count = 0
+        self.requested = 0
+        self.worker = None
+        self.on_error = None
+
+    def attach(self, worker, on_error=None):
+        self.worker = worker
+        self.on_error = on_error
+        return self
+
+    def read_page(self, conn):
+        """Worker'da: sıradaki sayfayı okur"""
+        number = self.read_count
+        start = number * self.page_size
+        wanted = min(self.page_size, self.length - start)
+        rows = []
+        while len(rows) < wanted:
+            ids = self.sampler.take(conn, wanted - len(rows))
+            if not ids:
+                # Deste açıldıktan sonra kelime silinmiş
+                self.length = start + len(rows)
+                break
+            rows += queries.words_by_ids(conn, ids, self.keys)
+        self.pages[number] = rows
+        self.read_count += 1
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        number = index // self.page_size
+        page = self.pages.get(number)
+        if page is None:
+            # Önden okuma yetişmediyse (normalde olmaz) kuyruk beklenir
+            self._request(number)
+            self.worker.wait()
+            page = self.pages.get(number)
+            if page is None or index - number * self.page_size >= len(page):
+                raise IndexError(index)
+        self._request(number + 1)
+        for old in [old for old in list(self.pages) if old < number]:
+            self.pages.pop(old, None)
+        return page[index - number * self.page_size]
+
+    def _request(self, number):
+        while self.requested <= number and self.requested * self.page_size < self.length:
+            self.requested += 1
+            self.worker.submit(self.read_page, on_error=self.on_error)
+
+    def loaded(self):
+        """Bellekteki sayfaların kelimeleri (çeldirici seçimi için)"""
+        return [row for number in sorted(list(self.pages)) for row in self.pages.get(number, ())]
+
+
+def open_deck(conn, set_id, limit=None, keys=False, seed=None):
+    """Worker'da: desteyi ve ilk sayfasını hazırlar. limit verilirse setten o
+    kadar rastgele kelime; set yine de belleğe alınmaz."""
+    return _open(conn, IdSampler(conn, set_id, random.Random(seed)), limit, keys)
+
+
+def open_sets_deck(conn, counts, limit=None, keys=False, seed=None):
+    """open_deck'in birden çok set için olanı; counts: set_id -> kelime sayısı"""
+    return _open(conn, SetsSampler(counts, random.Random(seed)), limit, keys)
+
+
+def _open(conn, sampler, limit, keys):
+    length = sampler.total if limit is None else min(limit, sampler.total)
+    deck = Deck(sampler, length, keys)
+    if length:
+        deck.read_page(conn)
+        deck.requested = 1
+    return deck
+
+
+def sample_words(conn, set_id, count, keys=False, seed=None):
+    """Set okunmadan count rastgele kelime (liste olarak)"""
+    sampler = IdSampler(conn, set_id, random.Random(seed))
+    return queries.words_by_ids(conn, sampler.take(conn, count), keys)
+
+
+def sample_sets(conn, counts, count, keys=False, seed=None):
+    """Setler okunmadan, setlere kelime sayılarıyla orantılı count rastgele kelime"""
+    sampler = SetsSampler(counts, random.Random(seed))
+    return queries.words_by_ids(conn, sampler.take(conn, count), keys)
@@ -1,60 +1,308 @@
-import sqlite3
+"""sozluk.json dosyasını dictionary.db veritabanına aktarır.
+
+JSON, set set okunur (dosyanın tamamı belleğe alınmaz). Her setin içerik
+özeti word_sets.content_hash'te saklanır; tekrar çalıştırıldığında yalnızca
+değişen setler ve bu setlerdeki değişen kelimeler yazılır, diğer satırların
+id'leri korunur. Kelimeler parça başına tek ifadeyle (queries.write_rows)
+ve parçalı transaction'lar halinde yazılır; aktarım süresince
+synchronous/journal_mode gevşetilir. Her parça içinde satır başına çalışan
+AFTER INSERT tetikleyicileri (word_count, arama indeksi) kaldırılır ve
+işleri parça sonunda toplu olarak yapılır (DDL de transaction'a dahil
+olduğu için diğer bağlantılar tetikleyicisiz bir durum görmez).
+
+Dosya, setlerin tamamı sayılmaz: daha önce içe aktarılmış ama bu dosyada
+bulunmayan setler yalnızca --prune verilirse silinir.
+
+Kullanım: python dict_to_database.py [sozluk.json] [--db dictionary.db] [--prune]
+"""
 import json
+import hashlib
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import schema
+import queries
+from grading import answer_key
+
+# Her transaction'da yazılacak en fazla satır
+CHUNK_ROWS = 20000
+READ_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder(object_pairs_hook=list)
+
+
+def iter_sets(f):
+    """{"set adı": {"english": "turkish", ...}, ...} dosyasından
+    (set adı, [(english, turkish), ...]) çiftlerini sırayla üretir."""
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            eof = True
+        # Okunmuş kısmı at, bellek yalnızca o anki set kadar büyüsün
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    def expect(chars):
+        nonlocal pos
+        skip_ws()
+        if pos >= len(buf) or buf[pos] not in chars:
+            raise ValueError(f"JSON biçimi hatalı: {chars!r} bekleniyordu (konum {pos})")
+        pos += 1
+        return buf[pos - 1]
+
+    def decode():
+        nonlocal pos
+        skip_ws()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buf, pos)
+                # Sayı gibi değerler tampon sonunda yarım kalmış olabilir
+                if end < len(buf) or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+
+    fill()
+    if buf.startswith("\ufeff"):
+        buf = buf[1:]
+    expect("{")
+    skip_ws()
+    if pos < len(buf) and buf[pos] == "}":
+        return
+    while True:
+        name = decode()
+        expect(":")
+        pairs = decode()
+        if isinstance(pairs, list):
+            yield name, pairs
+        if expect(",}") == "}":
+            return
+
+
+def set_hash(pairs):
+    """Setin içerik özeti; JSON'daki çiftler (sırasıyla) değişmedikçe aynı kalır."""
+    data = json.dumps(pairs, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def has_statistics(cursor):
+    """Sorgu planlayıcısı için daha önce ANALYZE çalıştırılmış mı"""
+    if cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() is None:
+        return False
+    return cursor.execute('SELECT 1 FROM sqlite_stat1 LIMIT 1').fetchone() is not None
+
+
+def remove_sets(conn, set_ids):
+    """Setleri kelimeleri (ve onlara bağlı geçmişle) birlikte tek transaction'da siler"""
+    conn.executemany('DELETE FROM word_sets WHERE id = ?', [(set_id,) for set_id in set_ids])
+    conn.commit()
+    return len(set_ids)
+
+
+def import_json(conn, path, progress=None, prune=False):
+    """JSON'daki setleri veritabanıyla eşitler; istatistik sözlüğü döndürür.
+
+    İçerik özeti değişmemiş setlere dokunulmaz. Değişen setlerde yalnızca
+    eklenen, çevirisi değişen ve silinen kelimeler yazılır; diğer satırlar
+    (ve id'lerine bağlı tekrar durumu) korunur. Daha önce içe aktarılmış
+    olup bu JSON'da bulunmayan setler stats["missing"]'te [(set_id, ad)]
+    olarak döner ve yalnızca prune verilirse silinir. Uygulamada oluşturulan
+    setler (content_hash NULL) içe aktarmanın değildir: JSON'da aynı isimde
+    bir set varsa bu sete yalnızca sette olmayan kelimeler eklenir, hiçbir
+    kelimesi değiştirilmez ya da silinmez; adı stats["app_sets"]'e yazılır.
+    """
+    started = time.perf_counter()
+    stats = {"sets": 0, "unchanged": 0, "rows": 0, "inserted": 0, "updated": 0,
+             "deleted": 0, "removed_sets": 0, "duplicates": 0, "missing": [], "app_sets": []}
+    cursor = conn.cursor()
+
+    known = {name: (set_id, content_hash) for set_id, name, content_hash
+             in cursor.execute('SELECT id, name, content_hash FROM word_sets')}
+    seen = set()
+
+    # Yalnızca aktarım süresince: fsync yok, günlük bellekte
+    old_synchronous = cursor.execute('PRAGMA synchronous').fetchone()[0]
+    old_journal = cursor.execute('PRAGMA journal_mode').fetchone()[0]
+    cursor.execute('PRAGMA synchronous = OFF')
+    cursor.execute('PRAGMA journal_mode = MEMORY')
+
+    pending = 0
+    watermark = 0
+
+    def begin_chunk():
+        nonlocal watermark
+        cursor.execute('BEGIN')
+        watermark = schema.suspend_insert_triggers(cursor)
+
+    def commit_chunk():
+        nonlocal pending
+        schema.restore_insert_triggers(cursor, watermark)
+        conn.commit()
+        pending = 0
+
+    def write(sql, rows):
+        nonlocal pending
+        for written in queries.write_rows(cursor, sql, rows, CHUNK_ROWS):
+            pending += written
+            if pending >= CHUNK_ROWS:
+                commit_chunk()
+                begin_chunk()
 
-# JSON dosyasını oku
-with open('sozluk.json', 'r', encoding='utf-8') as f:
-    json_data = json.load(f)
-
-# Veritabanı bağlantısı
-conn = sqlite3.connect('dictionary.db')
-cursor = conn.cursor()
-
-
-cursor.execute('''
-    CREATE TABLE IF NOT EXISTS word_sets (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL ,
-    created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-          )''')
-# Tablo oluştur
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS words (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    set_id INTEGER,
-    
-    turkish TEXT NOT NULL,
-    english TEXT NOT NULL,
-    UNIQUE(set_id, english),
-    FOREIGN KEY (set_id) REFERENCES word_sets (id) ON DELETE CASCADE
-)
-''')
-
-# Verileri aktar
-successed = 0
-for set_id, words in json_data.items():
     try:
-        cursor.execute('INSERT INTO word_sets (name) VALUES (?)', (set_id,))
-        set_id = cursor.lastrowid
-    except sqlite3.IntegrityError:
-        cursor.execute('SELECT id FROM word_sets WHERE name = ?', (set_id,))
-        set_id = cursor.fetchone()[0]
-    for english, turkish in words.items():
-        try:
-            cursor.execute('''
-            INSERT INTO words (set_id,  english, turkish)
-            VALUES ( ?,  ?, ?)
-            ''', (set_id,  english.strip(), turkish))
-            successed += 1
-        except sqlite3.IntegrityError:
-            print(f"Uyarı: '{english}' kelimesi zaten {set_id}'de mevcut")
-
-conn.commit()
-
-# İstatistikler
-cursor.execute('SELECT COUNT(*) FROM words')
-toplam = cursor.fetchone()[0]
-
-print(f"\n✓ {successed} kelime başarıyla eklendi")
-print(f"✓ Toplam {toplam} kelime veritabanında")
-
-conn.close()
\ No newline at end of file
+        begin_chunk()
+        with open(path, 'r', encoding='utf-8') as f:
+            for name, pairs in iter_sets(f):
+                seen.add(name)
+                stats["sets"] += 1
+                content_hash = set_hash(pairs)
+                set_id, old_hash = known.get(name, (None, None))
+                if old_hash == content_hash:
+                    stats["unchanged"] += 1
+                    continue
+
+                # Aynı İngilizce kelime birden çok kez geçerse sonuncusu geçerlidir
+                wanted = {}
+                valid = 0
+                for english, turkish in pairs:
+                    if isinstance(turkish, str):
+                        wanted[english.strip()] = turkish
+                        valid += 1
+                duplicates = valid - len(wanted)
+                if duplicates:
+                    print(f"Uyarı: '{name}' setinde {duplicates} tekrarlanan kelime atlandı")
+
+                if set_id is not None and old_hash is None:
+                    # Uygulamada oluşturulmuş set: yalnızca yeni kelimeler eklenir
+                    present = {english for english, in cursor.execute(
+                        'SELECT english FROM words WHERE set_id = ?', (set_id,))}
+                    inserts = [(set_id, turkish, english, answer_key(turkish), answer_key(english))
+                               for english, turkish in wanted.items() if english not in present]
+                    write(queries.INSERT_WORDS, inserts)
+                    stats["app_sets"].append(name)
+                    stats["rows"] += len(wanted)
+                    stats["inserted"] += len(inserts)
+                    stats["duplicates"] += duplicates
+                    if progress:
+                        progress(stats)
+                    continue
+
+                if set_id is None:
+                    cursor.execute('''
+                        INSERT INTO word_sets (name, created_date) VALUES (?, ?)
+                    ''', (name, datetime.now().strftime("%Y-%m-%d %H:%M")))
+                    set_id = cursor.lastrowid
+                    existing = {}
+                else:
+                    existing = {english: (word_id, turkish) for word_id, english, turkish
+                                in cursor.execute('SELECT id, english, turkish FROM words WHERE set_id = ?',
+                                                  (set_id,))}
+
+                inserts = []
+                updates = []
+                for english, turkish in wanted.items():
+                    old = existing.pop(english, None)
+                    if old is None:
+                        inserts.append((set_id, turkish, english, answer_key(turkish), answer_key(english)))
+                    elif old[1] != turkish:
+                        updates.append((turkish, old[0], answer_key(turkish)))
+                deletes = [word_id for word_id, _ in existing.values()]
+
+                write(queries.DELETE_WORDS, deletes)
+                write(queries.UPDATE_TURKISH, updates)
+                write(queries.INSERT_WORDS, inserts)
+                # Özet en son yazılır: set yarıda kesilirse sonraki aktarımda yeniden eşitlenir
+                cursor.execute('UPDATE word_sets SET content_hash = ? WHERE id = ?',
+                               (content_hash, set_id))
+
+                stats["rows"] += len(wanted)
+                stats["inserted"] += len(inserts)
+                stats["updated"] += len(updates)
+                stats["deleted"] += len(deletes)
+                stats["duplicates"] += duplicates
+                if progress:
+                    progress(stats)
+
+        # Bu JSON'da olmayan, daha önce içe aktarılmış setler
+        stats["missing"] = [(set_id, name) for name, (set_id, content_hash) in known.items()
+                            if content_hash is not None and name not in seen]
+        if prune:
+            cursor.executemany('DELETE FROM word_sets WHERE id = ?',
+                               [(set_id,) for set_id, _ in stats["missing"]])
+            stats["removed_sets"] = len(stats["missing"])
+        commit_chunk()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        cursor.execute(f'PRAGMA journal_mode = {old_journal}')
+        cursor.execute(f'PRAGMA synchronous = {old_synchronous}')
+
+    if stats["unchanged"] < stats["sets"] or stats["removed_sets"]:
+        if stats["inserted"] >= CHUNK_ROWS:
+            # Parça parça eklenen arama indeksi segmentlerini birleştir
+            cursor.execute("INSERT INTO words_fts (words_fts) VALUES ('optimize')")
+        # Tam ANALYZE tüm tabloları tarar: yalnızca ilk/toplu aktarımda. Küçük
+        # değişikliklerde PRAGMA optimize yalnızca gereken tabloları yeniler.
+        if stats["inserted"] >= CHUNK_ROWS or not has_statistics(cursor):
+            cursor.execute('ANALYZE')
+        else:
+            cursor.execute('PRAGMA optimize')
+        conn.commit()
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="sozluk.json -> dictionary.db")
+    parser.add_argument('json_path', nargs='?', default='sozluk.json')
+    parser.add_argument('--db', default='dictionary.db')
+    parser.add_argument('--prune', action='store_true',
+                        help="Bu dosyada olmayan, daha önce içe aktarılmış setleri sil")
+    args = parser.parse_args(argv)
+
+    # Veritabanı bağlantısı (şema, uygulamayla aynı geçişlerden geçer)
+    conn = schema.connect(args.db)
+    stats = import_json(conn, args.json_path, prune=args.prune)
+
+    # İstatistikler
+    toplam = conn.execute('SELECT COALESCE(SUM(word_count), 0) FROM word_sets').fetchone()[0]
+    rate = stats["rows"] / stats["seconds"] if stats["seconds"] else 0
+
+    print(f"\n✓ {stats['inserted']} kelime eklendi, {stats['updated']} güncellendi, "
+          f"{stats['deleted']} silindi")
+    print(f"✓ {stats['sets']} setten {stats['sets'] - stats['unchanged']} tanesi değişmiş, "
+          f"{stats['removed_sets']} set kaldırıldı")
+    if stats["app_sets"]:
+        print(f"! Uygulamada oluşturulmuş {len(stats['app_sets'])} sete yalnızca yeni kelimeler "
+              f"eklendi: {', '.join(stats['app_sets'])}")
+    if stats["missing"] and not args.prune:
+        print(f"! Bu dosyada olmayan {len(stats['missing'])} set korundu (silmek için --prune)")
+    print(f"✓ Toplam {toplam} kelime veritabanında")
+    print(f"✓ {stats['seconds']:.2f} sn, saniyede {rate:,.0f} kelime")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Setler arası tekrar eden ve çelişen kelimelerin analizi.
+
+Tüm words tablosu bir kez okunur ve normalleştirilmiş (grading.normalize)
+Türkçe/İngilizce anahtarlara göre hash tablolarında gruplanır:
+
+- tekrar: aynı Türkçe ve aynı İngilizce (farklı setlerde ya da aynı sette)
+- çelişki: aynı Türkçe kelimeye farklı İngilizce karşılıklar (ya da tersi)
+- benzer: aynı Türkçe kelimenin İngilizce karşılıkları (ya da tersi)
+  arasında yazım hatası toleransı (grading.tolerance) içinde olanlar
+
+Benzer kayıtlar için bütün çiftler karşılaştırılmaz: karşılaştırma yalnızca
+karşı tarafı birebir aynı olan (aynı hash grubundaki) kayıtlar arasında
+yapılır. Gruplar küçük olduğundan tarama sözlük boyutuyla doğrusal büyür.
+
+Anahtarlar words.turkish_key/english_key sütunlarından (ilk karşılık = tüm
+metin) okunur, yeniden hesaplanmaz; yalnızca anahtarı NULL olan satırlarda
+(uygulama dışından yazılmış) grading.answer_key ile hesaplanır. Satırlar
+SQLite'ta gruplandığı için Python tarafındaki iş kelime sayısıyla değil,
+farklı çift sayısıyla büyür.
+
+Kullanım: python duplicates.py [--db dictionary.db] [--limit 20] [--merge-exact]
+"""
+import argparse
+import json
+import time
+from collections import defaultdict, namedtuple
+from itertools import combinations
+
+import grading
+import schema
+
+# Benzer kayıtlarda kabul edilen en fazla düzenleme
+NEAR_DISTANCE = 2
+# Birleştirmede ifade başına silinen kelime
+MERGE_CHUNK = 20000
+# Her bölümde ayrıntısı (set adı, yazılışı) okunan bulgu sayısı
+LISTED = 1000
+
+Word = namedtuple("Word", "id set_id set_name turkish english")
+# kind: "duplicate" | "conflict" | "near"; ids: sıralı word_id'ler
+Finding = namedtuple("Finding", "kind ids detail")
+# words: ilk LISTED bulgudaki kelimeler (word_id -> Word); scanned: taranan kelime sayısı
+Report = namedtuple("Report", "duplicates conflicts near words scanned seconds")
+
+
+def near_limit(key):
+    return min(grading.tolerance(len(key)), NEAR_DISTANCE)
+
+
+def _distance(a, b, limit):
+    """grading.distance; tek düzenlemelik (kısa) anahtarlarda doğrudan karşılaştırma"""
+    if limit != 1 or a == b:
+        return grading.distance(a, b, limit) if a != b else 0
+    i = 0
+    for i, (char_a, char_b) in enumerate(zip(a, b)):
+        if char_a != char_b:
+            break
+    else:
+        i = min(len(a), len(b))
+    if a[i + 1:] == b[i + 1:] or a[i + 1:] == b[i:] or a[i:] == b[i + 1:]:
+        return 1
+    return 2
+
+
+def key_groups(conn):
+    """(turkish_key, english_key, [word_id, ...]) grupları"""
+    # Satırlar SQLite'ta gruplanır; Python'a satır başına değil, farklı
+    # anahtar çifti başına bir satır gelir
+    for turkish_key, english_key, id_list in conn.execute('''
+        SELECT turkish_key, english_key, group_concat(id)
+        FROM words WHERE turkish_key IS NOT NULL AND english_key IS NOT NULL
+        GROUP BY turkish_key, english_key
+    '''):
+        yield turkish_key, english_key, [int(word_id) for word_id in id_list.split(",")]
+    # Anahtarı eksik satırlar tek tek
+    for word_id, turkish, english, turkish_key, english_key in conn.execute('''
+        SELECT id, turkish, english, turkish_key, english_key
+        FROM words WHERE turkish_key IS NULL OR english_key IS NULL
+    '''):
+        yield (turkish_key or grading.answer_key(turkish), english_key or grading.answer_key(english),
+               [word_id])
+
+
+def analyze(conn, listed=LISTED):
+    """Tüm sözlüğü tarar ve bir Report döndürür."""
+    started = time.perf_counter()
+    # (türkçe, ingilizce) -> word_id'ler. Karşılık listesi farklı ama tam
+    # metni aynı olan anahtarlar (ör. "a, b" ve "a b") burada birleşir.
+    groups = {}
+    total = 0
+    for turkish_key, english_key, ids in key_groups(conn):
+        key = (turkish_key.split(grading.SEPARATOR, 1)[0], english_key.split(grading.SEPARATOR, 1)[0])
+        total += len(ids)
+        if key in groups:
+            groups[key].extend(ids)
+        else:
+            groups[key] = ids
+    for ids in groups.values():
+        if len(ids) > 1:
+            ids.sort()
+
+    duplicates = [Finding("duplicate", tuple(ids), None) for ids in groups.values() if len(ids) > 1]
+
+    # Anahtar -> {karşı taraftaki anahtar: ilk word_id}
+    by_turkish = defaultdict(dict)
+    by_english = defaultdict(dict)
+    for (turkish, english), ids in groups.items():
+        by_turkish[turkish][english] = ids[0]
+        by_english[english][turkish] = ids[0]
+    conflicts = [Finding("conflict", tuple(sorted(others.values())), side)
+                 for side, index in (("turkish", by_turkish), ("english", by_english))
+                 for others in index.values() if len(others) > 1]
+
+    # Benzer kayıtlar: aynı anahtarın gruplarında, karşı taraftaki anahtarlar
+    # tolerans içindeyse (ör. gerektirmek — necessitate / necessiate)
+    near = []
+    for side, index in (("english", by_turkish), ("turkish", by_english)):
+        for others in index.values():
+            if len(others) > 1:
+                for (a_key, a_id), (b_key, b_id) in combinations(others.items(), 2):
+                    limit = min(near_limit(a_key), near_limit(b_key))
+                    if abs(len(a_key) - len(b_key)) <= limit and _distance(a_key, b_key, limit) <= limit:
+                        near.append(Finding("near", (min(a_id, b_id), max(a_id, b_id)), side))
+
+    # Ayrıntılar yalnızca listelenecek bulgular için okunur; büyük bir
+    # sözlükte kelimelerin çoğu bir tekrar grubunda olabilir
+    wanted = {word_id for findings in (duplicates, conflicts, near)
+              for finding in findings[:listed] for word_id in finding.ids}
+
+    return Report(duplicates, conflicts, near, word_details(conn, wanted), total,
+                  time.perf_counter() - started)
+
+
+def word_details(conn, word_ids):
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT w.id, w.set_id, s.name, w.turkish, w.english
+        FROM words w JOIN word_sets s ON s.id = w.set_id
+        WHERE w.id IN (SELECT value FROM json_each(?))
+    ''', (json.dumps(sorted(word_ids)),))
+    return {row[0]: Word(*row) for row in cursor}
+
+
+def merge(conn, keep_id, drop_ids):
+    """drop_ids kelimelerini keep_id'de birleştirir ve siler.
+
+    Cevap geçmişi keep_id'ye taşınır. keep_id'nin tekrar durumu yoksa
+    silinen kelimelerden en son tekrar edilenin durumu devralınır.
+    Silinen kelimeler kendi setlerinden de çıkar.
+    """
+    return merge_many(conn, [(keep_id, drop_ids)])
+
+
+def merge_duplicates(conn, findings, progress=None):
+    """Her bulguda ilk (en eski) kelimeyi tutar; silinen kelime sayısını döndürür."""
+    return merge_many(conn, [(finding.ids[0], finding.ids[1:]) for finding in findings], progress)
+
+
+def merge_many(conn, merges, progress=None):
+    """merges: [(keep_id, drop_ids), ...]; tek transaction'da, MERGE_CHUNK
+    silinen kelime başına üç ifadeyle yazılır. progress((silinen, toplam))"""
+    moves = [(drop_id, keep_id) for keep_id, drop_ids in merges for drop_id in drop_ids]
+    cursor = conn.cursor()
+    deleted = 0
+    try:
+        for start in range(0, len(moves), MERGE_CHUNK):
+            chunk = moves[start:start + MERGE_CHUNK]
+            deleted += _merge_chunk(cursor, json.dumps(chunk))
+            if progress:
+                progress((start + len(chunk), len(moves)))
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    return deleted
+
+
+def _merge_chunk(cursor, moves):
+    """moves: [[drop_id, keep_id], ...] JSON dizisi"""
+    cursor.execute('''
+        UPDATE answer_events SET word_id = moves.keep_id
+        FROM (SELECT json_extract(value, '$[0]') AS drop_id, json_extract(value, '$[1]') AS keep_id
+              FROM json_each(?)) AS moves
+        WHERE answer_events.word_id = moves.drop_id
+    ''', (moves,))
+    # Durumu olmayan kelime, silinenlerden en son tekrar edilenin durumunu alır
+    # (INSERT OR IGNORE: her keep_id için sıradaki ilk satır yazılır)
+    cursor.execute('''
+        INSERT OR IGNORE INTO review_state
+            (word_id, ease, interval, repetitions, lapses, due, last_review)
+        SELECT moves.keep_id, r.ease, r.interval, r.repetitions, r.lapses, r.due, r.last_review
+        FROM (SELECT json_extract(value, '$[0]') AS drop_id, json_extract(value, '$[1]') AS keep_id
+              FROM json_each(?)) AS moves
+        JOIN review_state r ON r.word_id = moves.drop_id
+        ORDER BY r.last_review DESC
+    ''', (moves,))
+    # Hata/başarı sayaçları kalan kelimede toplanır
+    cursor.execute('''
+        INSERT INTO word_stats (word_id, errors, successes, last_error)
+        SELECT moves.keep_id, s.errors, s.successes, s.last_error
+        FROM (SELECT json_extract(value, '$[0]') AS drop_id, json_extract(value, '$[1]') AS keep_id
+              FROM json_each(?)) AS moves
+        JOIN word_stats s ON s.word_id = moves.drop_id
+        WHERE true
+        ON CONFLICT (word_id) DO UPDATE SET
+            errors = errors + excluded.errors,
+            successes = successes + excluded.successes,
+            last_error = MAX(COALESCE(last_error, excluded.last_error),
+                             COALESCE(excluded.last_error, last_error))
+    ''', (moves,))
+    cursor.execute('''
+        DELETE FROM words WHERE id IN (SELECT json_extract(value, '$[0]') FROM json_each(?))
+    ''', (moves,))
+    return cursor.rowcount
+
+
+def describe(finding, words):
+    """Bulgu -> (başlık, ayrıntı satırları); words: Report.words"""
+    found = [words[word_id] for word_id in finding.ids]
+    first = found[0]
+    if finding.kind == "duplicate":
+        title = f"{first.turkish} — {first.english} ({len(found)} kez)"
+    elif finding.kind == "conflict":
+        if finding.detail == "turkish":
+            title = f"{first.turkish} → " + " / ".join(word.english for word in found)
+        else:
+            title = f"{first.english} → " + " / ".join(word.turkish for word in found)
+    else:
+        title = " ≈ ".join(f"{word.turkish} — {word.english}" for word in found)
+    return title, [f"#{word.id} {word.turkish} — {word.english} [{word.set_name}]"
+                   for word in found]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tekrar eden ve çelişen kelimeler")
+    parser.add_argument('--db', default='dictionary.db')
+    parser.add_argument('--limit', type=int, default=20, help="Her bölümde gösterilecek bulgu sayısı")
+    parser.add_argument('--merge-exact', action='store_true',
+                        help="Birebir tekrarları en eski kayıtta birleştir")
+    args = parser.parse_args(argv)
+
+    conn = schema.connect(args.db)
+    report = analyze(conn, listed=args.limit)
+
+    sections = [("Tekrarlar", report.duplicates), ("Çelişen çeviriler", report.conflicts),
+                ("Benzer kayıtlar", report.near)]
+    for heading, findings in sections:
+        print(f"\n{heading}: {len(findings)}")
+        for finding in findings[:args.limit]:
+            title, lines = describe(finding, report.words)
+            print(f"  {title}")
+            for line in lines:
+                print(f"      {line}")
+        if len(findings) > args.limit:
+            print(f"  ... ve {len(findings) - args.limit} tane daha")
+    print(f"\n✓ {report.scanned} kelime {report.seconds:.2f} sn'de tarandı")
+
+    if args.merge_exact and report.duplicates:
+        print(f"✓ {merge_duplicates(conn, report.duplicates)} tekrar eden kelime silindi")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
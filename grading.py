@@ -0,0 +1,120 @@
+"""Yazma pratiği için toleranslı cevap değerlendirme.
+
+Cevap ve beklenen metin aynı şekilde normalleştirilir: Türkçe harfler
+katlanır (İ/I/ı -> i, ç -> c, ğ -> g ...), küçük harfe çevrilir,
+noktalama atılır. Beklenen metin "," ya da ";" ile ayrılmış birden çok
+karşılık içerebilir; her biri ayrı ayrı kabul edilir. Tam eşleşmeyen
+cevaplar, uzunluğa göre sınırlı bir düzenleme mesafesi (bit-paralel
+Myers/Hyyrö Levenshtein) içindeyse "yazım hatası" sayılır.
+
+Beklenen metinlerin normalleştirilmiş hali (answer_key) words tablosunda
+turkish_key/english_key sütunlarında hazır tutulur (schema._v8_answer_keys);
+kelimeyi yazan her yol anahtarı kendisi hesaplar (queries.with_keys). Başka
+araçlarla eklenen ya da anahtarı verilmeden metni değiştirilen satırlarda
+anahtar NULL olur (words_keys_stale tetikleyicisi); quiz_engine, duplicates
+ve search bu durumda answer_key'i kendileri hesaplar.
+"""
+import re
+from collections import namedtuple
+
+Grade = namedtuple("Grade", "correct typo")
+
+# answer_key içinde karşılıkları ayıran karakter (normalize sonrası metinde bulunmaz)
+SEPARATOR = "|"
+
+_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i", "Î": "i", "î": "i",
+    "Ç": "c", "ç": "c", "Ğ": "g", "ğ": "g", "Ö": "o", "ö": "o",
+    "Ş": "s", "ş": "s", "Ü": "u", "ü": "u", "Â": "a", "â": "a", "Û": "u", "û": "u",
+    "'": None, "’": None,
+})
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+_ALTERNATIVES = re.compile(r"[,;]")
+_PARENTHESES = re.compile(r"\([^)]*\)")
+
+
+def normalize(text):
+    text = _PUNCTUATION.sub(" ", text.translate(_FOLD).lower())
+    return " ".join(text.split())
+
+
+def answer_key(text):
+    """Beklenen metin -> SEPARATOR ile birleştirilmiş normalleştirilmiş karşılıklar.
+    Parantez içi açıklamalar hem yazılarak hem yazılmadan kabul edilir."""
+    parts = [text]
+    if "," in text or ";" in text:
+        parts += _ALTERNATIVES.split(text)
+    keys = []
+    for part in parts:
+        variants = (part, _PARENTHESES.sub(" ", part)) if "(" in part else (part,)
+        for variant in variants:
+            key = normalize(variant)
+            if key and key not in keys:
+                keys.append(key)
+    return SEPARATOR.join(keys)
+
+
+def tolerance(length):
+    """Bu uzunluktaki bir karşılıkta yazım hatası sayılacak en fazla düzenleme"""
+    if length < 4:
+        return 0
+    if length < 9:
+        return 1
+    if length < 17:
+        return 2
+    return 3
+
+
+def distance(pattern, text, max_distance):
+    """Levenshtein mesafesi; max_distance'ı aşarsa max_distance + 1.
+
+    Myers'ın bit-paralel algoritması (Hyyrö'nün global mesafe uyarlaması):
+    pattern'in her karakteri bir bit, text'in her karakteri için sabit
+    sayıda tam sayı işlemi yapılır.
+    """
+    m, n = len(pattern), len(text)
+    if abs(m - n) > max_distance:
+        return max_distance + 1
+    if not m:
+        return n
+
+    peq = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+
+    pv, mv, score = mask, 0, m
+    for j, char in enumerate(text):
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Kalan her karakter mesafeyi en fazla 1 azaltabilir
+        if score - (n - j - 1) > max_distance:
+            return max_distance + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+    return score if score <= max_distance else max_distance + 1
+
+
+def grade(answer, key):
+    """answer: kullanıcının yazdığı, key: answer_key(beklenen)"""
+    given = normalize(answer)
+    if not given:
+        return Grade(False, False)
+    typo = False
+    for expected in key.split(SEPARATOR):
+        if given == expected:
+            return Grade(True, False)
+        limit = tolerance(len(expected))
+        if not typo and limit and distance(expected, given, limit) <= limit:
+            typo = True
+    return Grade(typo, typo)
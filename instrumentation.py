@@ -0,0 +1,141 @@
+"""İsteğe bağlı ölçüm katmanı: SQL ifadeleri, worker işleri, ekranlar ve geçişler.
+
+Kapalıyken (varsayılan) hiçbir fonksiyon sarılmaz ve bağlantıya trace
+callback kurulmaz; tek maliyet açılışta bir enabled kontrolüdür.
+
+Açıkken:
+- statements: Connection.set_trace_callback ile her SQL ifadesinin sayısı
+  ve süresi. Değerler '?' ile değiştirilir, aynı ifade tek satırda toplanır.
+  Trace callback yalnızca ifadenin başladığını bildirir; süre bir sonraki
+  ifadeye ya da işin bitişine kadar ölçülür (satırların okunması dahil),
+  yani yaklaşıktır.
+- jobs: DBWorker'da çalışan her işin süresi (fonksiyon adına göre)
+- screens: VocabApp.show_* ekranlarının kurulma süresi
+- transitions: kart/soru geçişleri (sonraki öğenin ekrana yazılması)
+
+Her tablo ad -> [sayı, toplam ms, en uzun ms] tutar.
+"""
+import functools
+import json
+import re
+import threading
+import time
+from datetime import datetime
+
+# Metin ve sayı sabitleri (trace callback bağlanan değerleri yerleştirilmiş verir)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SPACES = re.compile(r"\s+")
+
+TABLES = ("statements", "jobs", "screens", "transitions")
+
+
+def normalize_sql(sql):
+    return _SPACES.sub(" ", _LITERALS.sub("?", sql)).strip()
+
+
+class Instruments:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.since = datetime.now()
+            for table in TABLES:
+                setattr(self, table, {})
+        # Worker iş parçacığında başlamış ve henüz süresi yazılmamış ifade
+        self._statement = None
+
+    def _add(self, table, name, ms):
+        with self.lock:
+            entry = table.get(name)
+            if entry is None:
+                table[name] = [1, ms, ms]
+            else:
+                entry[0] += 1
+                entry[1] += ms
+                if ms > entry[2]:
+                    entry[2] = ms
+
+    # --- SQL (worker iş parçacığında çağrılır)
+
+    def attach(self, conn):
+        if self.enabled:
+            conn.set_trace_callback(self._trace)
+
+    def _trace(self, sql):
+        now = time.perf_counter()
+        self._finish_statement(now)
+        self._statement = (sql, now)
+
+    def _finish_statement(self, now):
+        if self._statement is not None:
+            sql, started = self._statement
+            self._statement = None
+            self._add(self.statements, normalize_sql(sql), (now - started) * 1000)
+
+    def job_done(self, name, ms):
+        self._finish_statement(time.perf_counter())
+        self._add(self.jobs, name, ms)
+
+    # --- Tk tarafı
+
+    def timed(self, table, name, func):
+        """func'ı süresini table'a yazan bir sarmalayıcıyla döndürür; kapalıyken func'ın kendisi"""
+        if not self.enabled:
+            return func
+        entries = getattr(self, table)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._add(entries, name, (time.perf_counter() - started) * 1000)
+        return wrapper
+
+    def transition(self, name, func):
+        return self.timed("transitions", name, func)
+
+    def wrap_screens(self, app, prefix="show_"):
+        """app'in show_* metotlarını örnek üzerinde süre ölçen sarmalayıcılarla değiştirir"""
+        if not self.enabled:
+            return
+        for name in dir(type(app)):
+            # Hata pencereleri kullanıcıyı bekler; süreleri ekran kurulumu değildir
+            if name.startswith(prefix) and not name.endswith("_error"):
+                setattr(app, name, self.timed("screens", name, getattr(app, name)))
+
+    # --- Rapor
+
+    def snapshot(self):
+        """Tablo adı -> toplam süreye göre sıralı [{name, count, total_ms, mean_ms, max_ms}]"""
+        with self.lock:
+            tables = {table: list(getattr(self, table).items()) for table in TABLES}
+        return {
+            table: [{"name": name, "count": count, "total_ms": round(total, 3),
+                     "mean_ms": round(total / count, 3), "max_ms": round(longest, 3)}
+                    for name, (count, total, longest) in sorted(rows, key=lambda row: -row[1][1])]
+            for table, rows in tables.items()
+        }
+
+    def dump(self, path, **extra):
+        data = {"since": self.since.isoformat(timespec="seconds"),
+                "dumped": datetime.now().isoformat(timespec="seconds"),
+                **extra, **self.snapshot()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def format_table(rows, limit=40, width=90):
+    """snapshot() tablosu -> sabit genişlikli metin satırları"""
+    lines = [f"{'sayı':>7} {'toplam ms':>11} {'ort. ms':>9} {'en uzun':>9}  ad"]
+    for row in rows[:limit]:
+        name = row["name"] if len(row["name"]) <= width else row["name"][:width - 1] + "…"
+        lines.append(f"{row['count']:>7} {row['total_ms']:>11.1f} {row['mean_ms']:>9.2f} "
+                     f"{row['max_ms']:>9.2f}  {name}")
+    if len(rows) > limit:
+        lines.append(f"... ve {len(rows) - limit} satır daha")
+    return lines
@@ -0,0 +1,52 @@
+"""Kelime başına hata ve başarı sayaçları.
+
+Sayaçlar word_stats tablosunda tutulur ve AnswerLog kancası (apply_answers)
+ile, cevapların yazıldığı transaction içinde artırılır; answer_events hiç
+yeniden taranmaz. En çok yanlış yapılan kelimeler oturumu, errors
+üzerindeki kısmi indeksten (idx_word_stats_errors) okunur.
+"""
+from collections import Counter
+
+import srs
+from word_store import WordStore
+
+# "En çok yanlış yapılanlar" oturumundaki kelime sayısı
+MOST_MISSED = 30
+
+
+def apply_answers(cursor, events):
+    """AnswerLog kancası: her modun cevaplarını kelimenin sayaçlarına ekler."""
+    errors = Counter()
+    successes = Counter()
+    last_error = {}
+    for event in events:
+        if event.correct:
+            successes[event.word_id] += 1
+        else:
+            errors[event.word_id] += 1
+            # Kayıtlar cevap sırasıyla gelir
+            last_error[event.word_id] = event.answered_at
+    # Cevap yazılmadan önce silinmiş kelimeler atlanır
+    cursor.executemany('''
+        INSERT INTO word_stats (word_id, errors, successes, last_error)
+        SELECT id, ?, ?, ? FROM words WHERE id = ?
+        ON CONFLICT (word_id) DO UPDATE SET
+            errors = errors + excluded.errors,
+            successes = successes + excluded.successes,
+            last_error = COALESCE(excluded.last_error, last_error)
+    ''', [(errors[word_id], successes[word_id],
+           srs.format_time(last_error[word_id]) if word_id in last_error else None, word_id)
+          for word_id in errors.keys() | successes.keys()])
+
+
+def most_missed(conn, limit=MOST_MISSED, keys=False):
+    """Tüm setlerde en çok yanlış yapılan kelimeler (eşitlikte daha az bilinen önce)"""
+    columns = 'w.id, w.turkish, w.english' + (', w.turkish_key, w.english_key' if keys else '')
+    # CROSS JOIN: sayaçlar önce (indeks sırasıyla) okunur, words'ten yalnızca limit kadar satır
+    return WordStore.from_cursor(conn.execute(f'''
+        SELECT {columns}
+        FROM word_stats s CROSS JOIN words w ON w.id = s.word_id
+        WHERE s.errors > 0
+        ORDER BY s.errors DESC, s.successes
+        LIMIT ?
+    ''', (limit,)))
@@ -0,0 +1,171 @@
+"""Ekranların kullandığı veritabanı işlemleri.
+
+Hepsi ilk argüman olarak bağlantı alır ve DBWorker üzerinden worker
+iş parçacığında çalıştırılır. Uzun yazma işlemleri progress(done, total)
+ile ilerleme bildirir (ve bu çağrı üzerinden iptal edilebilir).
+"""
+import json
+from array import array
+from datetime import datetime
+
+from grading import answer_key
+from word_store import WordStore
+
+# Uzun yazmalarda ilerleme bu kadar satırda bir bildirilir
+PROGRESS_ROWS = 2000
+
+# Toplu yazma ifadeleri: satırlar tek bir JSON dizisi olarak verilir ve
+# parça başına tek ifade çalışır. Satır başına ayrı ifade, words_fts
+# tetikleyicisinin her satırda indeksi diske boşaltmasına yol açar.
+# Değişen metinlerin cevap anahtarları (grading.answer_key) Python'da
+# hesaplanıp satırın sonunda verilir (with_keys).
+INSERT_WORDS = '''
+    INSERT INTO words (set_id, turkish, english, turkish_key, english_key)
+    SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'), json_extract(value, '$[2]'),
+           json_extract(value, '$[3]'), json_extract(value, '$[4]')
+    FROM json_each(?)
+'''
+UPDATE_WORDS = '''
+    UPDATE words SET turkish = json_extract(j.value, '$[0]'), english = json_extract(j.value, '$[1]'),
+                     turkish_key = json_extract(j.value, '$[3]'), english_key = json_extract(j.value, '$[4]')
+    FROM json_each(?) AS j WHERE words.id = json_extract(j.value, '$[2]')
+'''
+UPDATE_TURKISH = '''
+    UPDATE words SET turkish = json_extract(j.value, '$[0]'), turkish_key = json_extract(j.value, '$[2]')
+    FROM json_each(?) AS j WHERE words.id = json_extract(j.value, '$[1]')
+'''
+UPDATE_ENGLISH = '''
+    UPDATE words SET english = json_extract(j.value, '$[0]'), english_key = json_extract(j.value, '$[2]')
+    FROM json_each(?) AS j WHERE words.id = json_extract(j.value, '$[1]')
+'''
+DELETE_WORDS = 'DELETE FROM words WHERE id IN (SELECT value FROM json_each(?))'
+
+
+def set_summaries(conn):
+    """Set listesi: (id, name, created_date, word_count, last_practiced) tek sorguda"""
+    return conn.execute('''
+        SELECT id, name, created_date, word_count, last_practiced
+        FROM word_sets
+        ORDER BY created_date DESC
+    ''').fetchall()
+
+
+def set_words(conn, set_id):
+    """Setin (id, turkish, english) satırları (WordStore)"""
+    return WordStore.from_cursor(conn.execute('SELECT id, turkish, english FROM words WHERE set_id = ?',
+                                              (set_id,)))
+
+
+def writing_words(conn, set_id):
+    """Yazma pratiği için kelimeler + hazır cevap anahtarları (grading.answer_key)"""
+    return WordStore.from_cursor(conn.execute('''
+        SELECT id, turkish, english, turkish_key, english_key FROM words WHERE set_id = ?
+    ''', (set_id,)))
+
+
+def set_word_count(conn, set_id):
+    row = conn.execute('SELECT word_count FROM word_sets WHERE id = ?', (set_id,)).fetchone()
+    return row[0] if row else 0
+
+
+def set_id_range(conn, set_id):
+    """(kelime sayısı, en küçük id, en büyük id); idx_words_set_id ile set okunmadan"""
+    return conn.execute('''
+        SELECT word_count,
+               (SELECT min(id) FROM words WHERE set_id = s.id),
+               (SELECT max(id) FROM words WHERE set_id = s.id)
+        FROM word_sets s WHERE id = ?
+    ''', (set_id,)).fetchone() or (0, None, None)
+
+
+def set_word_ids(conn, set_id):
+    """Setin yalnızca word_id'leri (kelime başına 8 bayt)"""
+    cursor = conn.execute('SELECT id FROM words WHERE set_id = ?', (set_id,))
+    return array('q', (row[0] for row in cursor))
+
+
+def existing_word_ids(conn, set_id, ids):
+    """ids içinden sette bulunanlar"""
+    return [row[0] for row in conn.execute('''
+        SELECT id FROM words WHERE set_id = ? AND id IN (SELECT value FROM json_each(?))
+    ''', (set_id, json.dumps(ids)))]
+
+
+def words_by_ids(conn, ids, keys=False):
+    """ids sırasıyla (id, turkish, english) ya da keys ile cevap anahtarları da;
+    silinmiş kelimeler atlanır"""
+    columns = 'w.id, w.turkish, w.english' + (', w.turkish_key, w.english_key' if keys else '')
+    return WordStore.from_cursor(conn.execute(f'''
+        SELECT {columns} FROM json_each(?) AS j JOIN words w ON w.id = j.value ORDER BY j.key
+    ''', (json.dumps(list(ids)),)))
+
+
+def set_name(conn, set_id):
+    return conn.execute('SELECT name FROM word_sets WHERE id = ?', (set_id,)).fetchone()[0]
+
+
+def set_contents(conn, set_id):
+    """Düzenleme ekranı için (set adı, [[word_id, türkçe, ingilizce], ...])"""
+    return set_name(conn, set_id), [list(row) for row in set_words(conn, set_id)]
+
+
+def mark_practiced(conn, *set_ids):
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    conn.executemany('UPDATE word_sets SET last_practiced = ? WHERE id = ?',
+                     [(now, set_id) for set_id in set_ids])
+    conn.commit()
+
+
+def with_keys(rows, *columns):
+    """Satırların sonuna columns sıradaki metinlerin cevap anahtarlarını ekler:
+    INSERT_WORDS için (1, 2), UPDATE_WORDS için (0, 1), UPDATE_TURKISH/ENGLISH için (0,)"""
+    return [(*row, *[answer_key(row[column]) for column in columns]) for row in rows]
+
+
+def write_rows(cursor, sql, rows, chunk_rows=PROGRESS_ROWS):
+    """Yukarıdaki toplu ifadelerden biriyle rows'u parça parça yazar;
+    her parçadan sonra yazılan satır sayısını üretir."""
+    for start in range(0, len(rows), chunk_rows):
+        chunk = rows[start:start + chunk_rows]
+        cursor.execute(sql, (json.dumps(chunk, ensure_ascii=False),))
+        yield len(chunk)
+
+
+def _write(cursor, sql, rows, progress, done, total):
+    for written in write_rows(cursor, sql, rows):
+        done += written
+        if progress:
+            progress((done, total))
+    return done
+
+
+def create_set(conn, name, words, progress=None):
+    """Yeni set + kelimeleri tek transaction'da; set id'sini döndürür.
+    İsim ya da İngilizce kelime tekrarında sqlite3.IntegrityError yükselir."""
+    cursor = conn.cursor()
+    cursor.execute('INSERT INTO word_sets (name, created_date) VALUES (?, ?)',
+                   (name, datetime.now().strftime("%Y-%m-%d %H:%M")))
+    set_id = cursor.lastrowid
+    _write(cursor, INSERT_WORDS, with_keys([(set_id, turkish, english) for turkish, english in words], 1, 2),
+           progress, 0, len(words))
+    conn.commit()
+    return set_id
+
+
+def save_set_changes(conn, set_id, new_name, deletes, swapped, updates, inserts, progress=None):
+    """Düzenleme ekranının hesapladığı farkları tek transaction'da uygular"""
+    cursor = conn.cursor()
+    total = len(deletes) + len(swapped) + len(updates) + len(inserts)
+    if new_name is not None:
+        cursor.execute('UPDATE word_sets SET name = ? WHERE id = ?', (new_name, set_id))
+    done = _write(cursor, DELETE_WORDS, deletes, progress, 0, total)
+    done = _write(cursor, UPDATE_ENGLISH, with_keys(swapped, 0), progress, done, total)
+    done = _write(cursor, UPDATE_WORDS, with_keys(updates, 0, 1), progress, done, total)
+    _write(cursor, INSERT_WORDS, with_keys(inserts, 1, 2), progress, done, total)
+    conn.commit()
+
+
+def delete_set(conn, set_id):
+    # Kelimeler ON DELETE CASCADE ile birlikte silinir
+    conn.execute('DELETE FROM word_sets WHERE id = ?', (set_id,))
+    conn.commit()
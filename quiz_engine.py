@@ -0,0 +1,350 @@
+"""Tkinter'dan bağımsız quiz oturumları.
+
+Her pratik modu için bir oturum sınıfı vardır. Ekranlar yalnızca şu küçük
+arayüzü kullanır:
+
+    item = session.next_item()   # sıradaki soru, bittiğinde None
+    result = session.submit(x)   # cevabı değerlendirir
+    session.summary()            # oturum özeti
+
+``seed`` verildiğinde karıştırma ve seçenek üretimi tekrarlanabilir olur;
+böylece oturum mantığı ekran olmadan test edilip ölçülebilir.
+
+``listener`` verilirse her cevap listener(word_id, mode, correct, response_ms)
+şeklinde bildirilir (ör. AnswerLog.record).
+
+``words`` bir liste, bir WordStore/WordView ya da sayfalı bir deste
+(deck.Deck) olabilir. Kelimeler kopyalanmaz: oturum sırası depoya bakan
+karışık bir görünümdür (word_store.shuffled; liste önce depoya çevrilir).
+Deste zaten karışık sıradadır (``shuffled``) ve yalnızca sırayla okunur;
+rastgele seçimler bellekteki sayfalardan (``loaded()``) yapılır.
+"""
+import random
+import time
+from collections import namedtuple
+
+import grading
+import word_store
+
+# words: (id, turkish, english) demetleri
+Summary = namedtuple("Summary", "mode total answered correct mistakes")
+# typo: cevap kabul edildi ama küçük bir yazım hatası vardı (yalnızca yazma pratiği)
+Result = namedtuple("Result", "correct expected typo", defaults=(False,))
+
+Card = namedtuple("Card", "word_id direction front_text back_text turkish english")
+Question = namedtuple("Question", "word_id question answer key")
+Choice = namedtuple("Choice", "word_id question answer choices")
+MatchGroup = namedtuple("MatchGroup", "number turkish english")
+
+
+class QuizSession:
+    """Tüm modların ortak durumu: sıra, doğru sayısı ve hatalı kelimeler."""
+
+    mode = None
+
+    def __init__(self, words, seed=None, listener=None):
+        self.rng = random.Random(seed)
+        self.listener = listener
+        self.shown_at = None
+        if getattr(words, "shuffled", False):
+            self.words = words
+        else:
+            self.words = word_store.shuffled(words, self.rng)
+        self.index = -1
+        self.current = None
+        self.correct = 0
+        # word_id -> doğru mu; aynı kelime iki kez sayılmaz
+        self.results = {}
+        self.mistakes = {}
+
+    def __len__(self):
+        return len(self.words)
+
+    @property
+    def position(self):
+        """Ekranda gösterilecek 1 tabanlı sıra numarası"""
+        return self.index + 1
+
+    def has_next(self):
+        return self.index + 1 < len(self.words)
+
+    def next_item(self):
+        if not self.has_next():
+            self.index = len(self.words)
+            self.current = None
+            return None
+        self.index += 1
+        self.current = self._make_item(self.words[self.index])
+        self.shown_at = time.monotonic()
+        return self.current
+
+    def submit(self, answer):
+        if self.current is None:
+            raise RuntimeError("Cevaplanacak soru yok")
+        correct = self._grade(self.current, answer)
+        self._record(self.words[self.index], correct)
+        self._notify(self.words[self.index][0], correct)
+        return Result(correct, self._expected(self.current))
+
+    def summary(self):
+        return Summary(self.mode, len(self.words), len(self.results), self.correct,
+                       list(self.mistakes.values()))
+
+    def _notify(self, word_id, correct):
+        if self.listener is not None:
+            response_ms = int((time.monotonic() - self.shown_at) * 1000)
+            self.listener(word_id, self.mode, correct, response_ms)
+
+    def _record(self, word, correct):
+        word_id = word[0]
+        if word_id in self.results:
+            return
+        self.results[word_id] = correct
+        if correct:
+            self.correct += 1
+        else:
+            self.mistakes[word_id] = word
+
+    def _pool(self):
+        """Rastgele seçim yapılabilecek kelimeler (destede yalnızca okunmuş sayfalar)"""
+        loaded = getattr(self.words, "loaded", None)
+        return loaded() if loaded else self.words
+
+    def _make_item(self, word):
+        raise NotImplementedError
+
+    def _grade(self, item, answer):
+        raise NotImplementedError
+
+    def _expected(self, item):
+        return item.answer
+
+
+class FlashcardSession(QuizSession):
+    """direction: "tr_to_en", "en_to_tr" ya da "mixed"; submit(True/False) = biliyorum/bilmiyorum"""
+
+    mode = "flashcard"
+
+    def __init__(self, words, direction="tr_to_en", seed=None, listener=None):
+        super().__init__(words, seed, listener)
+        self.direction = direction
+
+    def skip(self):
+        return self.next_item()
+
+    def _make_item(self, word):
+        word_id, turkish, english = word
+        # Karışık modda her kart için yön rastgele seçilir
+        direction = self.direction
+        if direction == "mixed":
+            direction = self.rng.choice(["tr_to_en", "en_to_tr"])
+        if direction == "tr_to_en":
+            return Card(word_id, direction, turkish, english, turkish, english)
+        return Card(word_id, direction, english, turkish, turkish, english)
+
+    def _grade(self, item, answer):
+        return bool(answer)
+
+    def _expected(self, item):
+        return item.back_text
+
+
+class WritingSession(QuizSession):
+    """answer_language: cevabın yazılacağı dil ("en" ya da "tr")
+
+    words (id, turkish, english, turkish_key, english_key) de olabilir;
+    anahtarlar verilmezse grading.answer_key ile hesaplanır.
+    """
+
+    mode = "writing"
+
+    def __init__(self, words, answer_language="en", seed=None, listener=None):
+        super().__init__(words, seed, listener)
+        self.answer_language = answer_language
+        self.typo = False
+
+    def submit(self, answer):
+        return super().submit(answer)._replace(typo=self.typo)
+
+    def _make_item(self, word):
+        word_id, turkish, english, *keys = word
+        turkish_key, english_key = keys or (None, None)
+        if self.answer_language == "en":
+            return Question(word_id, turkish, english, english_key or grading.answer_key(english))
+        return Question(word_id, english, turkish, turkish_key or grading.answer_key(turkish))
+
+    def _grade(self, item, answer):
+        grade = grading.grade(answer, item.key)
+        self.typo = grade.typo
+        return grade.correct
+
+
+class MultipleChoiceSession(QuizSession):
+    """Türkçe kelimeye karşılık dört İngilizce seçenek.
+
+    similarity verilirse (zor mod) yanlış seçenekler önce doğru cevaba
+    benzeyen kelimelerden seçilir.
+    """
+
+    mode = "multiple_choice"
+    choice_count = 4
+
+    def __init__(self, words, seed=None, similarity=None, listener=None):
+        super().__init__(words, seed, listener)
+        if len(self.words) < self.choice_count:
+            raise ValueError(f"Bu test için en az {self.choice_count} kelime gerekli")
+        self.similarity = similarity
+
+    def _make_item(self, word):
+        word_id, turkish, english = word
+        wanted = self.choice_count - 1
+        choices = [english]
+        used = {english}
+
+        # Zor mod: hazır komşu listesinden seç
+        if self.similarity is not None:
+            similar = [other for other in map(self.words.find, self.similarity.similar(word_id))
+                       if other is not None]
+            for other in self.rng.sample(similar, len(similar)):
+                if len(choices) > wanted:
+                    break
+                if other[2] not in used:
+                    used.add(other[2])
+                    choices.append(other[2])
+
+        # Eksik kalanlar: rastgele indeks seç, aynı kelime/metin gelirse tekrar dene
+        pool = self._pool()
+        english_at = getattr(pool, "english_at", None) or (lambda index: pool[index][2])
+        count = len(pool)
+        attempts = 0
+        while len(choices) <= wanted and attempts < count * 4:
+            attempts += 1
+            other = english_at(self.rng.randrange(count))
+            if other not in used:
+                used.add(other)
+                choices.append(other)
+
+        self.rng.shuffle(choices)
+        return Choice(word_id, turkish, english, choices)
+
+    def _grade(self, item, answer):
+        return answer == item.answer
+
+
+class MatchingSession(QuizSession):
+    """Kelimeler group_size'lık gruplar halinde eşleştirilir.
+
+    next_item() bir grup döndürür; submit((turkish_id, english_id)) tek bir
+    eşleştirme denemesini değerlendirir. Bir kelime, ilk denemede doğru
+    eşleştirildiyse doğru sayılır ve listener'a yalnızca bir kez, eşleştiği
+    anda bu sonuçla bildirilir; aradaki yanlış denemeler ayrıca bildirilmez.
+    """
+
+    mode = "matching"
+
+    def __init__(self, words, group_size=10, seed=None, listener=None):
+        super().__init__(words, seed, listener)
+        if len(self.words) < 3:
+            raise ValueError("Bu test için en az 3 kelime gerekli")
+        self.group_size = group_size
+        # Gruplar sırası gelince okunur; by_id yalnızca o anki grubu tutar
+        self.by_id = {}
+        self.matched = set()
+        self.failed = set()
+
+    def __len__(self):
+        return -(-len(self.words) // self.group_size)
+
+    def has_next(self):
+        return self.index + 1 < len(self)
+
+    def group_length(self, index):
+        """index'inci (0 tabanlı) grubun kelime sayısı"""
+        return min(self.group_size, len(self.words) - index * self.group_size)
+
+    def next_item(self):
+        if not self.has_next():
+            self.index = len(self)
+            self.current = None
+            return None
+        self.index += 1
+        self.matched = set()
+        self.failed = set()
+        start = self.index * self.group_size
+        group = [self.words[i] for i in range(start, start + self.group_length(self.index))]
+        self.by_id = {word[0]: word for word in group}
+        turkish = [(w[0], w[1]) for w in group]
+        english = [(w[0], w[2]) for w in group]
+        self.rng.shuffle(english)
+        self.current = MatchGroup(self.index + 1, turkish, english)
+        self.shown_at = time.monotonic()
+        return self.current
+
+    def is_matched(self, word_id):
+        return word_id in self.matched
+
+    def group_complete(self):
+        return self.current is not None and len(self.matched) == len(self.current.turkish)
+
+    def submit(self, answer):
+        if self.current is None:
+            raise RuntimeError("Cevaplanacak soru yok")
+        turkish_id, english_id = answer
+        word = self.by_id[turkish_id]
+        if turkish_id == english_id:
+            self.matched.add(turkish_id)
+            correct = turkish_id not in self.failed
+            self._record(word, correct)
+            self._notify(turkish_id, correct)
+            result = Result(True, word[2])
+        else:
+            self.failed.add(turkish_id)
+            result = Result(False, word[2])
+        # Bir sonraki eşleştirmenin süresi bu denemeden itibaren ölçülür
+        self.shown_at = time.monotonic()
+        return result
+
+
+def _self_check():
+    """Ekransız, tohumlu kısa oturumlarla her modun submit/summary yolunu dener"""
+    words = [(i, f"kelime{i}", f"word{i}") for i in range(1, 9)]
+
+    def run(session, answer):
+        while (item := session.next_item()) is not None:
+            assert session.submit(answer(item)).correct
+        summary = session.summary()
+        assert summary.answered == summary.correct == len(words), summary
+
+    run(FlashcardSession(words, "mixed", seed=1), lambda item: True)
+    run(WritingSession(words, seed=1), lambda item: item.answer)
+    run(MultipleChoiceSession(words, seed=1), lambda item: item.answer)
+
+    session = MultipleChoiceSession(words, seed=1)
+    item = session.next_item()
+    wrong = next(choice for choice in item.choices if choice != item.answer)
+    assert not session.submit(wrong).correct
+    assert session.summary().mistakes
+
+    session = MatchingSession(words, group_size=3, seed=1)
+    while (group := session.next_item()) is not None:
+        for word_id, _ in group.turkish:
+            assert session.submit((word_id, word_id)).correct
+        assert session.group_complete()
+    assert session.summary().correct == len(words)
+
+    # Yanlış denemeler: kelime başına tek bildirim, ilk denemenin sonucuyla
+    answers = []
+    session = MatchingSession(words, group_size=3, seed=1,
+                              listener=lambda word_id, mode, correct, ms: answers.append((word_id, correct)))
+    group = session.next_item()
+    (first, _), (second, _) = group.turkish[:2]
+    for _ in range(3):
+        assert not session.submit((first, second)).correct
+    session.submit((first, first))
+    session.submit((second, second))
+    assert answers == [(first, False), (second, True)], answers
+
+
+if __name__ == "__main__":
+    _self_check()
+    print("quiz_engine: tamam")
@@ -0,0 +1,206 @@
+"""Set verileri için önbellekli okuma katmanı.
+
+Set kelimeleri, yazma pratiği kelimeleri, set listesi ve benzerlik
+indeksleri sınırlı bir LRU önbellekte tutulur; aynı set art arda farklı
+modlarda çalışıldığında sorgu tekrarlanmaz.
+
+Her setin bir nesil (generation) sayacı vardır ve önbellek anahtarı
+(tür, set_id, dönem, nesil) şeklindedir. Seti değiştiren her yazma
+(create_set, save_set_changes, delete_set) o setin ve set listesinin
+neslini artırır. Birden çok seti değiştirebilen toplu yazmalar (içe
+aktarma, tekrar birleştirme) bulk ile çalıştırılır ve dönemi artırarak
+her şeyi geçersiz kılar. Yükleme sürerken nesil değişirse sonuç önbelleğe
+yazılmaz.
+
+Büyük setlerde (PAGED_FROM kelimeden fazla) pratik oturumları setin
+tamamı yerine sayfalı bir desteyle (deck.Deck) başlar; deste önbelleğe
+girmez. Birden çok setten çalışırken de seçimin toplamı PAGED_FROM'u
+aşıyorsa setlerin kelime sayıları set listesinden alınır ve deste
+setlerden orantılı örnekleyerek kurulur.
+
+Metotlar DBWorker işleri gibi (conn, ...) alır ve worker iş parçacığında
+çağrılır; invalidate ve stats Tk tarafından da çağrılabilir.
+"""
+import random
+import threading
+from collections import OrderedDict
+
+import deck
+import queries
+import word_store
+from similarity import SimilarityIndex
+from word_store import WordStore
+
+# En fazla kayıt sayısı ve tüm kayıtlardaki toplam kelime satırı
+CAPACITY = 32
+MAX_ROWS = 500_000
+# Bundan büyük setler pratikte sayfalı desteyle okunur
+PAGED_FROM = 2000
+
+# Set listesinin anahtarındaki set_id
+SET_LIST = None
+
+
+class WordRepository:
+    def __init__(self, capacity=CAPACITY, max_rows=MAX_ROWS):
+        self.capacity = capacity
+        self.max_rows = max_rows
+        self.lock = threading.Lock()
+        # (tür, set_id, dönem, nesil) -> (değer, satır sayısı)
+        self.entries = OrderedDict()
+        self.rows = 0
+        self.generations = {}
+        self.epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _key(self, kind, set_id):
+        return kind, set_id, self.epoch, self.generations.get(set_id, 0)
+
+    def _cached(self, kind, set_id, load, rows=len):
+        with self.lock:
+            key = self._key(kind, set_id)
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = load()
+        size = rows(value)
+        with self.lock:
+            # Yükleme sırasında set değiştiyse eski veri önbelleğe girmez
+            if key == self._key(kind, set_id) and size <= self.max_rows:
+                self.entries[key] = (value, size)
+                self.rows += size
+                self._evict()
+        return value
+
+    def _evict(self):
+        while len(self.entries) > self.capacity or self.rows > self.max_rows:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.rows -= size
+            self.evictions += 1
+
+    def _drop(self, keep):
+        for key in [key for key in self.entries if not keep(key)]:
+            self.rows -= self.entries.pop(key)[1]
+
+    # --- Okuma
+
+    def set_summaries(self, conn):
+        return self._cached("summaries", SET_LIST, lambda: queries.set_summaries(conn))
+
+    def set_words(self, conn, set_id):
+        return self._cached("words", set_id, lambda: queries.set_words(conn, set_id))
+
+    def writing_words(self, conn, set_id):
+        return self._cached("writing", set_id, lambda: queries.writing_words(conn, set_id))
+
+    def word_count(self, conn, set_id):
+        return self._cached("count", set_id, lambda: queries.set_word_count(conn, set_id),
+                            rows=lambda _: 1)
+
+    def practice_words(self, conn, set_id, keys=False, limit=None, seed=None):
+        """Pratik oturumunun kelimeleri: küçük setlerde önbellekteki liste (limit
+        verilirse rastgele örneği), büyük setlerde sayfalı deste.
+        keys: yazma pratiği için cevap anahtarları da okunur."""
+        if self.word_count(conn, set_id) > PAGED_FROM:
+            return deck.open_deck(conn, set_id, limit, keys, seed)
+        words = self.writing_words(conn, set_id) if keys else self.set_words(conn, set_id)
+        if limit and limit < len(words):
+            words = word_store.sample(words, limit, random.Random(seed))
+        return words
+
+    def practice_sets(self, conn, set_ids, keys=False, limit=None, seed=None):
+        """practice_words'ün birden çok set için olanı; set_ids None ise tüm setler"""
+        if set_ids is not None and len(set_ids) == 1:
+            return self.practice_words(conn, set_ids[0], keys, limit, seed)
+        counts = self.word_counts(conn, set_ids)
+        if sum(counts.values()) > PAGED_FROM:
+            return deck.open_sets_deck(conn, counts, limit, keys, seed)
+        load = self.writing_words if keys else self.set_words
+        words = WordStore.from_rows(row for set_id in counts for row in load(conn, set_id))
+        if limit and limit < len(words):
+            return word_store.sample(words, limit, random.Random(seed))
+        return words
+
+    def word_counts(self, conn, set_ids=None):
+        """set_id -> kelime sayısı (önbellekteki set listesinden); set_ids None ise tüm setler"""
+        wanted = None if set_ids is None else set(set_ids)
+        return {row[0]: row[3] for row in self.set_summaries(conn)
+                if row[3] and (wanted is None or row[0] in wanted)}
+
+    def set_contents(self, conn, set_id):
+        """queries.set_contents ile aynı; satırlar düzenleme ekranı için her seferinde kopyalanır"""
+        words = self.set_words(conn, set_id)
+        name = self._cached("name", set_id, lambda: queries.set_name(conn, set_id), rows=lambda _: 1)
+        return name, [list(row) for row in words]
+
+    def similarity_index(self, conn, set_id):
+        words = self.set_words(conn, set_id)
+        return self._cached("similarity", set_id, lambda: SimilarityIndex(words),
+                            rows=lambda _: len(words))
+
+    # --- Yazma
+
+    def create_set(self, conn, name, words, progress=None):
+        set_id = SET_LIST
+        try:
+            set_id = queries.create_set(conn, name, words, progress)
+            return set_id
+        finally:
+            # Silinmiş bir setin id'si yeniden kullanılmış olabilir
+            self.invalidate(set_id)
+
+    def save_set_changes(self, conn, set_id, new_name, deletes, swapped, updates, inserts, progress=None):
+        try:
+            queries.save_set_changes(conn, set_id, new_name, deletes, swapped, updates, inserts, progress)
+        finally:
+            self.invalidate(set_id)
+
+    def delete_set(self, conn, set_id):
+        try:
+            queries.delete_set(conn, set_id)
+        finally:
+            self.invalidate(set_id)
+
+    def mark_practiced(self, conn, *set_ids):
+        try:
+            queries.mark_practiced(conn, *set_ids)
+        finally:
+            self.invalidate()
+
+    def bulk(self, conn, func, *args, **kwargs):
+        """Birden çok seti değiştirebilen bir yazma; ardından tüm önbellek geçersiz olur"""
+        try:
+            return func(conn, *args, **kwargs)
+        finally:
+            self.invalidate_all()
+
+    # --- Geçersiz kılma ve istatistik
+
+    def invalidate(self, set_id=SET_LIST):
+        """set_id'nin kayıtlarını ve set listesini geçersiz kılar"""
+        with self.lock:
+            for changed in {set_id, SET_LIST}:
+                self.generations[changed] = self.generations.get(changed, 0) + 1
+            self._drop(lambda key: key[1] not in (set_id, SET_LIST))
+            self.invalidations += 1
+
+    def invalidate_all(self):
+        with self.lock:
+            self.epoch += 1
+            self._drop(lambda key: False)
+            self.invalidations += 1
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / lookups if lookups else None,
+                    "entries": len(self.entries), "rows": self.rows,
+                    "evictions": self.evictions, "invalidations": self.invalidations}
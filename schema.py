@@ -0,0 +1,471 @@
+"""Veritabanı şeması ve sürüm geçişleri.
+
+Şemanın hangi sürümde olduğu ``PRAGMA user_version`` içinde tutulur. Her
+geçiş (migration) yalnızca bir kez, kendi transaction'ı içinde çalışır; bu
+sayede hem VocabularyAPP.py'nin hem de dict_to_database.py'nin oluşturduğu
+eski ``dictionary.db`` dosyaları aynı şemaya getirilir.
+
+Kullanıcının verisini değiştiren bir geçiş, kullanıcıya bir kez
+gösterilecek mesajları (liste) döndürebilir; migrate bunları notices'e
+ekler, notices verilmemişse stderr'e yazar.
+"""
+import sqlite3
+import sys
+
+import grading
+
+
+def _columns(cursor, table):
+    return [row[1] for row in cursor.execute(f'PRAGMA table_info({table})')]
+
+
+def _has_unique_index(cursor, table, columns):
+    """Tabloda verilen sütunlar üzerinde (sıralı) UNIQUE bir indeks var mı?"""
+    for _, index_name, unique, *_ in cursor.execute(f'PRAGMA index_list({table})').fetchall():
+        if not unique:
+            continue
+        index_columns = [row[2] for row in cursor.execute(f'PRAGMA index_info({index_name})')]
+        if index_columns == list(columns):
+            return True
+    return False
+
+
+def fold_sql(column):
+    """Arama için Türkçe i/ı/İ/I katlaması (SQL ifadesi). Diğer büyük/küçük
+    harf farkları FTS5 tokenizer'ı tarafından giderilir; Python tarafı search.fold."""
+    return f"replace(replace(replace({column}, 'İ', 'i'), 'I', 'i'), 'ı', 'i')"
+
+
+# words'e satır başına çalışan AFTER INSERT tetikleyicileri. Toplu aktarımda
+# (dict_to_database.py) parça boyunca kaldırılır, etkileri parça sonunda
+# restore_insert_triggers ile tek ifadelerle telafi edilir.
+WORD_COUNT_INSERT_TRIGGER = '''
+    CREATE TRIGGER IF NOT EXISTS words_count_insert AFTER INSERT ON words
+    BEGIN
+        UPDATE word_sets SET word_count = word_count + 1 WHERE id = NEW.set_id;
+    END
+'''
+
+WORDS_FTS_INSERT_TRIGGER = f'''
+    CREATE TRIGGER IF NOT EXISTS words_fts_insert AFTER INSERT ON words
+    BEGIN
+        INSERT INTO words_fts (rowid, turkish, english)
+        VALUES (NEW.id, {fold_sql('NEW.turkish')}, {fold_sql('NEW.english')});
+    END
+'''
+
+# İstatistiklerde öğrenildi sayılan kelime: doğru cevapları yanlışlardan en az
+# 3 fazla. {row}: word_stats satırının adı (NEW, OLD ya da takma ad)
+LEARNED_SQL = '({row}.successes - {row}.errors >= 3)'
+# Bundan uzun cevap süreleri (ör. ekrandan ayrılınmış) ortalama süreye katılmaz
+MAX_RESPONSE_MS = 60_000
+
+INSERT_TRIGGERS = {
+    'words_count_insert': WORD_COUNT_INSERT_TRIGGER,
+    'words_fts_insert': WORDS_FTS_INSERT_TRIGGER,
+}
+
+
+def suspend_insert_triggers(cursor):
+    """Açık bir transaction içinde çağrılır; restore_insert_triggers için
+    eşik id'yi döndürür (bundan sonra eklenen kelimelerin id'leri daha büyüktür)."""
+    for name in INSERT_TRIGGERS:
+        cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+    return cursor.execute('SELECT COALESCE(MAX(id), 0) FROM words').fetchone()[0]
+
+
+def restore_insert_triggers(cursor, watermark):
+    """watermark'tan sonra eklenen kelimeler için tetikleyicilerin işini toplu yapar"""
+    cursor.execute('''
+        UPDATE word_sets
+        SET word_count = word_count + (SELECT COUNT(*) FROM words
+                                       WHERE set_id = word_sets.id AND id > ?)
+        WHERE id IN (SELECT set_id FROM words WHERE id > ?)
+    ''', (watermark, watermark))
+    cursor.execute(f'''
+        INSERT INTO words_fts (rowid, turkish, english)
+        SELECT id, {fold_sql('turkish')}, {fold_sql('english')}
+        FROM words WHERE id > ?
+    ''', (watermark,))
+    for sql in INSERT_TRIGGERS.values():
+        cursor.execute(sql)
+
+
+def _v1_base_tables(cursor):
+    # Kelime setleri tablosu
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS word_sets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            created_date TEXT
+        )
+    ''')
+
+    # Kelimeler tablosu
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS words (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            set_id INTEGER,
+            turkish TEXT NOT NULL,
+            english TEXT NOT NULL,
+            FOREIGN KEY (set_id) REFERENCES word_sets (id) ON DELETE CASCADE
+        )
+    ''')
+
+
+def _v2_set_summaries(cursor):
+    # Set başına kelime sayısı ve son pratik zamanı
+    columns = _columns(cursor, 'word_sets')
+    if 'word_count' not in columns:
+        cursor.execute('ALTER TABLE word_sets ADD COLUMN word_count INTEGER NOT NULL DEFAULT 0')
+    if 'last_practiced' not in columns:
+        cursor.execute('ALTER TABLE word_sets ADD COLUMN last_practiced TEXT')
+    cursor.execute('''
+        UPDATE word_sets
+        SET word_count = (SELECT COUNT(*) FROM words WHERE words.set_id = word_sets.id)
+    ''')
+
+    # word_count sütununu words tablosundaki değişikliklerle güncel tut
+    cursor.execute(WORD_COUNT_INSERT_TRIGGER)
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS words_count_delete AFTER DELETE ON words
+        BEGIN
+            UPDATE word_sets SET word_count = word_count - 1 WHERE id = OLD.set_id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS words_count_move AFTER UPDATE OF set_id ON words
+        WHEN OLD.set_id IS NOT NEW.set_id
+        BEGIN
+            UPDATE word_sets SET word_count = word_count - 1 WHERE id = OLD.set_id;
+            UPDATE word_sets SET word_count = word_count + 1 WHERE id = NEW.set_id;
+        END
+    ''')
+
+
+def _v3_constraints_and_indexes(cursor):
+    # Sahipsiz kelimeler (silinmiş setlere ait) hiçbir ekrandan erişilemez
+    cursor.execute('''
+        DELETE FROM words
+        WHERE set_id IS NULL OR set_id NOT IN (SELECT id FROM word_sets)
+    ''')
+
+    notices = []
+    # Aynı set içinde tekrar eden İngilizce kelimeler silinmez: ilki dışındakiler
+    # "kelime (id)" olarak yeniden adlandırılır
+    cursor.execute('''
+        UPDATE words SET english = english || ' (' || id || ')'
+        WHERE id NOT IN (SELECT MIN(id) FROM words GROUP BY set_id, english)
+    ''')
+    if cursor.rowcount > 0:
+        notices.append(f"Aynı sette tekrar eden {cursor.rowcount} kelime silinmedi; İngilizcesinin "
+                       "sonuna \"(numara)\" eklenerek yeniden adlandırıldı.")
+
+    # Aynı isimli setleri "isim (id)" olarak yeniden adlandır
+    cursor.execute('''
+        UPDATE word_sets SET name = name || ' (' || id || ')'
+        WHERE id NOT IN (SELECT MIN(id) FROM word_sets GROUP BY name)
+    ''')
+    if cursor.rowcount > 0:
+        notices.append(f"Aynı isimli {cursor.rowcount} set, adının sonuna \"(numara)\" eklenerek "
+                       "yeniden adlandırıldı.")
+
+    cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_word_sets_name ON word_sets (name)')
+    # Set listesi created_date'e göre sıralanır
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_word_sets_created ON word_sets (created_date)')
+
+    # (set_id, english) indeksi "WHERE set_id = ?" sorgularını da karşılar;
+    # dict_to_database.py'nin oluşturduğu tablolarda bu indeks zaten var.
+    if not _has_unique_index(cursor, 'words', ('set_id', 'english')):
+        cursor.execute('CREATE UNIQUE INDEX idx_words_set_english ON words (set_id, english)')
+    return notices
+
+
+def _v4_review_state(cursor):
+    # Aralıklı tekrar durumu (srs.py); due indeksi tekrar oturumunu kurar
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS review_state (
+            word_id INTEGER PRIMARY KEY,
+            ease REAL NOT NULL,
+            interval REAL NOT NULL,
+            repetitions INTEGER NOT NULL,
+            lapses INTEGER NOT NULL DEFAULT 0,
+            due TEXT NOT NULL,
+            last_review TEXT,
+            FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_review_state_due ON review_state (due)')
+
+
+def _v5_answer_events(cursor):
+    # Cevap kayıtları (answer_log.py); yalnızca toplu halde eklenir
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS answer_events (
+            id INTEGER PRIMARY KEY,
+            word_id INTEGER NOT NULL,
+            set_id INTEGER,
+            mode TEXT NOT NULL,
+            correct INTEGER NOT NULL,
+            response_ms INTEGER,
+            answered_at TEXT NOT NULL
+        )
+    ''')
+
+
+def _v6_import_hashes(cursor):
+    # sozluk.json'dan gelen setlerin içerik özeti; NULL = uygulamada oluşturulmuş set
+    if 'content_hash' not in _columns(cursor, 'word_sets'):
+        cursor.execute('ALTER TABLE word_sets ADD COLUMN content_hash TEXT')
+
+
+def _v7_search_index(cursor):
+    # Tüm setlerde arama: words satırlarının katlanmış hali (rowid = words.id).
+    # İçeriksiz (contentless) tablo; metinler words'ten okunur, silmede eski
+    # değerler 'delete' komutuyla aynen verilmelidir.
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS words_fts
+        USING fts5(turkish, english, tokenize = 'trigram', content = '', columnsize = 0)
+    ''')
+    cursor.execute(f'''
+        INSERT INTO words_fts (rowid, turkish, english)
+        SELECT id, {fold_sql('turkish')}, {fold_sql('english')} FROM words
+    ''')
+    cursor.execute(WORDS_FTS_INSERT_TRIGGER)
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS words_fts_delete AFTER DELETE ON words
+        BEGIN
+            INSERT INTO words_fts (words_fts, rowid, turkish, english)
+            VALUES ('delete', OLD.id, {fold_sql('OLD.turkish')}, {fold_sql('OLD.english')});
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS words_fts_update AFTER UPDATE OF turkish, english ON words
+        BEGIN
+            INSERT INTO words_fts (words_fts, rowid, turkish, english)
+            VALUES ('delete', OLD.id, {fold_sql('OLD.turkish')}, {fold_sql('OLD.english')});
+            INSERT INTO words_fts (rowid, turkish, english)
+            VALUES (NEW.id, {fold_sql('NEW.turkish')}, {fold_sql('NEW.english')});
+        END
+    ''')
+
+
+def _v8_answer_keys(cursor):
+    # Yazma pratiğinde karşılaştırılan normalleştirilmiş karşılıklar (grading.answer_key).
+    # Anahtarlar Python'da hesaplanır: uygulamanın yazma yolları onları satırla
+    # birlikte yazar (queries.with_keys). Başka araçlarla eklenen satırlarda NULL
+    # kalır; okuyanlar NULL anahtarı grading.answer_key ile hesaplar.
+    columns = _columns(cursor, 'words')
+    if 'turkish_key' not in columns:
+        cursor.execute('ALTER TABLE words ADD COLUMN turkish_key TEXT')
+    if 'english_key' not in columns:
+        cursor.execute('ALTER TABLE words ADD COLUMN english_key TEXT')
+    # Tüm tablo belleğe alınmadan parça parça doldurulur (rowid değişmez)
+    reader = cursor.connection.execute('SELECT id, turkish, english FROM words')
+    while rows := reader.fetchmany(10_000):
+        cursor.executemany('UPDATE words SET turkish_key = ?, english_key = ? WHERE id = ?',
+                           [(grading.answer_key(turkish), grading.answer_key(english), word_id)
+                            for word_id, turkish, english in rows])
+    # Metni anahtarıyla birlikte güncellemeyen yazmalar (ör. sqlite3 komut satırı)
+    # eski anahtarı bırakmasın: anahtar NULL olur. SQL fonksiyonu kullanılmaz ki
+    # her bağlantıdan yazılabilsin. Anahtarı aynı kalan bir düzeltme (ör. "swim"
+    # -> "Swim!") de NULL'lanır; okuyanlar yeniden hesapladığı için zararsızdır.
+    changed = {column: f"NEW.{column} IS NOT OLD.{column} AND NEW.{column}_key IS OLD.{column}_key"
+               for column in ('turkish', 'english')}
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS words_keys_stale AFTER UPDATE OF turkish, english ON words
+        WHEN ({changed['turkish']}) OR ({changed['english']})
+        BEGIN
+            UPDATE words
+            SET turkish_key = CASE WHEN {changed['turkish']} THEN NULL ELSE turkish_key END,
+                english_key = CASE WHEN {changed['english']} THEN NULL ELSE english_key END
+            WHERE id = NEW.id;
+        END
+    ''')
+
+
+def _v9_set_id_order(cursor):
+    # Setin word_id'leri sıralı (indeks satırı rowid'i de içerir): sayfalı
+    # oturumlar için min/max id ve id ile rastgele yoklama O(log n) olur
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_words_set_id ON words (set_id, id)')
+
+
+def _v10_word_stats(cursor):
+    # Kelime başına hata/başarı sayaçları (mistakes.py); AnswerLog kancasıyla artırılır.
+    # Kısmi indeks "en çok yanlış yapılanlar" oturumunu sıralamadan okur.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS word_stats (
+            word_id INTEGER PRIMARY KEY,
+            errors INTEGER NOT NULL DEFAULT 0,
+            successes INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE
+        )
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_word_stats_errors
+        ON word_stats (errors DESC, successes) WHERE errors > 0
+    ''')
+    # Önceki cevaplar bir kez sayılır
+    cursor.execute('''
+        INSERT OR IGNORE INTO word_stats (word_id, errors, successes, last_error)
+        SELECT e.word_id, SUM(e.correct = 0), SUM(e.correct = 1),
+               MAX(CASE WHEN e.correct = 0 THEN e.answered_at END)
+        FROM answer_events e JOIN words w ON w.id = e.word_id
+        GROUP BY e.word_id
+    ''')
+
+
+def _v11_statistics(cursor):
+    # İstatistik ekranının artımlı özetleri (stats.py). Gün/mod ve set/mod
+    # başına sayaçlar AnswerLog kancasıyla artırılır; set başına görülen ve
+    # öğrenilen kelime sayıları word_stats tetikleyicileriyle güncel kalır.
+    for table, key in (('daily_stats', 'day TEXT NOT NULL'),
+                       ('set_stats', 'set_id INTEGER NOT NULL REFERENCES word_sets (id) ON DELETE CASCADE')):
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                {key},
+                mode TEXT NOT NULL,
+                answers INTEGER NOT NULL DEFAULT 0,
+                correct INTEGER NOT NULL DEFAULT 0,
+                response_ms INTEGER NOT NULL DEFAULT 0,
+                timed INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY ({key.split()[0]}, mode)
+            ) WITHOUT ROWID
+        ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS set_progress (
+            set_id INTEGER PRIMARY KEY,
+            seen INTEGER NOT NULL DEFAULT 0,
+            learned INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (set_id) REFERENCES word_sets (id) ON DELETE CASCADE
+        )
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS set_progress_insert AFTER INSERT ON word_stats
+        BEGIN
+            INSERT INTO set_progress (set_id, seen, learned)
+            SELECT set_id, 1, {LEARNED_SQL.format(row='NEW')} FROM words WHERE id = NEW.word_id
+            ON CONFLICT (set_id) DO UPDATE SET seen = seen + 1, learned = learned + excluded.learned;
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS set_progress_update AFTER UPDATE OF errors, successes ON word_stats
+        WHEN {LEARNED_SQL.format(row='NEW')} != {LEARNED_SQL.format(row='OLD')}
+        BEGIN
+            UPDATE set_progress
+            SET learned = learned + {LEARNED_SQL.format(row='NEW')} - {LEARNED_SQL.format(row='OLD')}
+            WHERE set_id = (SELECT set_id FROM words WHERE id = NEW.word_id);
+        END
+    ''')
+    # word_stats satırı kelimeyle birlikte (cascade) silinir; set_id hâlâ
+    # okunabilsin diye sayaçlar kelime silinmeden önce düşülür
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS set_progress_delete BEFORE DELETE ON words
+        WHEN EXISTS (SELECT 1 FROM word_stats WHERE word_id = OLD.id)
+        BEGIN
+            UPDATE set_progress
+            SET seen = seen - 1,
+                learned = learned - (SELECT {LEARNED_SQL.format(row='s')} FROM word_stats s
+                                     WHERE s.word_id = OLD.id)
+            WHERE set_id = OLD.set_id;
+        END
+    ''')
+    # Önceki cevaplar ve sayaçlar bir kez özetlenir
+    timed = f'CASE WHEN e.response_ms <= {MAX_RESPONSE_MS} THEN e.response_ms END'
+    cursor.execute(f'''
+        INSERT OR IGNORE INTO daily_stats (day, mode, answers, correct, response_ms, timed)
+        SELECT substr(e.answered_at, 1, 10), e.mode, COUNT(*), SUM(e.correct),
+               COALESCE(SUM({timed}), 0), COUNT({timed})
+        FROM answer_events e
+        GROUP BY 1, 2
+    ''')
+    cursor.execute(f'''
+        INSERT OR IGNORE INTO set_stats (set_id, mode, answers, correct, response_ms, timed)
+        SELECT w.set_id, e.mode, COUNT(*), SUM(e.correct),
+               COALESCE(SUM({timed}), 0), COUNT({timed})
+        FROM answer_events e JOIN words w ON w.id = e.word_id
+        GROUP BY 1, 2
+    ''')
+    cursor.execute(f'''
+        INSERT OR IGNORE INTO set_progress (set_id, seen, learned)
+        SELECT w.set_id, COUNT(*), SUM({LEARNED_SQL.format(row='s')})
+        FROM word_stats s JOIN words w ON w.id = s.word_id
+        GROUP BY w.set_id
+    ''')
+
+
+def _v12_key_indexes(cursor):
+    # Aramada tam ve baştan eşleşmeler (search.py) FTS adaylarından önce,
+    # normalleştirilmiş karşılıklar üzerinde aralık sorgusuyla bulunur
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_words_turkish_key ON words (turkish_key)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_words_english_key ON words (english_key)')
+
+
+# Sıra önemlidir: listedeki N. fonksiyon şemayı N. sürüme getirir.
+MIGRATIONS = [
+    _v1_base_tables,
+    _v2_set_summaries,
+    _v3_constraints_and_indexes,
+    _v4_review_state,
+    _v5_answer_events,
+    _v6_import_hashes,
+    _v7_search_index,
+    _v8_answer_keys,
+    _v9_set_id_order,
+    _v10_word_stats,
+    _v11_statistics,
+    _v12_key_indexes,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_version(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def migrate(conn, notices=None):
+    """Veritabanını SCHEMA_VERSION'a getirir, uygulanan geçiş sayısını döndürür.
+    Geçişlerin kullanıcıya mesajları notices listesine eklenir (verilmezse stderr)."""
+    version = get_version(conn)
+    if version == SCHEMA_VERSION:
+        # Güncel veritabanında açılışın şema maliyeti tek bir PRAGMA okumasıdır
+        return 0
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"dictionary.db şema sürümü ({version}) bu uygulamadan yeni ({SCHEMA_VERSION})")
+
+    applied = 0
+    messages = []
+    for target in range(version + 1, SCHEMA_VERSION + 1):
+        cursor = conn.cursor()
+        cursor.execute('BEGIN')
+        try:
+            messages += MIGRATIONS[target - 1](cursor) or []
+            cursor.execute(f'PRAGMA user_version = {target}')
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        applied += 1
+
+    if applied:
+        # Yeni indeksler için sorgu planlayıcısına istatistik topla
+        conn.execute('ANALYZE')
+        conn.commit()
+    if notices is None:
+        for message in messages:
+            print(f"Uyarı: {message}", file=sys.stderr)
+    else:
+        notices.extend(messages)
+    return applied
+
+
+def connect(path='dictionary.db', notices=None):
+    """Şeması güncel ve yabancı anahtarları açık bir bağlantı döndürür.
+    notices: migrate'e bakın."""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA foreign_keys = ON')
+    migrate(conn, notices)
+    return conn
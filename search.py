@@ -0,0 +1,94 @@
+"""Tüm setlerde, yazarken arama (FTS5 trigram indeksi: words_fts).
+
+İndeks schema._v7_search_index ile oluşturulur ve words üzerindeki
+tetikleyicilerle güncel tutulur. Metinler indekslenirken ve aranırken
+aynı şekilde katlanır: İ/I/ı -> i, diğer harfler tokenizer'da küçültülür.
+
+Trigram indeksi eşleşmeleri rowid sırasıyla döndürür; ilk CANDIDATES
+eşleşme arasında en iyi sonuç (ör. "run" ararken "run") bulunmayabilir.
+Bu yüzden tam ve baştan eşleşmeler önce turkish_key/english_key
+indekslerinden (grading.answer_key) okunur ve FTS adaylarıyla birleştirilir.
+Anahtarı NULL olan satırlar (başka araçlarla yazılmış) ayrıca okunup
+anahtarları burada hesaplanır.
+"""
+import time
+
+from grading import SEPARATOR, answer_key, normalize
+
+# Trigram indeksi 3 karakterden kısa parçaları arayamaz
+MIN_TERM = 3
+MAX_RESULTS = 50
+# Sıralama için indekslerden okunan en fazla eşleşme. bm25() her sorguda
+# terimin tüm geçişlerini saydığı için yaygın trigramlarda (ör. "ing")
+# yüz milisaniyeleri bulur; bunun yerine ilk CANDIDATES eşleşme okunup
+# aşağıdaki basit puanla sıralanır.
+CANDIDATES = 300
+
+_FOLD = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+
+
+def fold(text):
+    return text.translate(_FOLD).lower()
+
+
+def match_query(text):
+    """Kullanıcı metni -> FTS5 MATCH ifadesi (kelimeler VE ile bağlanır).
+    Aranabilir parça yoksa None."""
+    terms = [term for term in fold(text).split() if len(term) >= MIN_TERM]
+    if not terms:
+        return None
+    return " AND ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def score(query, turkish, english):
+    """Küçük puan önce: tam eşleşme, baştan eşleşme, kelime başı, herhangi bir yer"""
+    best = 3
+    for text in (turkish, english):
+        text = fold(text)
+        if text == query:
+            return 0, len(text)
+        if text.startswith(query):
+            best = min(best, 1)
+        elif f" {query}" in text:
+            best = min(best, 2)
+    return best, min(len(turkish), len(english))
+
+
+def search(conn, text, limit=MAX_RESULTS):
+    """(sonuçlar, süre ms); sonuçlar: (word_id, set_id, set adı, türkçe, ingilizce)"""
+    started = time.perf_counter()
+    query = match_query(text)
+    if query is None:
+        return [], 0.0
+    rows = {}
+    key = normalize(text)
+    if key:
+        # Anahtar indeksinde key ile başlayanlar; tam eşleşme aralığın başındadır
+        for column in ('turkish_key', 'english_key'):
+            for row in conn.execute(f'''
+                SELECT w.id, w.set_id, s.name, w.turkish, w.english
+                FROM words w JOIN word_sets s ON s.id = w.set_id
+                WHERE w.{column} >= ? AND w.{column} < ?
+                ORDER BY w.{column}
+                LIMIT ?
+            ''', (key, key + "\U0010ffff", CANDIDATES)):
+                rows[row[0]] = row
+        # Anahtarı henüz hesaplanmamış satırlar aralık sorgusuna girmez
+        for row in conn.execute('''
+            SELECT w.id, w.set_id, s.name, w.turkish, w.english
+            FROM words w JOIN word_sets s ON s.id = w.set_id
+            WHERE w.turkish_key IS NULL OR w.english_key IS NULL
+        '''):
+            if any(part.startswith(key) for text in row[3:]
+                   for part in answer_key(text).split(SEPARATOR)):
+                rows[row[0]] = row
+    for row in conn.execute('''
+        SELECT w.id, w.set_id, s.name, w.turkish, w.english
+        FROM (SELECT rowid FROM words_fts WHERE words_fts MATCH ? LIMIT ?) AS hits
+        JOIN words w ON w.id = hits.rowid
+        JOIN word_sets s ON s.id = w.set_id
+    ''', (query, CANDIDATES)):
+        rows.setdefault(row[0], row)
+    folded = " ".join(fold(text).split())
+    results = sorted(rows.values(), key=lambda row: score(folded, row[3], row[4]))
+    return results[:limit], (time.perf_counter() - started) * 1000
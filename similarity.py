@@ -0,0 +1,92 @@
+"""Çoktan seçmeli "zor mod" için benzer kelime indeksi.
+
+İngilizce kelimeler arasında ortak önek/sonek, karakter trigram örtüşmesi ve
+küçük düzenleme mesafesine göre her kelimenin en benzer komşuları bir kez
+hesaplanır. Soru başına iş, hazır komşu listesinden seçim yapmaktan ibarettir.
+"""
+from collections import Counter, defaultdict
+
+# Aday toplarken kelimenin en nadir RARE_GRAMS trigramı kullanılır; çok yaygın
+# trigramlar ("ing", "ion" gibi) ve kalabalık önek/sonek grupları atlanır.
+RARE_GRAMS = 4
+MAX_POSTING = 64
+NEIGHBOURS = 8
+AFFIX = 3
+
+
+def trigrams(text):
+    padded = f"  {text.lower()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, max_distance):
+    """max_distance'ı aşarsa max_distance + 1 döndüren Levenshtein mesafesi."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+class SimilarityIndex:
+    """word_id -> benzerliğe göre sıralı komşu word_id'leri"""
+
+    def __init__(self, words, neighbours=NEIGHBOURS):
+        # words: (id, turkish, english)
+        texts = {word_id: english.lower() for word_id, _, english in words}
+        grams = {word_id: trigrams(text) for word_id, text in texts.items()}
+
+        postings = defaultdict(list)
+        for word_id, word_grams in grams.items():
+            for gram in word_grams:
+                postings[gram].append(word_id)
+        prefixes = defaultdict(list)
+        suffixes = defaultdict(list)
+        for word_id, text in texts.items():
+            if len(text) >= AFFIX:
+                prefixes[text[:AFFIX]].append(word_id)
+                suffixes[text[-AFFIX:]].append(word_id)
+
+        self.neighbours = {}
+        for word_id, text in texts.items():
+            overlap = Counter()
+            rare = sorted((postings[gram] for gram in grams[word_id]), key=len)[:RARE_GRAMS]
+            for posting in rare:
+                if len(posting) <= MAX_POSTING:
+                    overlap.update(posting)
+            if len(text) >= AFFIX:
+                for bucket in (prefixes[text[:AFFIX]], suffixes[text[-AFFIX:]]):
+                    if len(bucket) <= MAX_POSTING:
+                        overlap.update(bucket)
+            overlap.pop(word_id, None)
+
+            # Kaba sıralamadan sonra yalnızca en iyi adaylar için mesafe hesapla
+            scored = []
+            own = grams[word_id]
+            for other_id, _ in overlap.most_common(neighbours * 2):
+                other = texts[other_id]
+                if other == text:
+                    continue
+                other_grams = grams[other_id]
+                shared = len(own & other_grams)
+                score = shared / (len(own) + len(other_grams) - shared)
+                if other[:AFFIX] == text[:AFFIX]:
+                    score += 0.5
+                if other[-AFFIX:] == text[-AFFIX:]:
+                    score += 0.3
+                # q-gram filtresi: mesafe <= 2 ise en az (uzunluk + 1 - 3 * 2) ortak trigram olmalı
+                if shared >= max(len(text), len(other)) - 5 and edit_distance(text, other, 2) <= 2:
+                    score += 1.0
+                scored.append((score, other_id))
+            scored.sort(reverse=True)
+            self.neighbours[word_id] = tuple(other_id for _, other_id in scored[:neighbours])
+
+    def similar(self, word_id):
+        return self.neighbours.get(word_id, ())
@@ -0,0 +1,135 @@
+"""Aralıklı tekrar (SM-2) zamanlayıcısı.
+
+Her kelimenin kolaylık katsayısı (ease), tekrar aralığı ve bir sonraki tekrar
+zamanı review_state tablosunda tutulur. Tekrar oturumu, due indeksi üzerinden
+yalnızca zamanı gelen kartları okuyarak kurulur; setin tamamı yüklenmez.
+"""
+import json
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Flashcard butonlarının SM-2 notları (0-5)
+GRADE_KNOWN = 4
+GRADE_UNKNOWN = 1
+
+MIN_EASE = 1.3
+# Bilinmeyen kart aynı gün içinde tekrar sorulur
+RELEARN_DELAY = timedelta(minutes=10)
+
+ReviewState = namedtuple("ReviewState", "ease interval repetitions lapses due")
+
+NEW_STATE = ReviewState(ease=2.5, interval=0.0, repetitions=0, lapses=0, due=None)
+
+
+def format_time(moment):
+    return moment.strftime(TIME_FORMAT)
+
+
+def schedule(state, grade, now):
+    """SM-2: eski durum + not -> yeni durum (saf fonksiyon)."""
+    ease = state.ease + (0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    ease = max(MIN_EASE, ease)
+
+    if grade < 3:
+        return ReviewState(ease, 0.0, 0, state.lapses + 1, format_time(now + RELEARN_DELAY))
+
+    repetitions = state.repetitions + 1
+    if repetitions == 1:
+        interval = 1.0
+    elif repetitions == 2:
+        interval = 6.0
+    else:
+        interval = round(state.interval * ease, 2)
+    return ReviewState(ease, interval, repetitions, state.lapses,
+                       format_time(now + timedelta(days=interval)))
+
+
+def load_state(cursor, word_id):
+    cursor.execute('''
+        SELECT ease, interval, repetitions, lapses, due
+        FROM review_state WHERE word_id = ?
+    ''', (word_id,))
+    row = cursor.fetchone()
+    return ReviewState(*row) if row else NEW_STATE
+
+
+def save_state(cursor, word_id, state, now):
+    cursor.execute('''
+        INSERT INTO review_state (word_id, ease, interval, repetitions, lapses, due, last_review)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (word_id) DO UPDATE SET
+            ease = excluded.ease,
+            interval = excluded.interval,
+            repetitions = excluded.repetitions,
+            lapses = excluded.lapses,
+            due = excluded.due,
+            last_review = excluded.last_review
+    ''', (word_id, state.ease, state.interval, state.repetitions, state.lapses,
+          state.due, format_time(now)))
+
+
+def apply_reviews(cursor, events):
+    """AnswerLog kancası: flashcard cevaplarını sırayla zamanlayıcıya işler."""
+    for event in events:
+        if event.mode != "flashcard":
+            continue
+        state = schedule(load_state(cursor, event.word_id),
+                         GRADE_KNOWN if event.correct else GRADE_UNKNOWN, event.answered_at)
+        save_state(cursor, event.word_id, state, event.answered_at)
+
+
+def due_words(conn, set_id, now=None, limit=100, new_limit=20):
+    """Zamanı gelen kartlar (en gecikmiş önce) + hiç çalışılmamış birkaç kart."""
+    now = now or datetime.now()
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT w.id, w.turkish, w.english
+        FROM review_state r JOIN words w ON w.id = r.word_id
+        WHERE r.due <= ? AND w.set_id = ?
+        ORDER BY r.due
+        LIMIT ?
+    ''', (format_time(now), set_id, limit))
+    words = cursor.fetchall()
+
+    if new_limit:
+        # LEFT JOIN: setin kelimeleri tek geçişte, review_state'e rowid ile bakılarak taranır
+        cursor.execute('''
+            SELECT w.id, w.turkish, w.english
+            FROM words w LEFT JOIN review_state r ON r.word_id = w.id
+            WHERE w.set_id = ? AND r.word_id IS NULL
+            LIMIT ?
+        ''', (set_id, new_limit))
+        words.extend(cursor.fetchall())
+    return words
+
+
+def due_words_for_sets(conn, set_ids, now=None, limit=100, new_limit=20):
+    """due_words'ün birden çok set için olanı; set_ids None ise tüm setler"""
+    if set_ids is not None and len(set_ids) == 1:
+        return due_words(conn, set_ids[0], now, limit, new_limit)
+    now = now or datetime.now()
+    if set_ids is None:
+        in_sets, params = "1", ()
+    else:
+        in_sets, params = "w.set_id IN (SELECT value FROM json_each(?))", (json.dumps(list(set_ids)),)
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT w.id, w.turkish, w.english
+        FROM review_state r JOIN words w ON w.id = r.word_id
+        WHERE r.due <= ? AND {in_sets}
+        ORDER BY r.due
+        LIMIT ?
+    ''', (format_time(now), *params, limit))
+    words = cursor.fetchall()
+
+    if new_limit:
+        cursor.execute(f'''
+            SELECT w.id, w.turkish, w.english
+            FROM words w LEFT JOIN review_state r ON r.word_id = w.id
+            WHERE {in_sets} AND r.word_id IS NULL
+            LIMIT ?
+        ''', (*params, new_limit))
+        words.extend(cursor.fetchall())
+    return words
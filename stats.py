@@ -0,0 +1,95 @@
+"""İstatistik ekranı için artımlı özetler.
+
+daily_stats (gün, mod) ve set_stats (set, mod) tabloları cevap sayısını,
+doğru sayısını ve toplam cevap süresini tutar; AnswerLog kancası
+(apply_answers) ile cevaplar yazılırken, aynı transaction içinde artırılır.
+Set başına görülen ve öğrenilen kelime sayıları (set_progress) word_stats
+tetikleyicileriyle güncel kalır (schema._v11_statistics).
+
+Ekran açılırken answer_events okunmaz; dashboard yalnızca bu özetleri
+okur: günlük tablo yılda en fazla 365 x mod satırıdır.
+"""
+from collections import defaultdict, namedtuple
+from datetime import date, timedelta
+
+from schema import MAX_RESPONSE_MS
+
+DAY_FORMAT = "%Y-%m-%d"
+
+ModeStats = namedtuple("ModeStats", "mode answers correct response_ms timed")
+DayStats = namedtuple("DayStats", "day answers correct")
+SetStats = namedtuple("SetStats", "set_id name word_count seen learned answers correct")
+Dashboard = namedtuple("Dashboard", "modes days sets streak best_streak")
+
+_ADD_COUNTS = '''
+    answers = answers + excluded.answers, correct = correct + excluded.correct,
+    response_ms = response_ms + excluded.response_ms, timed = timed + excluded.timed
+'''
+
+
+def _counts(events):
+    """events -> [cevap, doğru, toplam ms, süresi sayılan cevap]"""
+    answers = correct = response_ms = timed = 0
+    for event in events:
+        answers += 1
+        correct += event.correct
+        if event.response_ms is not None and event.response_ms <= MAX_RESPONSE_MS:
+            response_ms += event.response_ms
+            timed += 1
+    return answers, correct, response_ms, timed
+
+
+def apply_answers(cursor, events):
+    """AnswerLog kancası: cevapları gün/mod ve set/mod özetlerine ekler."""
+    by_day = defaultdict(list)
+    by_word = defaultdict(list)
+    for event in events:
+        by_day[event.answered_at.strftime(DAY_FORMAT), event.mode].append(event)
+        by_word[event.word_id, event.mode].append(event)
+    cursor.executemany(f'''
+        INSERT INTO daily_stats (day, mode, answers, correct, response_ms, timed)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (day, mode) DO UPDATE SET {_ADD_COUNTS}
+    ''', [(day, mode, *_counts(group)) for (day, mode), group in by_day.items()])
+    # Set, kelimenin şu anki setidir; silinmiş kelimeler atlanır
+    cursor.executemany(f'''
+        INSERT INTO set_stats (set_id, mode, answers, correct, response_ms, timed)
+        SELECT set_id, ?, ?, ?, ?, ? FROM words WHERE id = ?
+        ON CONFLICT (set_id, mode) DO UPDATE SET {_ADD_COUNTS}
+    ''', [(mode, *_counts(group), word_id) for (word_id, mode), group in by_word.items()])
+
+
+def streaks(days, today=None):
+    """Cevap verilen günler (artan sırada 'YYYY-MM-DD') -> (şu anki seri, en uzun seri).
+    Bugün henüz çalışılmadıysa dünkü seri sürüyor sayılır."""
+    today = today or date.today()
+    dates = [date.fromisoformat(day) for day in days]
+    best = run = 0
+    previous = None
+    for day in dates:
+        run = run + 1 if previous is not None and day - previous == timedelta(days=1) else 1
+        best = max(best, run)
+        previous = day
+    current = run if previous is not None and today - previous <= timedelta(days=1) else 0
+    return current, best
+
+
+def dashboard(conn, today=None):
+    modes = [ModeStats(*row) for row in conn.execute('''
+        SELECT mode, SUM(answers), SUM(correct), SUM(response_ms), SUM(timed)
+        FROM daily_stats GROUP BY mode ORDER BY SUM(answers) DESC
+    ''')]
+    days = [DayStats(*row) for row in conn.execute('''
+        SELECT day, SUM(answers), SUM(correct) FROM daily_stats GROUP BY day ORDER BY day
+    ''')]
+    sets = [SetStats(*row) for row in conn.execute('''
+        SELECT ws.id, ws.name, ws.word_count, COALESCE(p.seen, 0), COALESCE(p.learned, 0),
+               COALESCE(s.answers, 0), COALESCE(s.correct, 0)
+        FROM word_sets ws
+        LEFT JOIN set_progress p ON p.set_id = ws.id
+        LEFT JOIN (SELECT set_id, SUM(answers) AS answers, SUM(correct) AS correct
+                   FROM set_stats GROUP BY set_id) s ON s.set_id = ws.id
+        ORDER BY ws.created_date DESC
+    ''')]
+    streak, best_streak = streaks([day.day for day in days if day.answers], today)
+    return Dashboard(modes, days, sets, streak, best_streak)
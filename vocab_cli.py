@@ -0,0 +1,289 @@
+"""Terminalde pratik: flashcard, yazma ve çoktan seçmeli test.
+
+Tkinter hiç içe aktarılmaz; SSH üzerinden ya da terminalde, uygulamayla
+aynı dictionary.db ile çalışır. Cevaplar AnswerLog ile kaydedilir, tekrar
+durumu (srs) arayüzdekiyle aynı şekilde güncellenir.
+
+--batch ile sorular istem gösterilmeden sorulur ve cevaplar stdin'den satır
+satır okunur; her soru için stdout'a sekmeyle ayrılmış bir satır yazılır:
+
+    word_id  soru  verilen cevap  1/0  beklenen cevap
+
+Flashcard'da cevap e/h (biliyorum/bilmiyorum), çoktan seçmelide seçenek
+numarası ya da metnidir. stdin biterse oturum orada sona erer.
+
+Birden çok set adı verilebilir; --all ile tüm setlerden çalışılır. Kelimeler
+setlerden, kelime sayılarıyla orantılı rastgele seçilir.
+
+Kullanım:
+    python vocab_cli.py sets
+    python vocab_cli.py stats
+    python vocab_cli.py flashcard "Set adı" [--direction tr_to_en|en_to_tr|mixed]
+    python vocab_cli.py review "Set adı"
+    python vocab_cli.py write "Set adı" ["Set 2" ...] [--answer en|tr]
+    python vocab_cli.py choice --all --limit 200
+    python vocab_cli.py missed [--limit 30] [--answer en|tr]   (en çok yanlış yapılanlar)
+    ortak seçenekler: [--db dictionary.db] [--limit 20] [--seed 1] [--batch]
+"""
+import argparse
+import sys
+
+import deck
+import mistakes
+import queries
+import schema
+import srs
+import stats
+from answer_log import AnswerLog
+from quiz_engine import FlashcardSession, WritingSession, MultipleChoiceSession
+
+YES = {"e", "evet", "y", "yes", "1", "+"}
+SKIP = {"a", "atla", "s", "skip"}
+
+
+class Terminal:
+    """Etkileşimli modda input()/print(), batch modda stdin satırları ve TSV çıktı"""
+
+    def __init__(self, batch, stdin=sys.stdin, stdout=sys.stdout):
+        self.batch = batch
+        self.stdin = stdin
+        self.stdout = stdout
+
+    def show(self, text=""):
+        if not self.batch:
+            print(text, file=self.stdout)
+
+    def ask(self, prompt):
+        """Cevap satırı; girdi bittiyse None"""
+        if self.batch:
+            line = self.stdin.readline()
+            return line.rstrip("\r\n") if line else None
+        try:
+            return input(prompt)
+        except EOFError:
+            return None
+
+    def report(self, word_id, question, answer, correct, expected):
+        if self.batch:
+            fields = (str(word_id), question, answer, "1" if correct else "0", expected)
+            print("\t".join(field.replace("\t", " ") for field in fields), file=self.stdout)
+
+
+def find_set(conn, name_or_id):
+    """Set adı ya da id'si -> (set_id, ad); bulunamazsa None"""
+    row = conn.execute('SELECT id, name FROM word_sets WHERE name = ?', (name_or_id,)).fetchone()
+    if row is None and name_or_id.isdigit():
+        row = conn.execute('SELECT id, name FROM word_sets WHERE id = ?', (int(name_or_id),)).fetchone()
+    return row
+
+
+def run_flashcard(session, terminal):
+    while (card := session.next_item()) is not None:
+        terminal.show(f"\n[{session.position}/{len(session)}] {card.front_text}")
+        if not terminal.batch:
+            if terminal.ask("  (çevirmek için Enter) ") is None:
+                return
+            terminal.show(f"  → {card.back_text}")
+        answer = terminal.ask("  Biliyor musun? [e]vet / [h]ayır / [a]tla: ")
+        if answer is None:
+            return
+        if answer.strip().lower() in SKIP:
+            continue
+        result = session.submit(answer.strip().lower() in YES)
+        terminal.report(card.word_id, card.front_text, answer, result.correct, result.expected)
+
+
+def run_writing(session, terminal):
+    while (question := session.next_item()) is not None:
+        terminal.show(f"\n[{session.position}/{len(session)}] {question.question}")
+        answer = terminal.ask("  Cevap: ")
+        if answer is None:
+            return
+        result = session.submit(answer)
+        if result.typo:
+            terminal.show(f"  ✅ Doğru! (küçük yazım hatası: {result.expected})")
+        elif result.correct:
+            terminal.show("  ✅ Doğru!")
+        else:
+            terminal.show(f"  ❌ Yanlış! Doğru cevap: {result.expected}")
+        terminal.report(question.word_id, question.question, answer, result.correct, result.expected)
+
+
+def run_multiple_choice(session, terminal):
+    while (choice := session.next_item()) is not None:
+        terminal.show(f"\n[{session.position}/{len(session)}] {choice.question}")
+        for number, text in enumerate(choice.choices, 1):
+            terminal.show(f"  {number}) {text}")
+        answer = terminal.ask("  Seçim: ")
+        if answer is None:
+            return
+        picked = answer.strip()
+        if picked.isdigit() and 1 <= int(picked) <= len(choice.choices):
+            picked = choice.choices[int(picked) - 1]
+        result = session.submit(picked)
+        terminal.show("  ✅ Doğru!" if result.correct else f"  ❌ Yanlış! Doğru cevap: {result.expected}")
+        terminal.report(choice.word_id, choice.question, answer, result.correct, result.expected)
+
+
+def list_sets(conn):
+    for set_id, name, date, word_count, last_practiced in queries.set_summaries(conn):
+        line = f"{set_id:>5}  {name} ({word_count} kelime)"
+        if last_practiced:
+            line += f" • son pratik: {last_practiced}"
+        print(line)
+
+
+def show_stats(conn):
+    dashboard = stats.dashboard(conn)
+    answers = sum(mode.answers for mode in dashboard.modes)
+    if not answers:
+        print("Henüz cevap yok.")
+        return
+    correct = sum(mode.correct for mode in dashboard.modes)
+    timed = sum(mode.timed for mode in dashboard.modes)
+    print(f"{answers} cevap • %{correct / answers * 100:.1f} doğru"
+          + (f" • ort. {sum(mode.response_ms for mode in dashboard.modes) / timed / 1000:.1f} sn" if timed else ""))
+    print(f"Seri: {dashboard.streak} gün (en uzun {dashboard.best_streak})")
+    for mode in dashboard.modes:
+        print(f"  {mode.mode:<16}{mode.answers:>8} cevap  %{mode.correct / mode.answers * 100:.0f}")
+    for row in dashboard.sets:
+        accuracy = f"%{row.correct / row.answers * 100:.0f}" if row.answers else "-"
+        print(f"{row.set_id:>5}  {row.name}: {accuracy} • {row.learned}/{row.word_count} öğrenildi"
+              f" • {row.word_count - row.seen} yeni")
+
+
+def find_sets(conn, args):
+    """args.set'teki adlar/id'ler (ya da --all) -> {set_id: kelime sayısı} ve başlık;
+    bulunamayan set varsa None"""
+    if args.all:
+        rows = conn.execute('SELECT id, name, word_count FROM word_sets').fetchall()
+        return {set_id: word_count for set_id, _, word_count in rows}, "Tüm setler"
+    counts, names = {}, []
+    for name_or_id in args.set:
+        found = find_set(conn, name_or_id)
+        if found is None:
+            print(f"'{name_or_id}' adında bir set yok (set listesi için: vocab_cli.py sets)", file=sys.stderr)
+            return None
+        set_id, name = found
+        counts[set_id] = queries.set_word_count(conn, set_id)
+        names.append(name)
+    return counts, ", ".join(names)
+
+
+def practice(conn, args, terminal):
+    if args.command == "missed":
+        counts, title = {}, "En çok yanlış yapılanlar"
+    elif args.all == bool(args.set):
+        print("Bir ya da daha fazla set adı ya da --all verin", file=sys.stderr)
+        return 2
+    else:
+        found = find_sets(conn, args)
+        if found is None:
+            return 2
+        counts, title = found
+    set_ids = list(counts)
+    keys = args.command in ("write", "missed")
+
+    log = AnswerLog(conn, hooks=[srs.apply_reviews, mistakes.apply_answers, stats.apply_answers])
+    if args.command == "missed":
+        words = mistakes.most_missed(conn, args.limit or mistakes.MOST_MISSED, keys=True)
+    elif args.command == "review":
+        # Tekrarda en gecikmiş kartlar kalır
+        words = srs.due_words_for_sets(conn, None if args.all else set_ids)
+        if args.limit:
+            words = words[:args.limit]
+    elif len(set_ids) > 1:
+        # Setler okunmadan, setlerden orantılı örneklenir
+        words = deck.sample_sets(conn, counts, args.limit or sum(counts.values()), keys, args.seed)
+    elif args.limit:
+        # Set okunmadan yalnızca seçilen kelimeler çekilir
+        words = deck.sample_words(conn, set_ids[0], args.limit, keys, args.seed)
+    elif keys:
+        words = queries.writing_words(conn, set_ids[0])
+    else:
+        words = queries.set_words(conn, set_ids[0])
+    if not words:
+        terminal.show("Seçilen setlerde çalışılacak kelime yok.")
+        return 0
+
+    try:
+        if args.command in ("flashcard", "review"):
+            direction = "mixed" if args.command == "review" else args.direction
+            session = FlashcardSession(words, direction, seed=args.seed, listener=log.record)
+            runner = run_flashcard
+        elif keys:
+            session = WritingSession(words, args.answer, seed=args.seed, listener=log.record)
+            runner = run_writing
+        else:
+            session = MultipleChoiceSession(words, seed=args.seed, listener=log.record)
+            runner = run_multiple_choice
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    terminal.show(f"📚 {title} • {len(session)} kelime (çıkmak için Ctrl+D)")
+    try:
+        runner(session, terminal)
+    except KeyboardInterrupt:
+        terminal.show()
+    finally:
+        # Yarıda bırakılan oturumun cevapları da kaydedilir
+        log.flush()
+        if session.results and set_ids:
+            queries.mark_practiced(conn, *set_ids)
+
+    summary = session.summary()
+    message = f"{summary.correct}/{summary.answered} doğru ({summary.total} kelimeden)"
+    if terminal.batch:
+        print(f"# {message}", file=terminal.stdout)
+    else:
+        terminal.show(f"\n🏁 {message}")
+        for _, turkish, english, *_ in summary.mistakes:
+            terminal.show(f"  ❌ {turkish} — {english}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vocabulary APP terminal modu")
+    parser.add_argument('--db', default='dictionary.db')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('sets', help="Setleri listele")
+    commands.add_parser('stats', help="İstatistikler")
+
+    def practice_parser(name, help_text):
+        sub = commands.add_parser(name, help=help_text)
+        sub.add_argument('set', nargs='*', help="Set adları ya da id'leri")
+        sub.add_argument('--all', action='store_true', help="Tüm setlerden çalış")
+        sub.add_argument('--limit', type=int, help="En fazla bu kadar (rastgele) kelime")
+        sub.add_argument('--seed', type=int, help="Tekrarlanabilir sıra için")
+        sub.add_argument('--batch', action='store_true', help="Cevapları stdin'den oku, TSV yaz")
+        return sub
+
+    practice_parser('flashcard', "Flashcard").add_argument(
+        '--direction', default='tr_to_en', choices=['tr_to_en', 'en_to_tr', 'mixed'])
+    practice_parser('review', "Zamanı gelen kartlarla aralıklı tekrar")
+    practice_parser('write', "Yazarak pratik").add_argument(
+        '--answer', default='en', choices=['en', 'tr'], help="Cevabın yazılacağı dil")
+    practice_parser('choice', "Çoktan seçmeli test")
+    missed = commands.add_parser('missed', help="Tüm setlerde en çok yanlış yapılanlarla yazma pratiği")
+    missed.add_argument('--limit', type=int, help=f"Kelime sayısı (varsayılan {mistakes.MOST_MISSED})")
+    missed.add_argument('--seed', type=int, help="Tekrarlanabilir sıra için")
+    missed.add_argument('--batch', action='store_true', help="Cevapları stdin'den oku, TSV yaz")
+    missed.add_argument('--answer', default='en', choices=['en', 'tr'], help="Cevabın yazılacağı dil")
+    args = parser.parse_args(argv)
+
+    conn = schema.connect(args.db)
+    try:
+        if args.command == 'sets':
+            list_sets(conn)
+            return 0
+        if args.command == 'stats':
+            show_stats(conn)
+            return 0
+        return practice(conn, args, Terminal(args.batch))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
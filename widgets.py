@@ -0,0 +1,154 @@
+"""Ekranlar arasında paylaşılan Tk widget'ları."""
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualList(tk.Frame):
+    """Yalnızca görünen satırlar için widget oluşturan kaydırılabilir liste.
+
+    Satır verileri ``model`` adlı düz bir Python listesinde durur. Ekranda
+    görünen satır sayısı (artı ``overscan``) kadar satır widget'ı oluşturulur
+    ve kaydırıldıkça bu widget'lar başka satırlar için yeniden kullanılır.
+
+    create_row(parent) -> satır widget'ı (bir kez, her yuva için çağrılır)
+    bind_row(row, index, item) -> satırı model[index] ile doldurur
+    unbind_row(row, index, item) -> satır başka veriye geçmeden önce çağrılır
+        (Entry içindeki değişiklikleri modele geri yazmak için)
+    """
+
+    def __init__(self, parent, model, create_row, bind_row, unbind_row=None,
+                 row_height=36, overscan=3, bg="white", **kwargs):
+        super().__init__(parent, bg=bg, **kwargs)
+        self.model = model
+        self.row_height = row_height
+        self.overscan = overscan
+        self._create_row = create_row
+        self._bind_row = bind_row
+        self._unbind_row = unbind_row
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Her yuva: [satır widget'ı, canvas öğesi, bağlı olduğu model indeksi]
+        self._slots = []
+        self._width = 1
+
+        self.canvas.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.canvas)
+
+    # --- Dışarıya açık işlemler -------------------------------------------
+
+    def refresh(self):
+        """Model dışarıdan değiştirildiğinde görünen satırları yeniden bağlar.
+
+        Modeli değiştirmeden önce sync() çağrılmalıdır; aksi halde ekrandaki
+        düzenlemeler kaybolur.
+        """
+        for slot in self._slots:
+            slot[2] = None
+        self._update_scrollregion()
+        self._layout()
+
+    def append(self, item):
+        self.sync()
+        self.model.append(item)
+        self.refresh()
+
+    def delete(self, index):
+        self.sync()
+        del self.model[index]
+        self.refresh()
+
+    def sync(self):
+        """Görünen satırlardaki düzenlemeleri modele yazar."""
+        if not self._unbind_row:
+            return
+        for row, _, index in self._slots:
+            if index is not None and index < len(self.model):
+                self._unbind_row(row, index, self.model[index])
+
+    def scroll_to(self, index):
+        total = max(len(self.model) * self.row_height, 1)
+        self.canvas.yview_moveto(index * self.row_height / total)
+        self._layout()
+
+    def row_for(self, index):
+        """model[index] şu anda ekrandaysa satır widget'ını döndürür."""
+        for row, _, bound in self._slots:
+            if bound == index:
+                return row
+        return None
+
+    # --- İç işleyiş ---------------------------------------------------------
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        widget.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _on_wheel(self, event):
+        self.canvas.yview_scroll(int(-event.delta / 120) or (-1 if event.delta > 0 else 1), "units")
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._layout()
+
+    def _on_resize(self, event):
+        self._width = event.width
+        for _, item, _ in self._slots:
+            self.canvas.itemconfigure(item, width=event.width)
+        self._update_scrollregion()
+        self._layout()
+
+    def _update_scrollregion(self):
+        height = len(self.model) * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, self._width, height),
+                              yscrollincrement=self.row_height)
+
+    def _layout(self):
+        count = len(self.model)
+        top = self.canvas.canvasy(0)
+        view_height = max(self.canvas.winfo_height(), self.row_height)
+
+        first = max(0, int(top // self.row_height) - self.overscan)
+        last = min(count, int((top + view_height) // self.row_height) + 1 + self.overscan)
+        wanted = range(first, last)
+
+        # Hâlâ görünen satırlar yerinde kalır, diğer yuvalar boşa çıkar
+        free = []
+        placed = set()
+        for slot in self._slots:
+            index = slot[2]
+            if index is not None and first <= index < last and index not in placed:
+                placed.add(index)
+            else:
+                if index is not None and self._unbind_row and index < count:
+                    self._unbind_row(slot[0], index, self.model[index])
+                slot[2] = None
+                free.append(slot)
+
+        while len(free) < len(wanted) - len(placed):
+            row = self._create_row(self.canvas)
+            self._bind_wheel(row)
+            item = self.canvas.create_window(0, 0, window=row, anchor="nw",
+                                             width=self._width, height=self.row_height)
+            slot = [row, item, None]
+            self._slots.append(slot)
+            free.append(slot)
+
+        for index in wanted:
+            if index in placed:
+                continue
+            slot = free.pop()
+            slot[2] = index
+            self.canvas.coords(slot[1], 0, index * self.row_height)
+            self.canvas.itemconfigure(slot[1], state="normal")
+            self._bind_row(slot[0], index, self.model[index])
+
+        for slot in free:
+            self.canvas.itemconfigure(slot[1], state="hidden")
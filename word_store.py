@@ -0,0 +1,189 @@
+"""Oturumlar ve set önbelleği için sütunlu kelime deposu.
+
+fetchall() her kelime için bir demet, bir int ve iki str nesnesi üretir;
+str nesnesinin kendi yükü (50-75 bayt) çoğu kelimenin metninden büyüktür.
+WordStore aynı satırları sütunlar halinde tutar: id'ler array('q') içinde,
+her metin sütunu ise TextColumn'dur: sütundaki farklı metinler bir kez,
+art arda tek bir UTF-8 blokta durur (aynı metin ikinci kez eklenmez) ve
+satırlar yalnızca metnin numarasını (array('i')) tutar. Satır demeti ve
+metinler yalnızca store[i] okunduğunda kurulur.
+
+Oturumlar kelimeleri kopyalayıp karıştırmak yerine WordView kullanır:
+depoya bakan, karışık sıradaki satır numaralarından (array('i')) oluşan
+bir görünüm. Rastgele örnekler de görünümdür; depo kopyalanmaz.
+
+Her ikisi de salt okunur bir Sequence'tir; satırlar (id, turkish, english)
+ya da yazma pratiği için (id, turkish, english, turkish_key, english_key).
+"""
+from array import array
+from collections.abc import Sequence
+
+# İmleçten bir seferde okunan satır (fetchall'ın tüm demetleri aynı anda bellekte kalmaz)
+CHUNK_ROWS = 5000
+
+
+class TextColumn:
+    """Bir metin sütunu: satır -> metin numarası, metinler tek UTF-8 blokta"""
+
+    def __init__(self):
+        self.codes = array('i')
+        self.blob = bytearray()
+        self.offsets = array('I', [0])
+        # Yükleme sırasında metin -> numara; finish ile bırakılır
+        self.lookup = {}
+
+    def extend(self, values):
+        if self.lookup is None:
+            # finish'ten sonra yeniden ekleme (nadir): sözlük bloktan kurulur
+            self.lookup = {self[index]: code for index, code in enumerate(self.codes) if code >= 0}
+            self.blob = bytearray(self.blob)
+        lookup = self.lookup
+        codes = self.codes
+        for value in values:
+            code = lookup.get(value)
+            if code is None:
+                if value is None:
+                    # Anahtar sütunları NULL olabilir
+                    code = -1
+                else:
+                    code = lookup[value] = len(self.offsets) - 1
+                    self.blob += value.encode()
+                    self.offsets.append(len(self.blob))
+            codes.append(code)
+
+    def finish(self):
+        self.lookup = None
+        self.blob = bytes(self.blob)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        code = self.codes[index]
+        if code < 0:
+            return None
+        return self.blob[self.offsets[code]:self.offsets[code + 1]].decode()
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self.codes)))
+
+
+class WordStore(Sequence):
+    def __init__(self, width=3):
+        self.ids = array('q')
+        # turkish, english[, turkish_key, english_key]
+        self.columns = tuple(TextColumn() for _ in range(width - 1))
+        self.positions = None
+
+    @classmethod
+    def from_cursor(cls, cursor, chunk_rows=CHUNK_ROWS):
+        """Çalıştırılmış bir sorgunun satırlarını parça parça okur"""
+        store = cls(len(cursor.description))
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                store.finish()
+                return store
+            store.extend(rows)
+
+    @classmethod
+    def from_rows(cls, rows):
+        rows = list(rows)
+        store = cls(len(rows[0]) if rows else 3)
+        if rows:
+            store.extend(rows)
+        store.finish()
+        return store
+
+    def extend(self, rows):
+        ids, *texts = zip(*rows)
+        self.ids.extend(ids)
+        for column, values in zip(self.columns, texts):
+            column.extend(values)
+        self.positions = None
+
+    def finish(self):
+        """Yükleme bitti: metin sözlükleri bırakılır"""
+        for column in self.columns:
+            column.finish()
+
+    @property
+    def turkish(self):
+        return self.columns[0]
+
+    @property
+    def english(self):
+        return self.columns[1]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return WordView(self, range(len(self.ids))[index])
+        return (self.ids[index], *[column[index] for column in self.columns])
+
+    def __iter__(self):
+        return zip(self.ids, *self.columns)
+
+    def english_at(self, index):
+        """Yalnızca index'inci satırın İngilizcesi (demet kurulmaz)"""
+        return self.columns[1][index]
+
+    def find(self, word_id):
+        """word_id'nin satırı; yoksa None. id -> satır numarası tablosu ilk çağrıda kurulur."""
+        if self.positions is None:
+            self.positions = dict(zip(self.ids, range(len(self.ids))))
+        index = self.positions.get(word_id)
+        return None if index is None else self[index]
+
+    def view(self, indices):
+        return WordView(self, indices)
+
+
+class WordView(Sequence):
+    """store'un indices sırasındaki satırları (kopya yok)"""
+
+    def __init__(self, store, indices):
+        self.store = store
+        self.indices = indices if isinstance(indices, array) else array('i', indices)
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return WordView(self.store, self.indices[index])
+        return self.store[self.indices[index]]
+
+    def __iter__(self):
+        return map(self.store.__getitem__, self.indices)
+
+    def english_at(self, index):
+        return self.store.columns[1][self.indices[index]]
+
+    def find(self, word_id):
+        return self.store.find(word_id)
+
+
+def base(words):
+    """words'ün deposu ve satır numaraları; liste ise önce depoya çevrilir"""
+    if isinstance(words, WordView):
+        return words.store, words.indices
+    if not isinstance(words, WordStore):
+        words = WordStore.from_rows(words)
+    return words, range(len(words))
+
+
+def shuffled(words, rng):
+    """Oturum sırası: words'ün rng ile karıştırılmış görünümü"""
+    store, indices = base(words)
+    order = array('i', indices)
+    rng.shuffle(order)
+    return WordView(store, order)
+
+
+def sample(words, count, rng):
+    """words'ten tekrarsız count satırlık rastgele görünüm (random.sample ile aynı seçim)"""
+    store, indices = base(words)
+    return WordView(store, [indices[i] for i in rng.sample(range(len(indices)), count)])